@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -11,6 +13,7 @@ class Settings(BaseSettings):
     app_env: str = Field(default="development", alias="APP_ENV")
     app_host: str = Field(default="0.0.0.0", alias="APP_HOST")
     app_port: int = Field(default=8002, alias="APP_PORT")
+    startup_skip_create_all: bool = Field(default=True, alias="STARTUP_SKIP_CREATE_ALL")
 
     database_url: str = Field(alias="DATABASE_URL")
 
@@ -22,6 +25,8 @@ class Settings(BaseSettings):
     jwt_refresh_secret_key: str = Field(alias="JWT_REFRESH_SECRET_KEY")
     access_token_expire_minutes: int = Field(default=30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(default=7, alias="REFRESH_TOKEN_EXPIRE_DAYS")
+    bcrypt_rounds: int = Field(default=12, alias="BCRYPT_ROUNDS")
+    auth_cache_ttl_seconds: int = Field(default=30, alias="AUTH_CACHE_TTL_SECONDS")
 
     s3_endpoint_url: str = Field(alias="S3_ENDPOINT_URL")
     s3_public_endpoint_url: str | None = Field(default=None, alias="S3_PUBLIC_ENDPOINT_URL")
@@ -63,7 +68,19 @@ class Settings(BaseSettings):
     cloud_cap_percent: float = Field(default=20.0, alias="CLOUD_CAP_PERCENT")
     min_valid_pixel_ratio: float = Field(default=0.60, alias="MIN_VALID_PIXEL_RATIO")
     min_scene_coverage_ratio: float = Field(default=0.98, alias="MIN_SCENE_COVERAGE_RATIO")
+    # "deflate" restores the previous layer encoding, e.g. for readers built without ZSTD.
+    geotiff_compression: Literal["zstd", "deflate"] = Field(default="zstd", alias="GEOTIFF_COMPRESSION")
+    # Filter for enlarging small PNG export previews; "bicubic" is sharper but slower.
+    export_preview_resample: Literal["nearest", "bilinear", "bicubic"] = Field(
+        default="bilinear", alias="EXPORT_PREVIEW_RESAMPLE"
+    )
     cors_allowed_origins: str = Field(default="http://localhost:3000,http://127.0.0.1:3000", alias="CORS_ALLOWED_ORIGINS")
+    cors_allowed_methods: str = Field(default="GET,POST,PUT,PATCH,DELETE,OPTIONS", alias="CORS_ALLOWED_METHODS")
+    cors_allowed_headers: str = Field(
+        default="Authorization,Content-Type,X-Requested-With",
+        alias="CORS_ALLOWED_HEADERS",
+    )
+    cors_max_age_seconds: int = Field(default=600, alias="CORS_MAX_AGE_SECONDS")
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,32 @@
+from typing import Any
+
+import orjson
+import pydantic_core
+from fastapi.responses import ORJSONResponse, Response
+
+
+class ModelJSONResponse(Response):
+    """JSON response for pydantic models (or lists of them) built by the server.
+
+    Handlers return it directly so FastAPI skips jsonable_encoder; the body is
+    written by pydantic-core's Rust encoder in one pass, no intermediate dicts.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+
+class APIJSONResponse(ORJSONResponse):
+    """Default response class: orjson, writing UTC datetimes as ``Z`` like pydantic.
+
+    Handlers returning plain dicts then emit the same timestamps as the
+    response_model and ModelJSONResponse endpoints.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        )
@@ -1,57 +1,212 @@
+import base64
+import hashlib
+import hmac
+import os
+import re
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
-from jose import jwt, JWTError
+
+import bcrypt
+import jwt
+from cachetools import TLRUCache
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
 
 # Use bcrypt_sha256 to avoid bcrypt's 72-byte input limit while remaining
-# compatible with legacy bcrypt hashes.
-pwd_context = CryptContext(schemes=["bcrypt_sha256", "bcrypt"], deprecated="auto")
+# compatible with legacy bcrypt hashes. Both contexts are built in
+# _reload_settings(): pwd_context carries no deprecation policy for the verify
+# fallback, pwd_context_with_rehash decides which hashes login upgrades.
+PASSWORD_SCHEMES = ["bcrypt_sha256", "bcrypt"]
 ALGORITHM = "HS256"
+_DECODE_OPTIONS = {"require": ["exp", "type", "sub"], "verify_aud": False}
+
+# passlib's bcrypt_sha256 v2 format; hashed and verified directly through the
+# bcrypt binding. Any other format is routed through pwd_context.
+_BCRYPT_SHA256_V2_RE = re.compile(r"^\$bcrypt-sha256\$v=2,t=2b,r=(\d{1,2})\$([^$]{22})\$([^$]{31})$")
+
+# Decoded token payloads are cached so repeated requests with the same bearer
+# token skip signature verification. Entries never outlive the token's own exp.
+TOKEN_CACHE_MAX_TTL_SECONDS = 60
+TOKEN_CACHE_MAXSIZE = 10_000
+
+
+def _token_ttu(_key: bytes, payload: dict[str, Any], now: float) -> float:
+    return min(float(payload.get("exp", now)), now + TOKEN_CACHE_MAX_TTL_SECONDS)
+
+
+# Hot settings bound once at import by _reload_settings().
+_ACCESS_KEY: str
+_REFRESH_KEY: str
+_ACCESS_TTL: timedelta
+_REFRESH_TTL: timedelta
+_BCRYPT_ROUNDS: int
+pwd_context: CryptContext
+pwd_context_with_rehash: CryptContext
+
+
+def _reload_settings() -> None:
+    global _ACCESS_KEY, _REFRESH_KEY, _ACCESS_TTL, _REFRESH_TTL, _BCRYPT_ROUNDS
+    global pwd_context, pwd_context_with_rehash
+    settings = get_settings()
+    _ACCESS_KEY = settings.jwt_secret_key
+    _REFRESH_KEY = settings.jwt_refresh_secret_key
+    _ACCESS_TTL = timedelta(minutes=settings.access_token_expire_minutes)
+    _REFRESH_TTL = timedelta(days=settings.refresh_token_expire_days)
+    _BCRYPT_ROUNDS = settings.bcrypt_rounds
+    # No "deprecated" option: passlib then marks no scheme as stale.
+    pwd_context = CryptContext(schemes=PASSWORD_SCHEMES, bcrypt_sha256__rounds=_BCRYPT_ROUNDS)
+    pwd_context_with_rehash = CryptContext(
+        schemes=PASSWORD_SCHEMES,
+        deprecated="auto",
+        bcrypt_sha256__rounds=_BCRYPT_ROUNDS,
+    )
+
+
+_reload_settings()
+
+_access_token_cache: TLRUCache = TLRUCache(maxsize=TOKEN_CACHE_MAXSIZE, ttu=_token_ttu, timer=time.time)
+_refresh_token_cache: TLRUCache = TLRUCache(maxsize=TOKEN_CACHE_MAXSIZE, ttu=_token_ttu, timer=time.time)
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    # Key on a digest so raw bearer secrets are not retained in memory.
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _decode_cached(
+    token: str,
+    cache: TLRUCache,
+    secret_key: str,
+    token_type: str,
+    error_message: str,
+) -> dict[str, Any]:
+    cache_key = _token_cache_key(token)
+    with _token_cache_lock:
+        payload = cache.get(cache_key)
+    if payload is not None:
+        return payload
+
+    try:
+        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM], options=_DECODE_OPTIONS)
+    except jwt.PyJWTError as exc:
+        raise ValueError(error_message) from exc
+    if payload.get("type") != token_type:
+        raise ValueError("Unexpected token type")
+
+    with _token_cache_lock:
+        cache[cache_key] = payload
+    return payload
+
+
+class _TokenPool:
+    """URL-safe random tokens cut from one ``os.urandom`` draw per ``batch`` tokens.
+
+    Unused bytes are discarded after a fork, so worker processes never share tokens.
+    """
+
+    def __init__(self, nbytes: int = 32, batch: int = 1024) -> None:
+        self._nbytes = nbytes
+        self._batch = batch
+        self._buffer = b""
+        self._offset = 0
+        self._pid = 0
+        self._lock = threading.Lock()
+
+    def next_token(self) -> str:
+        with self._lock:
+            if self._offset >= len(self._buffer) or self._pid != os.getpid():
+                self._buffer = os.urandom(self._nbytes * self._batch)
+                self._offset = 0
+                self._pid = os.getpid()
+            chunk = self._buffer[self._offset : self._offset + self._nbytes]
+            self._offset += self._nbytes
+        return base64.urlsafe_b64encode(chunk).rstrip(b"=").decode("ascii")
+
+
+_url_token_pool = _TokenPool()
+
+
+def generate_url_token() -> str:
+    """Same shape as ``secrets.token_urlsafe(32)``, e.g. for invite links."""
+    return _url_token_pool.next_token()
+
+
+def clear_token_caches() -> None:
+    with _token_cache_lock:
+        _access_token_cache.clear()
+        _refresh_token_cache.clear()
+
+
+def _bcrypt_sha256_key(password: str, salt: str) -> bytes:
+    # Same pre-hash as passlib: HMAC-SHA256 keyed by the bcrypt64 salt, base64 encoded.
+    digest = hmac.new(salt.encode("ascii"), password.encode("utf-8"), hashlib.sha256).digest()
+    return base64.b64encode(digest)
+
+
+def _bcrypt_sha256_hash(password: str, rounds: int) -> str:
+    config = bcrypt.gensalt(rounds=rounds, prefix=b"2b")
+    salt = config[-22:].decode("ascii")
+    checksum = bcrypt.hashpw(_bcrypt_sha256_key(password, salt), config)[-31:].decode("ascii")
+    return f"$bcrypt-sha256$v=2,t=2b,r={rounds}${salt}${checksum}"
+
+
+def _bcrypt_sha256_verify(plain_password: str, hashed_password: str) -> bool | None:
+    match = _BCRYPT_SHA256_V2_RE.match(hashed_password)
+    if match is None:
+        return None
+    rounds, salt, checksum = match.groups()
+    bcrypt_hash = f"$2b${int(rounds):02d}${salt}{checksum}".encode("ascii")
+    return bcrypt.checkpw(_bcrypt_sha256_key(plain_password, salt), bcrypt_hash)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    verified = _bcrypt_sha256_verify(plain_password, hashed_password)
+    if verified is not None:
+        return verified
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return _bcrypt_sha256_hash(password, rounds=_BCRYPT_ROUNDS)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return pwd_context_with_rehash.needs_update(hashed_password)
 
 
 def create_access_token(subject: str, extra: dict[str, Any] | None = None) -> str:
-    settings = get_settings()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
+    expire = datetime.now(timezone.utc) + _ACCESS_TTL
     payload: dict[str, Any] = {"sub": subject, "type": "access", "exp": expire}
     if extra:
         payload.update(extra)
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=ALGORITHM)
+    return jwt.encode(payload, _ACCESS_KEY, algorithm=ALGORITHM)
 
 
 def create_refresh_token(subject: str) -> str:
-    settings = get_settings()
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
+    expire = datetime.now(timezone.utc) + _REFRESH_TTL
     payload = {"sub": subject, "type": "refresh", "exp": expire}
-    return jwt.encode(payload, settings.jwt_refresh_secret_key, algorithm=ALGORITHM)
+    return jwt.encode(payload, _REFRESH_KEY, algorithm=ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict[str, Any]:
-    settings = get_settings()
-    try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[ALGORITHM])
-    except JWTError as exc:
-        raise ValueError("Invalid access token") from exc
-    if payload.get("type") != "access":
-        raise ValueError("Unexpected token type")
-    return payload
+    return _decode_cached(
+        token,
+        cache=_access_token_cache,
+        secret_key=_ACCESS_KEY,
+        token_type="access",
+        error_message="Invalid access token",
+    )
 
 
 def decode_refresh_token(token: str) -> dict[str, Any]:
-    settings = get_settings()
-    try:
-        payload = jwt.decode(token, settings.jwt_refresh_secret_key, algorithms=[ALGORITHM])
-    except JWTError as exc:
-        raise ValueError("Invalid refresh token") from exc
-    if payload.get("type") != "refresh":
-        raise ValueError("Unexpected token type")
-    return payload
+    return _decode_cached(
+        token,
+        cache=_refresh_token_cache,
+        secret_key=_REFRESH_KEY,
+        token_type="refresh",
+        error_message="Invalid refresh token",
+    )
@@ -1,26 +1,144 @@
+import threading
 import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from itertools import chain
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer, raiseload
 
+from app.core.config import get_settings
 from app.core.security import decode_access_token
-from app.db.session import get_db
-from app.models import Membership, RoleEnum, User
+from app.db.session import get_async_db
+from app.models import Farm, Field, Membership, RoleEnum, User
 from app.services.rbac import has_minimum_role
+from app.services.role_cache import cache_role, get_cached_role
 
 bearer_scheme = HTTPBearer(auto_error=True)
 
+# Hot-path statements built once at import so each call only binds parameters
+# and hits SQLAlchemy's compiled cache.
+_CURRENT_USER_ROWS = (
+    select(User.is_active, Membership.organization_id, Membership.role)
+    .outerjoin(Membership, Membership.user_id == User.id)
+    .where(User.id == bindparam("user_id"))
+)
+_ROLE_BY_ORG_USER = select(Membership.role).where(
+    Membership.organization_id == bindparam("org_id"),
+    Membership.user_id == bindparam("user_id"),
+)
+# Outer join target for single-statement authorization: yields the caller's
+# role in the farm's organization, or NULL when they are not a member.
+CALLER_MEMBERSHIP_JOIN = and_(
+    Membership.organization_id == Farm.organization_id,
+    Membership.user_id == bindparam("user_id"),
+)
+# Organizations the caller belongs to right now, for scoping statements by
+# membership instead of by the possibly stale cached user snapshot.
+CALLER_ORG_IDS = select(Membership.organization_id).where(Membership.user_id == bindparam("user_id"))
+_FIELD_WITH_ROLE = (
+    select(Field, Membership.role)
+    .join(Farm, Farm.id == Field.farm_id)
+    .outerjoin(Membership, CALLER_MEMBERSHIP_JOIN)
+    .where(Field.id == bindparam("field_id"))
+)
+# Same lookup for handlers that never touch the geometry column.
+_FIELD_WITH_ROLE_NO_GEOMETRY = _FIELD_WITH_ROLE.options(defer(Field.geometry))
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentUser:
+    """Authenticated caller as seen by request handlers; not an ORM instance."""
+
+    id: uuid.UUID
+    is_active: bool
+    organization_ids: frozenset[uuid.UUID]
+    # Role per organization, loaded with the memberships so role checks for the
+    # caller's own organizations need no further query.
+    org_roles: Mapping[uuid.UUID, RoleEnum]
+    # False for snapshots served from ``_user_cache``: their roles may predate a
+    # membership change, so role checks go through ``_org_role`` instead.
+    org_roles_fresh: bool = True
+
+
+# Snapshots of active callers, so repeated requests from the same user skip the
+# users/memberships SELECT until the TTL lapses or the entry is invalidated.
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=get_settings().auth_cache_ttl_seconds)
+_user_cache_lock = threading.Lock()
+
+
+def invalidate_cached_user(user_id: uuid.UUID) -> None:
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+# Organization ids ride along with the cached user snapshot, so membership
+# changes invalidate the same entry.
+invalidate_user_orgs = invalidate_cached_user
+
+# Session.info key for ids of users whose row or memberships were flushed in
+# the current transaction; their snapshots are dropped once it commits, so a
+# deactivated user or changed membership is not served from the cache. Core
+# statements bypass the hooks and call invalidate_cached_user themselves.
+_STALE_USERS_KEY = "stale_cached_users"
+
 
-def get_current_user(
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_users(session: Session, _flush_context: object) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Membership):
+            session.info.setdefault(_STALE_USERS_KEY, set()).add(obj.user_id)
+        elif isinstance(obj, User) and obj not in session.new:
+            session.info.setdefault(_STALE_USERS_KEY, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_STALE_USERS_KEY, ()):
+        invalidate_cached_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    session.info.pop(_STALE_USERS_KEY, None)
+
+
+async def _load_user(db: AsyncSession, user_id: uuid.UUID) -> CurrentUser | None:
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    rows = (await db.execute(_CURRENT_USER_ROWS, {"user_id": user_id})).all()
+    if not rows:
+        return None
+    org_roles = {row.organization_id: row.role for row in rows if row.organization_id is not None}
+    user = CurrentUser(
+        id=user_id,
+        is_active=rows[0].is_active,
+        organization_ids=frozenset(org_roles),
+        org_roles=org_roles,
+    )
+    if user.is_active:
+        with _user_cache_lock:
+            _user_cache[user_id] = replace(user, org_roles_fresh=False)
+    return user
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+    db: AsyncSession = Depends(get_async_db),
+) -> CurrentUser:
     try:
         payload = decode_access_token(credentials.credentials)
         user_id = payload.get("sub")
         if not user_id:
             raise ValueError("Missing subject")
-        user = db.get(User, uuid.UUID(user_id))
+        user = await _load_user(db, uuid.UUID(user_id))
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
 
@@ -29,15 +147,107 @@ def get_current_user(
     return user
 
 
-def require_org_role(org_id: uuid.UUID, user_id: uuid.UUID, db: Session, minimum: RoleEnum = RoleEnum.VIEWER) -> Membership:
-    membership = (
-        db.query(Membership)
-        .filter(Membership.organization_id == org_id, Membership.user_id == user_id)
-        .one_or_none()
-    )
-    if membership is None:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Missing organization membership")
+async def get_full_current_user(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    # Relationships are never needed here; raise instead of lazy-loading them.
+    user = await db.get(User, current_user.id, options=[raiseload("*")])
+    if user is None or not user.is_active:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive or missing user")
+    return user
+
 
-    if not has_minimum_role(actual=membership.role, minimum=minimum):
+async def get_user_org_ids(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> frozenset[uuid.UUID]:
+    """The caller's organizations, re-read unless the snapshot was loaded in this request.
+
+    Cached snapshots are only dropped by the process that saw the change, so
+    other workers could otherwise keep a removed organization (or miss a new
+    one) until the user cache TTL lapses.
+    """
+    if current_user.org_roles_fresh:
+        return current_user.organization_ids
+    return frozenset((await db.scalars(CALLER_ORG_IDS, {"user_id": current_user.id})).all())
+
+
+def check_role(role: RoleEnum | None, minimum: RoleEnum = RoleEnum.VIEWER) -> None:
+    if role is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Missing organization membership")
+    if not has_minimum_role(actual=role, minimum=minimum):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
-    return membership
+
+
+# Session.info key for the per-request (org_id, user_id) -> role memo. The
+# session lives for exactly one request, so repeated checks skip the SELECT.
+# Across requests the role comes from the Redis role cache.
+_ORG_ROLE_MEMO_KEY = "org_roles"
+
+
+def _org_role(db: Session, org_id: uuid.UUID, user_id: uuid.UUID) -> RoleEnum | None:
+    memo: dict[tuple[uuid.UUID, uuid.UUID], RoleEnum | None] = db.info.setdefault(_ORG_ROLE_MEMO_KEY, {})
+    key = (org_id, user_id)
+    if key not in memo:
+        hit, role = get_cached_role(org_id, user_id)
+        if not hit:
+            role = db.execute(_ROLE_BY_ORG_USER, {"org_id": org_id, "user_id": user_id}).scalar_one_or_none()
+            cache_role(org_id, user_id, role)
+        memo[key] = role
+    return memo[key]
+
+
+def require_org_role(
+    org_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: Session,
+    minimum: RoleEnum = RoleEnum.VIEWER,
+) -> RoleEnum:
+    """Authorize the caller in ``org_id`` and return their role.
+
+    Roles loaded with the caller in this request are used as-is; cached
+    snapshots and organizations missing from them are looked up before deciding.
+    """
+    role = current_user.org_roles.get(org_id) if current_user.org_roles_fresh else None
+    if role is None:
+        role = _org_role(db, org_id, current_user.id)
+    check_role(role, minimum)
+    return role
+
+
+async def require_org_role_async(
+    org_id: uuid.UUID,
+    current_user: CurrentUser,
+    db: AsyncSession,
+    minimum: RoleEnum = RoleEnum.VIEWER,
+) -> RoleEnum:
+    """``require_org_role`` for handlers on an ``AsyncSession``.
+
+    Skips the Redis role cache, whose client would block the event loop.
+    """
+    role = current_user.org_roles.get(org_id) if current_user.org_roles_fresh else None
+    if role is None:
+        role = await db.scalar(_ROLE_BY_ORG_USER, {"org_id": org_id, "user_id": current_user.id})
+    check_role(role, minimum)
+    return role
+
+
+def require_field_role(
+    field_id: uuid.UUID,
+    user_id: uuid.UUID,
+    db: Session,
+    minimum: RoleEnum = RoleEnum.VIEWER,
+    defer_geometry: bool = False,
+) -> Field:
+    """Load a field and authorize the caller against its farm's organization in one query.
+
+    ``defer_geometry`` leaves the geometry column unloaded until first access.
+    """
+    stmt = _FIELD_WITH_ROLE_NO_GEOMETRY if defer_geometry else _FIELD_WITH_ROLE
+    row = db.execute(stmt, {"field_id": field_id, "user_id": user_id}).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
+    field, role = row
+    check_role(role, minimum)
+    return field
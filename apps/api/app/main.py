@@ -1,30 +1,70 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 from sqlalchemy import text
 
 from app.core.config import get_settings
+from app.core.responses import APIJSONResponse
 from app.core.logging import configure_logging
-from app.db.session import Base, engine
+from app.db.session import Base, async_engine, engine
 from app.routers import alerts, auth, exports, farms, fields, layers, organizations
+from app.services.pagination import NEXT_CURSOR_HEADER
 
 configure_logging()
 logger = logging.getLogger("app.validation")
 settings = get_settings()
-allowed_origins = [origin.strip() for origin in settings.cors_allowed_origins.split(",") if origin.strip()]
 
-app = FastAPI(title="Field Monitoring Hybrid API", version="0.1.0")
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+allowed_origins = _csv(settings.cors_allowed_origins)
+
+
+def _bootstrap_schema() -> None:
+    # Development convenience only; other environments are migrated with Alembic.
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+    Base.metadata.create_all(bind=engine)
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    if settings.app_env in ("development", "test") and not settings.startup_skip_create_all:
+        _bootstrap_schema()
+    # FastAPI memoizes the schema on first build; build it before serving so
+    # the first /openapi.json request does not walk every model.
+    application.openapi()
+    # Created per lifespan, not at import, so a restarted app never inherits a
+    # client closed by the previous shutdown.
+    application.state.tiler_client = layers.create_tiler_client()
+    yield
+    await application.state.tiler_client.aclose()
+    await async_engine.dispose()
+
+
+app = FastAPI(
+    title="Field Monitoring Hybrid API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=APIJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins or ["http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_csv(settings.cors_allowed_methods),
+    allow_headers=_csv(settings.cors_allowed_headers),
+    expose_headers=[NEXT_CURSOR_HEADER],
+    max_age=settings.cors_max_age_seconds,
 )
 
 app.include_router(auth.router, prefix="/api/v1")
@@ -36,30 +76,42 @@ app.include_router(exports.router, prefix="/api/v1")
 app.include_router(alerts.router, prefix="/api/v1")
 
 
-@app.on_event("startup")
-def startup_event() -> None:
-    with engine.begin() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
-    Base.metadata.create_all(bind=engine)
+# Validation-failure logging reads at most this much of the request body.
+BODY_PREVIEW_BYTES = 2000
+BODY_PREVIEW_MAX_CONTENT_LENGTH = 1_000_000
 
 
-@app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def _body_preview(request: Request) -> str:
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > BODY_PREVIEW_MAX_CONTENT_LENGTH:
+        return f"[omitted {content_length} bytes]"
     body = await request.body()
-    body_preview = body.decode("utf-8", errors="ignore")
-    if len(body_preview) > 2000:
-        body_preview = f"{body_preview[:2000]}...[truncated]"
-    logger.warning(
-        "Request validation failed path=%s method=%s errors=%s body_preview=%s",
-        request.url.path,
-        request.method,
-        exc.errors(),
-        body_preview,
-    )
-    return JSONResponse(status_code=422, content={"detail": exc.errors()})
-
-
-Instrumentator().instrument(app).expose(app, include_in_schema=False)
+    preview = body[:BODY_PREVIEW_BYTES].decode("utf-8", errors="ignore")
+    if len(body) > BODY_PREVIEW_BYTES:
+        preview = f"{preview}...[truncated]"
+    return preview
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
+    errors = exc.errors()
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Request validation failed path=%s method=%s errors=%s body_preview=%s",
+            request.url.path,
+            request.method,
+            errors,
+            await _body_preview(request),
+        )
+    return ORJSONResponse(status_code=422, content={"detail": errors})
+
+
+Instrumentator(
+    should_group_status_codes=True,
+    should_ignore_untemplated=True,
+    should_instrument_requests_inprogress=False,
+    excluded_handlers=["/healthz", "/metrics"],
+).instrument(app).expose(app, endpoint="/metrics", include_in_schema=False)
 
 
 @app.get("/healthz", tags=["health"])
@@ -14,16 +14,19 @@ except ImportError:
 from geoalchemy2 import Geometry
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Date,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -87,6 +90,7 @@ class TimestampMixin:
 
 class User(TimestampMixin, Base):
     __tablename__ = "users"
+    __table_args__ = (CheckConstraint("email = lower(email)", name="ck_users_email_lowercase"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
@@ -94,6 +98,8 @@ class User(TimestampMixin, Base):
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
+    memberships: Mapped[List["Membership"]] = relationship(back_populates="user")
+
 
 class Organization(TimestampMixin, Base):
     __tablename__ = "organizations"
@@ -105,13 +111,18 @@ class Organization(TimestampMixin, Base):
 
 class Membership(TimestampMixin, Base):
     __tablename__ = "memberships"
-    __table_args__ = (UniqueConstraint("organization_id", "user_id", name="uq_membership_org_user"),)
+    __table_args__ = (
+        UniqueConstraint("organization_id", "user_id", name="uq_membership_org_user"),
+        Index("ix_memberships_user_org", "user_id", "organization_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     role: Mapped[RoleEnum] = mapped_column(Enum(RoleEnum, name="role_enum"), nullable=False)
 
+    user: Mapped["User"] = relationship(back_populates="memberships")
+
 
 class Invite(TimestampMixin, Base):
     __tablename__ = "invites"
@@ -186,6 +197,7 @@ class SRModelProfile(TimestampMixin, Base):
 
 class Observation(TimestampMixin, Base):
     __tablename__ = "observations"
+    __table_args__ = (Index("ix_observations_field_observed_on", "field_id", "observed_on"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     field_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("fields.id"), nullable=False)
@@ -232,6 +244,9 @@ class LayerAsset(TimestampMixin, Base):
 
 class AlertEvent(TimestampMixin, Base):
     __tablename__ = "alert_events"
+    __table_args__ = (
+        Index("ix_alert_events_org_created_id", "organization_id", text("created_at DESC"), text("id DESC")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
@@ -259,6 +274,9 @@ class ExportJob(TimestampMixin, Base):
 
 class FeatureFlag(TimestampMixin, Base):
     __tablename__ = "feature_flags"
+    # The unique constraint's btree also serves the keyset listing
+    # (organization_id = ? AND key > ? ORDER BY key) and the upsert's conflict
+    # target, so no separate (organization_id, key) index is needed.
     __table_args__ = (UniqueConstraint("organization_id", "key", name="uq_feature_flags_org_key"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -1,102 +1,102 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.deps import get_current_user
-from app.db.session import get_db
-from app.models import AlertEvent, Field, Farm, Membership, User
+from app.core.responses import ModelJSONResponse
+from app.deps import CALLER_ORG_IDS, CurrentUser, get_current_user
+from app.db.session import get_async_db
+from app.models import AlertEvent, Field, Farm
 from app.schemas import AlertResponse, AlertsClearResponse
+from app.services.pagination import NEXT_CURSOR_HEADER, encode_cursor, keyset_before, parse_cursor
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
+# Columns needed for AlertResponse; selected as plain rows to skip ORM hydration.
+_ALERT_RESPONSE_COLUMNS = (
+    AlertEvent.id,
+    AlertEvent.organization_id,
+    AlertEvent.field_id,
+    AlertEvent.severity,
+    AlertEvent.category,
+    AlertEvent.message,
+    AlertEvent.acknowledged_at,
+    AlertEvent.metadata_json,
+)
 
-@router.get("", response_model=list[AlertResponse])
-def list_alerts(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> list[AlertResponse]:
-    org_ids = select(Membership.organization_id).where(Membership.user_id == current_user.id)
-    alerts = (
-        db.query(AlertEvent)
-        .filter(AlertEvent.organization_id.in_(org_ids))
-        .order_by(AlertEvent.created_at.desc())
-        .limit(200)
-        .all()
-    )
-    return [
-        AlertResponse(
-            id=str(alert.id),
-            organization_id=str(alert.organization_id),
-            field_id=str(alert.field_id) if alert.field_id else None,
-            severity=alert.severity.value,
-            category=alert.category,
-            message=alert.message,
-            acknowledged_at=alert.acknowledged_at,
-            metadata_json=alert.metadata_json,
-        )
-        for alert in alerts
-    ]
-
-
-@router.post("/{alert_id}/ack", response_model=AlertResponse)
-def ack_alert(
-    alert_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> AlertResponse:
-    alert = db.get(AlertEvent, alert_id)
-    if alert is None:
-        raise HTTPException(status_code=404, detail="Alert not found")
 
-    membership = (
-        db.query(Membership)
-        .filter(Membership.organization_id == alert.organization_id, Membership.user_id == current_user.id)
-        .one_or_none()
+@router.get("", response_model=None, responses={200: {"model": list[AlertResponse]}})
+async def list_alerts(
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=200, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    stmt = (
+        select(*_ALERT_RESPONSE_COLUMNS, AlertEvent.created_at)
+        .where(AlertEvent.organization_id.in_(CALLER_ORG_IDS))
+        .order_by(AlertEvent.created_at.desc(), AlertEvent.id.desc())
+        .limit(limit)
     )
-    if membership is None:
-        raise HTTPException(status_code=403, detail="Not allowed")
+    if cursor:
+        stmt = stmt.where(keyset_before(AlertEvent.created_at, AlertEvent.id, parse_cursor(cursor)))
+
+    rows = (await db.execute(stmt, {"user_id": current_user.id})).mappings().all()
+    # Clients page with ?cursor=<X-Next-Cursor>; the body stays a plain list.
+    headers = {}
+    if len(rows) == limit:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    # Rows come straight from the database; build responses without re-validating.
+    return ModelJSONResponse([AlertResponse.model_construct(**row) for row in rows], headers=headers)
 
-    alert.acknowledged_at = datetime.now(timezone.utc)
-    alert.acknowledged_by_id = current_user.id
-    db.commit()
 
-    return AlertResponse(
-        id=str(alert.id),
-        organization_id=str(alert.organization_id),
-        field_id=str(alert.field_id) if alert.field_id else None,
-        severity=alert.severity.value,
-        category=alert.category,
-        message=alert.message,
-        acknowledged_at=alert.acknowledged_at,
-        metadata_json=alert.metadata_json,
+@router.post("/{alert_id}/ack", response_model=None, responses={200: {"model": AlertResponse}})
+async def ack_alert(
+    alert_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    # Membership check and update in one statement; a missing alert and one in
+    # another organization are both reported as not found.
+    stmt = (
+        update(AlertEvent)
+        .where(
+            AlertEvent.id == alert_id,
+            AlertEvent.organization_id.in_(CALLER_ORG_IDS),
+        )
+        .values(acknowledged_at=datetime.now(timezone.utc), acknowledged_by_id=current_user.id)
+        .returning(*_ALERT_RESPONSE_COLUMNS)
     )
+    row = (await db.execute(stmt, {"user_id": current_user.id})).mappings().one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Alert not found")
+    await db.commit()
+    return ModelJSONResponse(AlertResponse.model_construct(**row))
 
 
-@router.delete("", response_model=AlertsClearResponse)
-def clear_alerts(
+@router.delete("", response_model=None, responses={200: {"model": AlertsClearResponse}})
+async def clear_alerts(
     field_id: UUID | None = Query(default=None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> AlertsClearResponse:
-    org_ids = select(Membership.organization_id).where(Membership.user_id == current_user.id)
-    query = db.query(AlertEvent).filter(AlertEvent.organization_id.in_(org_ids))
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    # Scoped by the caller's memberships as of this statement, not the cached
+    # user snapshot, so a removed member cannot clear the organization's alerts.
+    stmt = delete(AlertEvent).where(AlertEvent.organization_id.in_(CALLER_ORG_IDS))
 
     if field_id:
-        field = db.get(Field, field_id)
-        if field is None:
-            raise HTTPException(status_code=404, detail="Field not found")
-        farm = db.get(Farm, field.farm_id)
-        if farm is None:
-            raise HTTPException(status_code=404, detail="Farm not found")
-        membership = (
-            db.query(Membership)
-            .filter(Membership.organization_id == farm.organization_id, Membership.user_id == current_user.id)
-            .one_or_none()
+        # Authorize on the field's farm in the same statement; an unknown or
+        # foreign field simply deletes nothing.
+        field_in_user_orgs = (
+            select(Field.id)
+            .join(Farm, Farm.id == Field.farm_id)
+            .where(Field.id == field_id, Farm.organization_id.in_(CALLER_ORG_IDS))
+            .exists()
         )
-        if membership is None:
-            raise HTTPException(status_code=403, detail="Not allowed")
-        query = query.filter(AlertEvent.field_id == field.id)
+        stmt = stmt.where(AlertEvent.field_id == field_id, field_in_user_orgs)
 
-    deleted_alerts = query.delete(synchronize_session=False)
-    db.commit()
-    return AlertsClearResponse(deleted_alerts=deleted_alerts)
+    result = await db.execute(stmt, {"user_id": current_user.id}, execution_options={"synchronize_session": False})
+    await db.commit()
+    return ModelJSONResponse(AlertsClearResponse.model_construct(deleted_alerts=result.rowcount))
@@ -1,35 +1,41 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_refresh_token,
     get_password_hash,
+    password_needs_rehash,
     verify_password,
 )
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models import User
 from app.schemas import LoginRequest, RegisterRequest, TokenRefreshRequest, TokenResponse
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 @router.post("/register", response_model=TokenResponse)
-def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> TokenResponse:
-    existing = db.query(User).filter(User.email == payload.email.lower()).one_or_none()
+async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_async_db)) -> TokenResponse:
+    existing = (await db.execute(_USER_BY_EMAIL, {"email": payload.email})).scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Email already registered")
 
     user = User(
-        email=payload.email.lower(),
+        email=payload.email,
         full_name=payload.full_name,
-        hashed_password=get_password_hash(payload.password),
+        # bcrypt is CPU-bound; keep it off the event loop.
+        hashed_password=await run_in_threadpool(get_password_hash, payload.password),
     )
     db.add(user)
-    db.commit()
+    await db.commit()
 
     access = create_access_token(subject=str(user.id))
     refresh = create_refresh_token(subject=str(user.id))
@@ -37,10 +43,14 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> TokenRe
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse:
-    user = db.query(User).filter(User.email == payload.email.lower()).one_or_none()
-    if user is None or not verify_password(payload.password, user.hashed_password):
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)) -> TokenResponse:
+    user = (await db.execute(_USER_BY_EMAIL, {"email": payload.email})).scalar_one_or_none()
+    if user is None or not await run_in_threadpool(verify_password, payload.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if password_needs_rehash(user.hashed_password):
+        # Legacy bcrypt or below BCRYPT_ROUNDS; the plaintext is at hand only now.
+        user.hashed_password = await run_in_threadpool(get_password_hash, payload.password)
+        await db.commit()
 
     access = create_access_token(subject=str(user.id))
     refresh = create_refresh_token(subject=str(user.id))
@@ -48,13 +58,13 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse
 
 
 @router.post("/refresh", response_model=TokenResponse)
-def refresh(payload: TokenRefreshRequest, db: Session = Depends(get_db)) -> TokenResponse:
+async def refresh(payload: TokenRefreshRequest, db: AsyncSession = Depends(get_async_db)) -> TokenResponse:
     try:
         decoded = decode_refresh_token(payload.refresh_token)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token") from exc
 
-    user = db.get(User, uuid.UUID(decoded["sub"]))
+    user = await db.get(User, uuid.UUID(decoded["sub"]))
     if user is None or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User unavailable")
 
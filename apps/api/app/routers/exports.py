@@ -1,33 +1,36 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
-from app.deps import get_current_user, require_org_role
+from app.core.responses import ModelJSONResponse
+from app.deps import CALLER_MEMBERSHIP_JOIN, CurrentUser, check_role, get_current_user, require_field_role
 from app.db.session import get_db
-from app.models import ExportJob, Farm, Field, JobStatusEnum, RoleEnum, User
+from app.models import ExportJob, Farm, Field, JobStatusEnum, Membership, RoleEnum
 from app.schemas import ExportCreateRequest, ExportJobResponse
 from app.services.queue import celery_client
 from app.services.storage import create_presigned_get_url
 
 router = APIRouter(prefix="/exports", tags=["exports"])
 
+_EXPORT_WITH_ROLE = (
+    select(ExportJob, Membership.role)
+    .join(Field, Field.id == ExportJob.field_id)
+    .join(Farm, Farm.id == Field.farm_id)
+    .outerjoin(Membership, CALLER_MEMBERSHIP_JOIN)
+    .where(ExportJob.id == bindparam("export_id"))
+)
 
-@router.post("", response_model=ExportJobResponse)
+
+@router.post("", response_model=None, responses={200: {"model": ExportJobResponse}})
 def create_export_job(
     payload: ExportCreateRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> ExportJobResponse:
-    field = db.get(Field, UUID(payload.field_id))
-    if field is None:
-        raise HTTPException(status_code=404, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=404, detail="Farm not found")
-
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db, minimum=RoleEnum.ANALYST)
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    field = require_field_role(payload.field_id, current_user.id, db, minimum=RoleEnum.ANALYST)
 
     export_job = ExportJob(
         field_id=field.id,
@@ -44,44 +47,46 @@ def create_export_job(
     db.add(export_job)
     db.commit()
 
-    celery_client.send_task("worker.tasks.run_export_task", args=[str(export_job.id)], queue="exports")
+    # Publish after the response is sent; the job row is already durable.
+    background_tasks.add_task(
+        celery_client.send_task,
+        "worker.tasks.run_export_task",
+        kwargs={"export_id": str(export_job.id)},
+        queue="exports",
+    )
 
-    return ExportJobResponse(
-        id=str(export_job.id),
-        status=export_job.status.value,
-        format=export_job.format.value,
-        error_message=export_job.error_message,
+    return ModelJSONResponse(
+        ExportJobResponse.model_construct(
+            id=str(export_job.id),
+            status=export_job.status.value,
+            format=export_job.format.value,
+            error_message=export_job.error_message,
+        )
     )
 
 
-@router.get("/{export_id}", response_model=ExportJobResponse)
+@router.get("/{export_id}", response_model=None, responses={200: {"model": ExportJobResponse}})
 def get_export_job(
     export_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> ExportJobResponse:
-    export_job = db.get(ExportJob, export_id)
-    if export_job is None:
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    row = db.execute(_EXPORT_WITH_ROLE, {"export_id": export_id, "user_id": current_user.id}).one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Export job not found")
-
-    field = db.get(Field, export_job.field_id)
-    if field is None:
-        raise HTTPException(status_code=404, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=404, detail="Farm not found")
-
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db)
+    export_job, role = row
+    check_role(role)
 
     output_uri = None
     if export_job.output_uri:
         output_uri = create_presigned_get_url(export_job.output_uri, expires_seconds=3600, external=True)
 
-    return ExportJobResponse(
-        id=str(export_job.id),
-        status=export_job.status.value,
-        format=export_job.format.value,
-        output_uri=output_uri,
-        error_message=export_job.error_message,
+    return ModelJSONResponse(
+        ExportJobResponse.model_construct(
+            id=str(export_job.id),
+            status=export_job.status.value,
+            format=export_job.format.value,
+            output_uri=output_uri,
+            error_message=export_job.error_message,
+        )
     )
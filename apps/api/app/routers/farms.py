@@ -1,25 +1,38 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.deps import get_current_user, require_org_role
+from app.core.responses import ModelJSONResponse
+from app.deps import CurrentUser, get_current_user, get_user_org_ids, require_org_role
 from app.db.session import get_db
-from app.models import Farm, Membership, RoleEnum, User
+from app.models import Farm, RoleEnum
 from app.schemas import FarmCreateRequest, FarmResponse
+from app.services.pagination import keyset_before, next_cursor_headers, parse_cursor
+from app.services.response_cache import (
+    FARM_LIST_CACHE_NAMESPACE,
+    CachedBody,
+    cached_json_response,
+    invalidate,
+    scope_digest,
+)
 
 router = APIRouter(prefix="/farms", tags=["farms"])
 
+_FARM_LIST_CACHE_TTL_SECONDS = 20
+_FARM_LIST_ADAPTER = TypeAdapter(list[FarmResponse])
 
-@router.post("", response_model=FarmResponse)
+
+@router.post("", response_model=None, responses={200: {"model": FarmResponse}})
 def create_farm(
     payload: FarmCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> FarmResponse:
-    org_id = UUID(payload.organization_id)
-    require_org_role(org_id=org_id, user_id=current_user.id, db=db, minimum=RoleEnum.ADMIN)
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    org_id = payload.organization_id
+    require_org_role(org_id=org_id, current_user=current_user, db=db, minimum=RoleEnum.ADMIN)
 
     farm = Farm(
         organization_id=org_id,
@@ -28,27 +41,53 @@ def create_farm(
     )
     db.add(farm)
     db.commit()
-    return FarmResponse(
-        id=str(farm.id),
-        organization_id=str(farm.organization_id),
-        name=farm.name,
-        description=farm.description,
-        created_at=farm.created_at,
-    )
-
-
-@router.get("", response_model=list[FarmResponse])
-def list_farms(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)) -> list[FarmResponse]:
-    org_ids = select(Membership.organization_id).where(Membership.user_id == current_user.id)
-    farms = db.query(Farm).filter(Farm.organization_id.in_(org_ids)).order_by(Farm.created_at.desc()).all()
-
-    return [
-        FarmResponse(
+    invalidate(FARM_LIST_CACHE_NAMESPACE)
+    return ModelJSONResponse(
+        FarmResponse.model_construct(
             id=str(farm.id),
             organization_id=str(farm.organization_id),
             name=farm.name,
             description=farm.description,
             created_at=farm.created_at,
         )
-        for farm in farms
-    ]
+    )
+
+
+@router.get("", response_model=None, responses={200: {"model": list[FarmResponse]}})
+def list_farms(
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=200, ge=1, le=200),
+    db: Session = Depends(get_db),
+    org_ids: frozenset[UUID] = Depends(get_user_org_ids),
+) -> Response:
+    stmt = (
+        select(Farm)
+        .where(Farm.organization_id.in_(tuple(org_ids)))
+        .order_by(Farm.created_at.desc(), Farm.id.desc())
+        .limit(limit)
+    )
+    if cursor:
+        stmt = stmt.where(keyset_before(Farm.created_at, Farm.id, parse_cursor(cursor)))
+
+    def build() -> CachedBody:
+        farms = db.execute(stmt).scalars().all()
+        body = _FARM_LIST_ADAPTER.dump_json(
+            [
+                FarmResponse.model_construct(
+                    id=str(farm.id),
+                    organization_id=str(farm.organization_id),
+                    name=farm.name,
+                    description=farm.description,
+                    created_at=farm.created_at,
+                )
+                for farm in farms
+            ]
+        )
+        return body, next_cursor_headers(farms, limit)
+
+    return cached_json_response(
+        FARM_LIST_CACHE_NAMESPACE,
+        key_parts=(scope_digest(org_ids), cursor or "*", limit),
+        ttl_seconds=_FARM_LIST_CACHE_TTL_SECONDS,
+        produce=build,
+    )
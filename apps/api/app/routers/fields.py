@@ -3,13 +3,26 @@ import logging
 from datetime import date, datetime, timedelta, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+import orjson
+import shapely
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
+from geoalchemy2.elements import WKBElement
 from shapely.geometry import mapping
+from sqlalchemy import CTE, Insert, Select, String, bindparam, delete, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.core.config import get_settings
-from app.deps import get_current_user, require_org_role
-from app.db.session import get_db
+from app.core.config import Settings, get_settings
+from app.core.responses import ModelJSONResponse
+from app.deps import (
+    CALLER_MEMBERSHIP_JOIN,
+    CurrentUser,
+    check_role,
+    get_current_user,
+    get_user_org_ids,
+    require_field_role,
+)
+from app.db.session import SessionLocal, get_db
 from app.models import (
     AnalysisJob,
     Farm,
@@ -21,18 +34,17 @@ from app.models import (
     Observation,
     RoleEnum,
     SceneCandidate,
-    User,
 )
 from app.schemas import (
     AnalysisCreateRequest,
     AnalysisJobResponse,
     FieldCreateRequest,
     FieldResponse,
+    FieldWithoutGeometryResponse,
     FieldScheduleUpdateRequest,
     FieldUpdateRequest,
     ImagerySearchResponse,
     TimelineClearResponse,
-    TimeSeriesPoint,
     TimeSeriesResponse,
 )
 from app.services.analysis import search_field_imagery
@@ -47,10 +59,116 @@ from app.services.geometry import (
 from app.services.geometry_db import to_shape_from_wkb, to_wkb_element
 from app.services.planetary_computer import scene_field_coverage_ratio, scene_to_geometry
 from app.services.queue import celery_client
+from app.services.pagination import keyset_before, next_cursor_headers, parse_cursor
+from app.services.response_cache import (
+    FIELD_LIST_CACHE_NAMESPACE,
+    CachedBody,
+    cached_json_response,
+    invalidate,
+    scope_digest,
+    timeseries_cache_namespace,
+)
 
 router = APIRouter(prefix="/fields", tags=["fields"])
 logger = logging.getLogger("app.fields")
 
+_FIELD_LIST_CACHE_TTL_SECONDS = 20
+_TIMESERIES_CACHE_TTL_SECONDS = 60
+# list_fields is serialized straight from these columns: GeoJSON comes from
+# PostGIS (15 digits, matching shapely's output) instead of a per-row WKB decode.
+_FIELD_LIST_COLUMNS = (
+    Field.id,
+    Field.farm_id,
+    Field.name,
+    Field.area_ha,
+    func.ST_AsGeoJSON(Field.geometry, 15).label("geometry_json"),
+    Field.metadata_json["schedule"].label("schedule"),
+    Field.created_at,
+)
+
+
+def _delete_for_field_cte(model: type, name: str) -> CTE:
+    return delete(model).where(model.field_id == bindparam("field_id")).returning(model.id).cte(name)
+
+
+def _build_clear_timeseries_statement() -> Select:
+    # All four deletes run as data-modifying CTEs in one statement; foreign keys
+    # between these tables are checked at the end of the statement.
+    ctes = [
+        _delete_for_field_cte(LayerAsset, "deleted_layer_assets"),
+        _delete_for_field_cte(Observation, "deleted_observations"),
+        _delete_for_field_cte(AnalysisJob, "deleted_analysis_jobs"),
+        _delete_for_field_cte(SceneCandidate, "deleted_scene_candidates"),
+    ]
+    return select(*(select(func.count()).select_from(cte).scalar_subquery() for cte in ctes))
+
+
+_CLEAR_TIMESERIES = _build_clear_timeseries_statement()
+
+
+def _build_create_field_statement() -> Insert:
+    # Field and its first revision in one round trip; the revision's foreign
+    # key to the new field is checked at the end of the statement.
+    new_field = (
+        insert(Field)
+        .values(
+            id=bindparam("field_id"),
+            farm_id=bindparam("farm_id"),
+            name=bindparam("name"),
+            geometry=bindparam("geometry"),
+            area_ha=bindparam("area_ha"),
+            metadata_json=bindparam("metadata_json"),
+        )
+        .returning(Field.id)
+        .cte("new_field")
+    )
+    return insert(FieldRevision).from_select(
+        ["field_id", "changed_by_id", "geometry", "area_ha"],
+        select(
+            new_field.c.id,
+            bindparam("changed_by_id", type_=FieldRevision.changed_by_id.type),
+            bindparam("geometry", type_=FieldRevision.geometry.type),
+            bindparam("area_ha", type_=FieldRevision.area_ha.type),
+        ),
+    )
+
+
+_CREATE_FIELD = _build_create_field_statement()
+
+
+def _insert_field(
+    db: Session,
+    *,
+    farm_id: UUID,
+    name: str,
+    geometry_wkb: WKBElement,
+    area_ha: float,
+    metadata_json: dict,
+    changed_by_id: UUID,
+) -> Field:
+    """Insert a field with its initial revision; returns a detached Field for the response."""
+    field = Field(id=uuid.uuid4(), farm_id=farm_id, name=name, area_ha=area_ha, metadata_json=metadata_json)
+    db.execute(
+        _CREATE_FIELD,
+        {
+            "field_id": field.id,
+            "farm_id": farm_id,
+            "name": name,
+            "geometry": geometry_wkb,
+            "area_ha": area_ha,
+            "metadata_json": metadata_json,
+            "changed_by_id": changed_by_id,
+        },
+    )
+    return field
+
+
+_FARM_WITH_ROLE = (
+    select(Farm, Membership.role)
+    .outerjoin(Membership, CALLER_MEMBERSHIP_JOIN)
+    .where(Farm.id == bindparam("farm_id"))
+)
+
 
 def _validation_error(field_name: str, message: str, code: str = "value_error") -> HTTPException:
     return HTTPException(
@@ -59,14 +177,6 @@ def _validation_error(field_name: str, message: str, code: str = "value_error")
     )
 
 
-def _parse_uuid(value: str, field_name: str) -> UUID:
-    try:
-        return UUID(value)
-    except ValueError as exc:
-        logger.warning("Invalid UUID payload field_name=%s value=%s", field_name, value)
-        raise _validation_error(field_name, f"Invalid {field_name}: expected UUID format", code="uuid_invalid") from exc
-
-
 def _normalize_field_name(value: str) -> str:
     cleaned = value.strip()
     if not cleaned:
@@ -79,54 +189,93 @@ def _normalize_field_name(value: str) -> str:
 
 
 def _farm_with_role_check(db: Session, farm_id: UUID, user_id: uuid.UUID, minimum: RoleEnum) -> Farm:
-    farm = db.get(Farm, farm_id)
-    if farm is None:
+    row = db.execute(_FARM_WITH_ROLE, {"farm_id": farm_id, "user_id": user_id}).one_or_none()
+    if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Farm not found")
-    require_org_role(org_id=farm.organization_id, user_id=user_id, db=db, minimum=minimum)
+    farm, role = row
+    check_role(role, minimum)
     return farm
 
 
-def _field_response(field: Field, geometry_dict: dict | None = None) -> FieldResponse:
+def _field_response(
+    field: Field, geometry_dict: dict | None = None, include_geometry: bool = True
+) -> FieldResponse | FieldWithoutGeometryResponse:
     metadata = field.metadata_json or {}
     schedule = metadata.get("schedule")
+    schedule = schedule if isinstance(schedule, dict) else None
+    if not include_geometry:
+        return FieldWithoutGeometryResponse.model_construct(
+            id=str(field.id),
+            farm_id=str(field.farm_id),
+            name=field.name,
+            area_ha=field.area_ha,
+            schedule=schedule,
+        )
     if geometry_dict is None:
         geometry_dict = multipolygon_to_geojson_dict(to_shape_from_wkb(field.geometry))
-    return FieldResponse(
+    return FieldResponse.model_construct(
         id=str(field.id),
         farm_id=str(field.farm_id),
         name=field.name,
         area_ha=field.area_ha,
         geometry=geometry_dict,
-        schedule=schedule if isinstance(schedule, dict) else None,
+        schedule=schedule,
     )
 
 
-@router.get("", response_model=list[FieldResponse])
+@router.get("", response_model=None, responses={200: {"model": list[FieldResponse]}})
 def list_fields(
     farm_id: UUID | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=200, ge=1, le=200),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[FieldResponse]:
-    query = (
-        db.query(Field)
+    org_ids: frozenset[UUID] = Depends(get_user_org_ids),
+) -> Response:
+    stmt = (
+        select(*_FIELD_LIST_COLUMNS)
         .join(Farm, Field.farm_id == Farm.id)
-        .join(Membership, Membership.organization_id == Farm.organization_id)
-        .filter(Membership.user_id == current_user.id)
+        .where(Farm.organization_id.in_(tuple(org_ids)))
+        .order_by(Field.created_at.desc(), Field.id.desc())
+        .limit(limit)
     )
     if farm_id is not None:
-        query = query.filter(Field.farm_id == farm_id)
+        stmt = stmt.where(Field.farm_id == farm_id)
+    if cursor:
+        stmt = stmt.where(keyset_before(Field.created_at, Field.id, parse_cursor(cursor)))
+
+    def build() -> CachedBody:
+        rows = db.execute(stmt).all()
+        body = orjson.dumps(
+            [
+                {
+                    "id": row.id,
+                    "farm_id": row.farm_id,
+                    "name": row.name,
+                    "area_ha": row.area_ha,
+                    # PostGIS already rendered the GeoJSON; embed it without re-parsing.
+                    "geometry": orjson.Fragment(row.geometry_json),
+                    "schedule": row.schedule if isinstance(row.schedule, dict) else None,
+                }
+                for row in rows
+            ]
+        )
+        return body, next_cursor_headers(rows, limit)
 
-    fields = query.order_by(Field.created_at.desc()).all()
-    return [_field_response(field) for field in fields]
+    return cached_json_response(
+        FIELD_LIST_CACHE_NAMESPACE,
+        key_parts=(scope_digest(org_ids), farm_id or "*", cursor or "*", limit),
+        ttl_seconds=_FIELD_LIST_CACHE_TTL_SECONDS,
+        produce=build,
+    )
 
 
-@router.post("", response_model=FieldResponse)
+@router.post("", response_model=None, responses={200: {"model": FieldResponse}})
 def create_field(
     payload: FieldCreateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> FieldResponse:
-    farm = _farm_with_role_check(db, _parse_uuid(payload.farm_id, "farm_id"), current_user.id, RoleEnum.ANALYST)
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    farm = _farm_with_role_check(db, payload.farm_id, current_user.id, RoleEnum.ANALYST)
     field_name = _normalize_field_name(payload.name)
 
     try:
@@ -143,38 +292,30 @@ def create_field(
         )
         raise _validation_error("geometry", str(exc), code="geometry_invalid") from exc
 
-    field = Field(
+    field = _insert_field(
+        db,
         farm_id=farm.id,
         name=field_name,
-        geometry=to_wkb_element(geometry),
+        geometry_wkb=to_wkb_element(geometry),
         area_ha=area_ha,
         metadata_json={},
-    )
-    db.add(field)
-    db.flush()
-
-    db.add(
-        FieldRevision(
-            field_id=field.id,
-            changed_by_id=current_user.id,
-            geometry=to_wkb_element(geometry),
-            area_ha=area_ha,
-        )
+        changed_by_id=current_user.id,
     )
     db.commit()
+    invalidate(FIELD_LIST_CACHE_NAMESPACE)
 
-    return _field_response(field, geometry_dict=multipolygon_to_geojson_dict(geometry))
+    return ModelJSONResponse(_field_response(field, geometry_dict=multipolygon_to_geojson_dict(geometry)))
 
 
-@router.post("/import", response_model=FieldResponse)
+@router.post("/import", response_model=None, responses={200: {"model": FieldResponse}})
 async def import_field(
-    farm_id: str = Form(...),
+    farm_id: UUID = Form(...),
     name: str = Form(...),
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> FieldResponse:
-    farm = _farm_with_role_check(db, _parse_uuid(farm_id, "farm_id"), current_user.id, RoleEnum.ANALYST)
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    farm = _farm_with_role_check(db, farm_id, current_user.id, RoleEnum.ANALYST)
     field_name = _normalize_field_name(name)
 
     content = await file.read()
@@ -192,44 +333,51 @@ async def import_field(
         )
         raise _validation_error("geometry", str(exc), code="geometry_invalid") from exc
 
-    field = Field(
+    field = _insert_field(
+        db,
         farm_id=farm.id,
         name=field_name,
-        geometry=to_wkb_element(geometry),
+        geometry_wkb=to_wkb_element(geometry),
         area_ha=area_ha,
         metadata_json={"source_upload": file.filename},
-    )
-    db.add(field)
-    db.flush()
-
-    db.add(
-        FieldRevision(
-            field_id=field.id,
-            changed_by_id=current_user.id,
-            geometry=to_wkb_element(geometry),
-            area_ha=area_ha,
-        )
+        changed_by_id=current_user.id,
     )
     db.commit()
+    invalidate(FIELD_LIST_CACHE_NAMESPACE)
+
+    return ModelJSONResponse(_field_response(field, geometry_dict=multipolygon_to_geojson_dict(geometry)))
 
-    return _field_response(field, geometry_dict=multipolygon_to_geojson_dict(geometry))
 
+def _record_field_revision(field_id: UUID, changed_by_id: UUID, geometry_wkb: WKBElement, area_ha: float) -> None:
+    """Append a revision after the response is sent; history may trail the edit briefly."""
+    with SessionLocal() as db:
+        try:
+            db.add(
+                FieldRevision(field_id=field_id, changed_by_id=changed_by_id, geometry=geometry_wkb, area_ha=area_ha)
+            )
+            db.commit()
+        except SQLAlchemyError:
+            logger.exception("Field revision write failed field_id=%s", field_id)
 
-@router.patch("/{field_id}", response_model=FieldResponse)
+
+@router.patch(
+    "/{field_id}",
+    response_model=None,
+    responses={200: {"model": FieldResponse | FieldWithoutGeometryResponse}},
+)
 def update_field(
     field_id: UUID,
     payload: FieldUpdateRequest,
+    background_tasks: BackgroundTasks,
+    include_geometry: bool = Query(default=True),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> FieldResponse:
-    field = db.get(Field, field_id)
-    if field is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-
-    farm = _farm_with_role_check(db, field.farm_id, current_user.id, RoleEnum.ANALYST)
-    _ = farm
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    field = require_field_role(
+        field_id, current_user.id, db, minimum=RoleEnum.ANALYST, defer_geometry=not include_geometry
+    )
 
-    geometry = to_shape_from_wkb(field.geometry)
+    geometry_dict: dict | None = None
     if payload.geometry is not None:
         try:
             geometry = parse_geojson_geometry(payload.geometry)
@@ -244,26 +392,23 @@ def update_field(
                 str(exc),
             )
             raise _validation_error("geometry", str(exc), code="geometry_invalid") from exc
-        field.geometry = to_wkb_element(geometry)
+        geometry_wkb = to_wkb_element(geometry)
+        field.geometry = geometry_wkb
         field.area_ha = area_ha
-        db.add(
-            FieldRevision(
-                field_id=field.id,
-                changed_by_id=current_user.id,
-                geometry=to_wkb_element(geometry),
-                area_ha=area_ha,
-            )
-        )
+        background_tasks.add_task(_record_field_revision, field.id, current_user.id, geometry_wkb, area_ha)
+        if include_geometry:
+            geometry_dict = multipolygon_to_geojson_dict(geometry)
 
     if payload.name:
         field.name = _normalize_field_name(payload.name)
 
     db.commit()
+    invalidate(FIELD_LIST_CACHE_NAMESPACE)
 
-    return _field_response(field, geometry_dict=multipolygon_to_geojson_dict(geometry))
+    return ModelJSONResponse(_field_response(field, geometry_dict=geometry_dict, include_geometry=include_geometry))
 
 
-@router.get("/{field_id}/imagery/search", response_model=list[ImagerySearchResponse])
+@router.get("/{field_id}/imagery/search", response_model=None, responses={200: {"model": list[ImagerySearchResponse]}})
 def search_imagery(
     field_id: UUID,
     date_from: date | None = None,
@@ -271,17 +416,10 @@ def search_imagery(
     max_cloud: float = 20.0,
     collection: str = "sentinel-2-l2a",
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[ImagerySearchResponse]:
-    field = db.get(Field, field_id)
-    if field is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Farm not found")
-
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db, minimum=RoleEnum.VIEWER)
+    current_user: CurrentUser = Depends(get_current_user),
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    field = require_field_role(field_id, current_user.id, db, minimum=RoleEnum.VIEWER)
 
     if date_from is None or date_to is None:
         today = datetime.now(timezone.utc).date()
@@ -296,19 +434,20 @@ def search_imagery(
         max_cloud=max_cloud,
         collection=collection,
     )
-    settings = get_settings()
     field_geometry = to_shape_from_wkb(field.geometry)
+    shapely.prepare(field_geometry)
+    field_area = field_geometry.area
     accepted_scenes: list[ImagerySearchResponse] = []
 
     for scene in scenes:
-        coverage_ratio = scene_field_coverage_ratio(scene=scene, field_geometry=field_geometry)
+        coverage_ratio = scene_field_coverage_ratio(scene=scene, field_geometry=field_geometry, field_area=field_area)
         if coverage_ratio < settings.min_scene_coverage_ratio:
             continue
 
         scene_geometry = scene_to_geometry(scene)
         footprint_geojson = mapping(scene_geometry) if scene_geometry is not None else None
         accepted_scenes.append(
-            ImagerySearchResponse(
+            ImagerySearchResponse.model_construct(
                 scene_id=scene.scene_id,
                 acquisition_date=scene.acquisition_date,
                 cloud_cover=scene.cloud_cover,
@@ -321,22 +460,24 @@ def search_imagery(
             )
         )
 
-    return accepted_scenes
+    return ModelJSONResponse(accepted_scenes)
 
 
-@router.patch("/{field_id}/schedule", response_model=FieldResponse)
+@router.patch(
+    "/{field_id}/schedule",
+    response_model=None,
+    responses={200: {"model": FieldResponse | FieldWithoutGeometryResponse}},
+)
 def update_field_schedule(
     field_id: UUID,
     payload: FieldScheduleUpdateRequest,
+    include_geometry: bool = Query(default=True),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> FieldResponse:
-    field = db.get(Field, field_id)
-    if field is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-
-    farm = _farm_with_role_check(db, field.farm_id, current_user.id, RoleEnum.ANALYST)
-    _ = farm
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    field = require_field_role(
+        field_id, current_user.id, db, minimum=RoleEnum.ANALYST, defer_geometry=not include_geometry
+    )
 
     metadata = dict(field.metadata_json or {})
     metadata["schedule"] = {
@@ -347,27 +488,22 @@ def update_field_schedule(
     }
     field.metadata_json = metadata
     db.commit()
-    return _field_response(field)
+    invalidate(FIELD_LIST_CACHE_NAMESPACE)
+    return ModelJSONResponse(_field_response(field, include_geometry=include_geometry))
 
 
-@router.post("/{field_id}/analyses", response_model=AnalysisJobResponse)
+@router.post("/{field_id}/analyses", response_model=None, responses={200: {"model": AnalysisJobResponse}})
 def create_analysis(
     field_id: UUID,
-    payload: AnalysisCreateRequest,
+    background_tasks: BackgroundTasks,
+    # A plain union is not inferred as a body; Body() keeps it in the JSON payload.
+    payload: AnalysisCreateRequest = Body(),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> AnalysisJobResponse:
-    field = db.get(Field, field_id)
-    if field is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Farm not found")
+    current_user: CurrentUser = Depends(get_current_user),
+    settings: Settings = Depends(get_settings),
+) -> Response:
+    field = require_field_role(field_id, current_user.id, db, minimum=RoleEnum.ANALYST)
 
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db, minimum=RoleEnum.ANALYST)
-
-    settings = get_settings()
     queue_name = "analysis_cpu"
     if (
         payload.include_sr
@@ -387,6 +523,7 @@ def create_analysis(
             "date_to": payload.date_to.isoformat() if payload.date_to else None,
             "max_cloud": payload.max_cloud,
             "include_sr": payload.include_sr,
+            "include_sr_visualization": payload.include_sr_visualization,
             "include_radar_overlay": payload.include_radar_overlay,
         },
         result_json={},
@@ -394,115 +531,137 @@ def create_analysis(
     db.add(job)
     db.commit()
 
-    celery_client.send_task("worker.tasks.run_analysis_task", args=[str(job.id)], queue=queue_name)
+    # Publish after the response is sent; the job row is already durable.
+    background_tasks.add_task(
+        celery_client.send_task,
+        "worker.tasks.run_analysis_task",
+        kwargs={"job_id": str(job.id)},
+        queue=queue_name,
+    )
 
-    return AnalysisJobResponse(id=str(job.id), status=job.status.value, queue=job.queue)
+    return ModelJSONResponse(
+        AnalysisJobResponse.model_construct(id=str(job.id), status=job.status.value, queue=job.queue)
+    )
 
 
-@router.get("/{field_id}/analyses/{job_id}", response_model=AnalysisJobResponse)
+@router.get("/{field_id}/analyses/{job_id}", response_model=None, responses={200: {"model": AnalysisJobResponse}})
 def get_analysis_job(
     field_id: UUID,
     job_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> AnalysisJobResponse:
-    field = db.get(Field, field_id)
-    if field is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Farm not found")
-
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db, minimum=RoleEnum.VIEWER)
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    field = require_field_role(field_id, current_user.id, db, minimum=RoleEnum.VIEWER)
 
     job = db.get(AnalysisJob, job_id)
     if job is None or job.field_id != field.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Analysis job not found")
 
-    return AnalysisJobResponse(
-        id=str(job.id),
-        status=job.status.value,
-        queue=job.queue,
-        error_message=job.error_message,
-        result_json=job.result_json if isinstance(job.result_json, dict) else None,
+    return ModelJSONResponse(
+        AnalysisJobResponse.model_construct(
+            id=str(job.id),
+            status=job.status.value,
+            queue=job.queue,
+            error_message=job.error_message,
+            result_json=job.result_json if isinstance(job.result_json, dict) else None,
+        )
     )
 
 
-@router.get("/{field_id}/timeseries", response_model=TimeSeriesResponse)
-def get_timeseries(
-    field_id: UUID,
-    index: str | None = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> TimeSeriesResponse:
-    field = db.get(Field, field_id)
-    if field is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Farm not found")
+_TIMESERIES_COLUMNS = (
+    Observation.id,
+    Observation.observed_on,
+    Observation.status,
+    Observation.cloud_cover,
+    Observation.valid_pixel_ratio,
+)
+_TIMESERIES_ALL_INDICES = (
+    select(*_TIMESERIES_COLUMNS, Observation.indices_native, Observation.indices_sr)
+    .where(Observation.field_id == bindparam("field_id"))
+    .order_by(Observation.observed_on.asc())
+)
+# With an index filter only that key leaves the database (JSONB ->), not the
+# whole indices documents.
+_TIMESERIES_ONE_INDEX = (
+    select(
+        *_TIMESERIES_COLUMNS,
+        Observation.indices_native[bindparam("index", type_=String)].label("indices_native"),
+        Observation.indices_sr[bindparam("index", type_=String)].label("indices_sr"),
+    )
+    .where(Observation.field_id == bindparam("field_id"))
+    .order_by(Observation.observed_on.asc())
+)
 
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db, minimum=RoleEnum.VIEWER)
 
-    observations = (
-        db.query(Observation)
-        .filter(Observation.field_id == field.id)
-        .order_by(Observation.observed_on.asc())
-        .all()
-    )
-    points: list[TimeSeriesPoint] = []
-    for obs in observations:
-        native = obs.indices_native
-        sr = obs.indices_sr
+def _timeseries_body(db: Session, field_id: UUID, index: str | None) -> bytes:
+    """Serialize a field's timeline straight from row tuples; no ORM or model instances."""
+    if index:
+        rows = db.execute(_TIMESERIES_ONE_INDEX, {"field_id": field_id, "index": index}).all()
+    else:
+        rows = db.execute(_TIMESERIES_ALL_INDICES, {"field_id": field_id}).all()
+
+    points = []
+    for row in rows:
+        native = row.indices_native
+        sr = row.indices_sr
         if index:
-            native = {index: native.get(index)} if native.get(index) else {}
-            sr = {index: sr.get(index)} if sr.get(index) else {}
+            native = {index: native} if native else {}
+            sr = {index: sr} if sr else {}
         points.append(
-            TimeSeriesPoint(
-                id=str(obs.id),
-                observed_on=obs.observed_on,
-                status=obs.status.value,
-                cloud_cover=obs.cloud_cover,
-                valid_pixel_ratio=obs.valid_pixel_ratio,
-                indices_native=native,
-                indices_sr=sr,
-            )
+            {
+                "id": row.id,
+                "observed_on": row.observed_on,
+                "status": row.status,
+                "cloud_cover": row.cloud_cover,
+                "valid_pixel_ratio": row.valid_pixel_ratio,
+                "indices_native": native,
+                "indices_sr": sr,
+            }
         )
-    return TimeSeriesResponse(field_id=str(field.id), points=points)
+    return orjson.dumps({"field_id": field_id, "points": points})
 
 
-@router.delete("/{field_id}/timeseries", response_model=TimelineClearResponse)
-def clear_timeseries(
+@router.get("/{field_id}/timeseries", response_model=None, responses={200: {"model": TimeSeriesResponse}})
+def get_timeseries(
     field_id: UUID,
+    index: str | None = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> TimelineClearResponse:
-    field = db.get(Field, field_id)
-    if field is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Farm not found")
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    field = require_field_role(field_id, current_user.id, db, minimum=RoleEnum.VIEWER)
+
+    def build() -> bytes:
+        return _timeseries_body(db, field.id, index)
+
+    return cached_json_response(
+        timeseries_cache_namespace(field.id),
+        key_parts=(index or "*",),
+        ttl_seconds=_TIMESERIES_CACHE_TTL_SECONDS,
+        produce=build,
+    )
 
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db, minimum=RoleEnum.ANALYST)
 
-    deleted_layer_assets = db.query(LayerAsset).filter(LayerAsset.field_id == field.id).delete(synchronize_session=False)
-    deleted_observations = db.query(Observation).filter(Observation.field_id == field.id).delete(synchronize_session=False)
-    deleted_analysis_jobs = db.query(AnalysisJob).filter(AnalysisJob.field_id == field.id).delete(synchronize_session=False)
-    deleted_scene_candidates = db.query(SceneCandidate).filter(SceneCandidate.field_id == field.id).delete(
-        synchronize_session=False
-    )
+@router.delete("/{field_id}/timeseries", response_model=None, responses={200: {"model": TimelineClearResponse}})
+def clear_timeseries(
+    field_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    field = require_field_role(field_id, current_user.id, db, minimum=RoleEnum.ANALYST)
+
+    counts = db.execute(_CLEAR_TIMESERIES, {"field_id": field.id}).one()
+    deleted_layer_assets, deleted_observations, deleted_analysis_jobs, deleted_scene_candidates = counts
     db.commit()
+    invalidate(timeseries_cache_namespace(field.id))
 
     deleted_total = deleted_observations + deleted_scene_candidates + deleted_analysis_jobs + deleted_layer_assets
-    return TimelineClearResponse(
-        field_id=str(field.id),
-        deleted_observations=deleted_observations,
-        deleted_scene_candidates=deleted_scene_candidates,
-        deleted_analysis_jobs=deleted_analysis_jobs,
-        deleted_layer_assets=deleted_layer_assets,
-        deleted_total=deleted_total,
+    return ModelJSONResponse(
+        TimelineClearResponse.model_construct(
+            field_id=str(field.id),
+            deleted_observations=deleted_observations,
+            deleted_scene_candidates=deleted_scene_candidates,
+            deleted_analysis_jobs=deleted_analysis_jobs,
+            deleted_layer_assets=deleted_layer_assets,
+            deleted_total=deleted_total,
+        )
     )
@@ -1,16 +1,21 @@
+import asyncio
 import io
+import secrets
 from uuid import UUID
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
 from PIL import Image
+from sqlalchemy import Row, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
-from app.deps import get_current_user, require_org_role
-from app.db.session import get_db
-from app.models import Farm, Field, LayerAsset, User
+from app.deps import CALLER_MEMBERSHIP_JOIN, CurrentUser, check_role, get_current_user
+from app.db.session import get_async_db, get_db
+from app.models import Farm, Field, LayerAsset, Membership
 from app.schemas import LayerMetadataResponse
 from app.services.storage import create_presigned_get_url
 
@@ -25,26 +30,80 @@ INDEX_COLORMAPS = {
     "SAVI": "ylgn",
 }
 
+_LAYER_WITH_ROLE = (
+    select(LayerAsset, Membership.role)
+    .join(Field, Field.id == LayerAsset.field_id)
+    .join(Farm, Farm.id == Field.farm_id)
+    .outerjoin(Membership, CALLER_MEMBERSHIP_JOIN)
+    .where(LayerAsset.id == bindparam("layer_id"))
+)
+
+
+def _build_empty_tile_png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGBA", (256, 256), (0, 0, 0, 0)).save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+# Transparent tile for requests outside the layer bounds, encoded once at import.
+_EMPTY_TILE_PNG = _build_empty_tile_png()
+_EMPTY_TILE_HEADERS = {"Cache-Control": "public, max-age=86400"}
+_MAX_BATCH_TILES = 32
+
+
+# Tiler base URL resolved once; render_tile only formats the z/x/y suffix.
+_TILE_ENDPOINT_PREFIX = f"{get_settings().tiler_internal_url.rstrip('/')}/cog/tiles/WebMercatorQuad"
+
+
+# One pooled client for all tile fetches so connections to the tiler are kept
+# alive between requests; opened and closed by the app lifespan.
+def create_tiler_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=45.0,
+        limits=httpx.Limits(max_connections=400, max_keepalive_connections=200),
+    )
+
+
+def get_tiler_client(request: Request) -> httpx.AsyncClient:
+    return request.app.state.tiler_client
+
+
+def _authorized_layer(row: Row | None) -> LayerAsset:
+    if row is None:
+        raise HTTPException(status_code=404, detail="Layer not found")
+    layer, role = row
+    check_role(role)
+    return layer
+
+
+def _tiler_params(layer: LayerAsset) -> dict[str, str]:
+    if not layer.source_uri:
+        raise HTTPException(status_code=404, detail="Layer source is missing")
+
+    params: dict[str, str] = {"url": create_presigned_get_url(layer.source_uri, expires_seconds=900)}
+    if layer.index_name:
+        params["rescale"] = "-1,1"
+        colormap = INDEX_COLORMAPS.get(layer.index_name.upper())
+        if colormap:
+            params["colormap_name"] = colormap
+    return params
+
+
+def _is_outside_bounds(response: httpx.Response) -> bool:
+    return response.status_code == 404 and "outside bounds" in response.text.lower()
+
+
+def _layer_with_role_check(db: Session, layer_id: UUID, user_id: UUID) -> LayerAsset:
+    return _authorized_layer(db.execute(_LAYER_WITH_ROLE, {"layer_id": layer_id, "user_id": user_id}).one_or_none())
+
 
 @router.get("/layers/{layer_id}/metadata", response_model=LayerMetadataResponse)
 def get_layer_metadata(
     layer_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> LayerMetadataResponse:
-    layer = db.get(LayerAsset, layer_id)
-    if layer is None:
-        raise HTTPException(status_code=404, detail="Layer not found")
-
-    field = db.get(Field, layer.field_id)
-    if field is None:
-        raise HTTPException(status_code=404, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=404, detail="Farm not found")
-
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db)
+    layer = _layer_with_role_check(db, layer_id, current_user.id)
 
     metadata_json = layer.metadata_json or {}
     provenance = "MODEL_DERIVED" if layer.is_model_derived else "NATIVE"
@@ -75,61 +134,109 @@ def get_layer_metadata(
 
 
 @router.get("/tiles/{layer_id}/{z}/{x}/{y}.png")
-def render_tile(
+async def render_tile(
     layer_id: UUID,
     z: int,
     x: int,
     y: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    tiler: httpx.AsyncClient = Depends(get_tiler_client),
 ):
-    settings = get_settings()
-    layer = db.get(LayerAsset, layer_id)
-    if layer is None:
-        raise HTTPException(status_code=404, detail="Layer not found")
+    result = await db.execute(_LAYER_WITH_ROLE, {"layer_id": layer_id, "user_id": current_user.id})
+    layer = _authorized_layer(result.one_or_none())
 
-    field = db.get(Field, layer.field_id)
-    if field is None:
-        raise HTTPException(status_code=404, detail="Field not found")
-
-    farm = db.get(Farm, field.farm_id)
-    if farm is None:
-        raise HTTPException(status_code=404, detail="Farm not found")
-
-    require_org_role(org_id=farm.organization_id, user_id=current_user.id, db=db)
-
-    if not layer.source_uri:
-        raise HTTPException(status_code=404, detail="Layer source is missing")
-
-    tiler_url = settings.tiler_internal_url.rstrip("/")
-    endpoint = f"{tiler_url}/cog/tiles/WebMercatorQuad/{z}/{x}/{y}.png"
-    source_url = create_presigned_get_url(layer.source_uri, expires_seconds=900)
-    params: dict[str, str] = {"url": source_url}
-
-    if layer.index_name:
-        params["rescale"] = "-1,1"
-        colormap = INDEX_COLORMAPS.get(layer.index_name.upper())
-        if colormap:
-            params["colormap_name"] = colormap
+    params = _tiler_params(layer)
+    endpoint = f"{_TILE_ENDPOINT_PREFIX}/{z}/{x}/{y}.png"
 
     try:
-        response = httpx.get(endpoint, params=params, timeout=45.0)
+        response = await tiler.send(tiler.build_request("GET", endpoint, params=params), stream=True)
     except httpx.HTTPError as exc:
         raise HTTPException(status_code=502, detail=f"Tiler unavailable: {exc}") from exc
 
-    if response.status_code == 404 and "outside bounds" in response.text.lower():
-        empty = io.BytesIO()
-        Image.new("RGBA", (256, 256), (0, 0, 0, 0)).save(empty, format="PNG")
-        empty.seek(0)
-        return StreamingResponse(empty, media_type="image/png")
-
     if response.status_code != 200:
+        # Error bodies are small; read them fully before releasing the connection.
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+
+        if _is_outside_bounds(response):
+            return Response(content=_EMPTY_TILE_PNG, media_type="image/png", headers=_EMPTY_TILE_HEADERS)
+
         raise HTTPException(
             status_code=502,
             detail=f"Tiler failed ({response.status_code}): {response.text[:300]}",
         )
 
-    output = io.BytesIO(response.content)
-    output.seek(0)
     media_type = response.headers.get("content-type", "image/png")
-    return StreamingResponse(output, media_type=media_type)
+    return StreamingResponse(
+        response.aiter_bytes(chunk_size=16384),
+        media_type=media_type,
+        background=BackgroundTask(response.aclose),
+    )
+
+
+def _parse_tile_coords(coords: str) -> list[tuple[int, int, int]]:
+    tiles: list[tuple[int, int, int]] = []
+    for item in coords.split(","):
+        try:
+            z, x, y = (int(part) for part in item.strip().split("/"))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid tile coordinate: {item!r}") from exc
+        tiles.append((z, x, y))
+    if len(tiles) > _MAX_BATCH_TILES:
+        raise HTTPException(status_code=400, detail=f"At most {_MAX_BATCH_TILES} tiles per batch")
+    return tiles
+
+
+async def _fetch_tile_part(
+    tiler: httpx.AsyncClient, z: int, x: int, y: int, params: dict[str, str]
+) -> tuple[int, str, bytes]:
+    """(status, content type, body) for one tile; failures become error parts, not a failed batch."""
+    try:
+        response = await tiler.get(f"{_TILE_ENDPOINT_PREFIX}/{z}/{x}/{y}.png", params=params)
+    except httpx.HTTPError as exc:
+        return 502, "text/plain", f"Tiler unavailable: {exc}".encode()
+    if response.status_code == 200:
+        return 200, response.headers.get("content-type", "image/png"), response.content
+    if _is_outside_bounds(response):
+        return 200, "image/png", _EMPTY_TILE_PNG
+    return 502, "text/plain", f"Tiler failed ({response.status_code}): {response.text[:300]}".encode()
+
+
+def _multipart_body(boundary: str, parts: list[tuple[str, int, str, bytes]]) -> bytes:
+    chunks: list[bytes] = []
+    for location, status_code, content_type, body in parts:
+        chunks.append(
+            f"--{boundary}\r\nContent-Type: {content_type}\r\nContent-Location: {location}\r\n"
+            f"X-Tile-Status: {status_code}\r\nContent-Length: {len(body)}\r\n\r\n".encode("ascii")
+        )
+        chunks.append(body)
+        chunks.append(b"\r\n")
+    chunks.append(f"--{boundary}--\r\n".encode("ascii"))
+    return b"".join(chunks)
+
+
+@router.get("/tiles/{layer_id}/batch")
+async def render_tile_batch(
+    layer_id: UUID,
+    coords: str = Query(..., description="Comma-separated z/x/y tile coordinates"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    tiler: httpx.AsyncClient = Depends(get_tiler_client),
+) -> Response:
+    """Several tiles of one layer in a single multipart/mixed response.
+
+    Authorization and URL signing happen once; tiles are fetched from the tiler
+    concurrently over the pooled client. Each part carries its ``z/x/y`` in
+    ``Content-Location`` and its own ``X-Tile-Status``.
+    """
+    tiles = _parse_tile_coords(coords)
+    result = await db.execute(_LAYER_WITH_ROLE, {"layer_id": layer_id, "user_id": current_user.id})
+    params = _tiler_params(_authorized_layer(result.one_or_none()))
+
+    fetched = await asyncio.gather(*(_fetch_tile_part(tiler, z, x, y, params) for z, x, y in tiles))
+    boundary = secrets.token_hex(16)
+    parts = [(f"{z}/{x}/{y}", *part) for (z, x, y), part in zip(tiles, fetched)]
+    return Response(content=_multipart_body(boundary, parts), media_type=f"multipart/mixed; boundary={boundary}")
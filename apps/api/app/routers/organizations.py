@@ -1,13 +1,18 @@
-import secrets
+import uuid
 from datetime import datetime, timedelta, timezone
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Select, bindparam, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.deps import get_current_user, require_org_role
-from app.db.session import get_db
-from app.models import FeatureFlag, Invite, Membership, Organization, RoleEnum, User
+from app.core.responses import APIJSONResponse
+from app.core.security import generate_url_token
+from app.deps import CurrentUser, get_current_user, invalidate_user_orgs, require_org_role_async
+from app.db.session import get_async_db
+from app.models import FeatureFlag, Invite, Membership, Organization, RoleEnum
 from app.schemas import (
     FeatureFlagResponse,
     FeatureFlagUpdateRequest,
@@ -16,82 +21,138 @@ from app.schemas import (
     OrganizationCreateRequest,
     OrganizationResponse,
 )
+from app.services.pagination import NEXT_CURSOR_HEADER, encode_key_cursor, parse_key_cursor
 
+# Handlers return plain dicts serialized by the app's APIJSONResponse; the
+# response models stay in the OpenAPI schema via responses= only.
 router = APIRouter(prefix="/orgs", tags=["organizations"])
 
+_INVITE_TTL = timedelta(days=7)
 
-@router.post("", response_model=OrganizationResponse)
-def create_organization(
+# Keyset page of flags by key; the first page binds after="" (keys are never empty).
+_FEATURE_FLAG_ROWS = (
+    select(FeatureFlag.key, FeatureFlag.enabled)
+    .where(FeatureFlag.organization_id == bindparam("org_id"), FeatureFlag.key > bindparam("after"))
+    .order_by(FeatureFlag.key.asc())
+    .limit(bindparam("limit"))
+)
+
+# Insert-or-update in one statement; the (organization_id, key) unique
+# constraint arbitrates concurrent writers.
+_UPSERT_FEATURE_FLAG = (
+    insert(FeatureFlag)
+    .values(organization_id=bindparam("org_id"), key=bindparam("key"), enabled=bindparam("enabled"))
+    .on_conflict_do_update(
+        constraint="uq_feature_flags_org_key",
+        set_={"enabled": bindparam("enabled"), "updated_at": func.now()},
+    )
+    .returning(FeatureFlag.key, FeatureFlag.enabled)
+)
+
+
+def _build_create_organization_statement() -> Select:
+    # Organization and its owner membership in one round trip. A taken name
+    # inserts nothing, so the membership insert selects no row either and the
+    # statement returns no rows.
+    new_org = (
+        insert(Organization)
+        .values(id=bindparam("org_id"), name=bindparam("name"), created_by_id=bindparam("user_id"))
+        .on_conflict_do_nothing(index_elements=[Organization.name])
+        .returning(Organization.id, Organization.name, Organization.created_at)
+        .cte("new_org")
+    )
+    owner_membership = (
+        insert(Membership)
+        .from_select(
+            ["id", "organization_id", "user_id", "role"],
+            select(
+                bindparam("membership_id", type_=Membership.id.type),
+                new_org.c.id,
+                bindparam("user_id", type_=Membership.user_id.type),
+                literal(RoleEnum.OWNER, Membership.role.type),
+            ),
+        )
+        .cte("owner_membership")
+    )
+    return select(new_org.c.id, new_org.c.name, new_org.c.created_at).add_cte(owner_membership)
+
+
+_CREATE_ORGANIZATION = _build_create_organization_statement()
+
+
+@router.post("", response_model=None, responses={200: {"model": OrganizationResponse}})
+async def create_organization(
     payload: OrganizationCreateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> OrganizationResponse:
-    existing = db.query(Organization).filter(Organization.name == payload.name).one_or_none()
-    if existing:
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> dict[str, Any]:
+    params = {
+        "org_id": uuid.uuid4(),
+        "membership_id": uuid.uuid4(),
+        "name": payload.name,
+        "user_id": current_user.id,
+    }
+    org = (await db.execute(_CREATE_ORGANIZATION, params)).one_or_none()
+    if org is None:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Organization name already exists")
+    await db.commit()
+    invalidate_user_orgs(current_user.id)
+    return {"id": str(org.id), "name": org.name, "created_at": org.created_at}
 
-    org = Organization(name=payload.name, created_by_id=current_user.id)
-    db.add(org)
-    db.flush()
-    db.add(Membership(organization_id=org.id, user_id=current_user.id, role=RoleEnum.OWNER))
-    db.commit()
-    return OrganizationResponse(id=str(org.id), name=org.name, created_at=org.created_at)
 
-
-@router.post("/{org_id}/invites", response_model=InviteResponse)
-def create_invite(
+@router.post("/{org_id}/invites", response_model=None, responses={200: {"model": InviteResponse}})
+async def create_invite(
     org_id: UUID,
     payload: InviteCreateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> InviteResponse:
-    require_org_role(org_id=org_id, user_id=current_user.id, db=db, minimum=RoleEnum.ADMIN)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> dict[str, Any]:
+    await require_org_role_async(org_id=org_id, current_user=current_user, db=db, minimum=RoleEnum.ADMIN)
 
     invite = Invite(
         organization_id=org_id,
-        email=payload.email.lower(),
+        email=payload.email,
         role=payload.role,
-        token=secrets.token_urlsafe(32),
-        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+        token=generate_url_token(),
+        expires_at=datetime.now(timezone.utc) + _INVITE_TTL,
     )
     db.add(invite)
-    db.commit()
-    return InviteResponse(
-        id=str(invite.id),
-        email=invite.email,
-        role=invite.role,
-        status=invite.status.value,
-        expires_at=invite.expires_at,
-    )
+    await db.commit()
+    return {
+        "id": str(invite.id),
+        "email": invite.email,
+        "role": invite.role.value,
+        "status": invite.status.value,
+        "expires_at": invite.expires_at,
+    }
 
 
-@router.get("/{org_id}/feature-flags", response_model=list[FeatureFlagResponse])
-def list_feature_flags(
+@router.get("/{org_id}/feature-flags", response_model=None, responses={200: {"model": list[FeatureFlagResponse]}})
+async def list_feature_flags(
     org_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> list[FeatureFlagResponse]:
-    require_org_role(org_id=org_id, user_id=current_user.id, db=db, minimum=RoleEnum.ADMIN)
-    flags = db.query(FeatureFlag).filter(FeatureFlag.organization_id == org_id).order_by(FeatureFlag.key.asc()).all()
-    return [FeatureFlagResponse(key=flag.key, enabled=flag.enabled) for flag in flags]
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=200, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> Response:
+    await require_org_role_async(org_id=org_id, current_user=current_user, db=db, minimum=RoleEnum.ADMIN)
+    after = parse_key_cursor(cursor) if cursor else ""
+    rows = (await db.execute(_FEATURE_FLAG_ROWS, {"org_id": org_id, "after": after, "limit": limit})).all()
+    headers = {NEXT_CURSOR_HEADER: encode_key_cursor(rows[-1].key)} if len(rows) == limit else None
+    # Returned as a response so FastAPI skips jsonable_encoder; orjson encodes the dicts directly.
+    return APIJSONResponse([{"key": key, "enabled": enabled} for key, enabled in rows], headers=headers)
 
 
-@router.put("/{org_id}/feature-flags/{key}", response_model=FeatureFlagResponse)
-def update_feature_flag(
+@router.put("/{org_id}/feature-flags/{key}", response_model=None, responses={200: {"model": FeatureFlagResponse}})
+async def update_feature_flag(
     org_id: UUID,
     key: str,
     payload: FeatureFlagUpdateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> FeatureFlagResponse:
-    require_org_role(org_id=org_id, user_id=current_user.id, db=db, minimum=RoleEnum.ADMIN)
-
-    flag = db.query(FeatureFlag).filter(FeatureFlag.organization_id == org_id, FeatureFlag.key == key).one_or_none()
-    if flag is None:
-        flag = FeatureFlag(organization_id=org_id, key=key, enabled=payload.enabled)
-        db.add(flag)
-    else:
-        flag.enabled = payload.enabled
-    db.commit()
-
-    return FeatureFlagResponse(key=flag.key, enabled=flag.enabled)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> dict[str, Any]:
+    await require_org_role_async(org_id=org_id, current_user=current_user, db=db, minimum=RoleEnum.ADMIN)
+
+    flag = (await db.execute(_UPSERT_FEATURE_FLAG, {"org_id": org_id, "key": key, "enabled": payload.enabled})).one()
+    await db.commit()
+    return {"key": flag.key, "enabled": flag.enabled}
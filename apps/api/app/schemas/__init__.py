@@ -4,12 +4,15 @@ from app.schemas.export import ExportCreateRequest, ExportJobResponse
 from app.schemas.feature_flag import FeatureFlagResponse, FeatureFlagUpdateRequest
 from app.schemas.farm import FarmCreateRequest, FarmResponse
 from app.schemas.field import (
+    AnalysisByDateRequest,
+    AnalysisBySceneRequest,
     AnalysisCreateRequest,
     AnalysisJobResponse,
     FieldCreateRequest,
     FieldResponse,
     FieldScheduleUpdateRequest,
     FieldUpdateRequest,
+    FieldWithoutGeometryResponse,
     ImagerySearchResponse,
     TimelineClearResponse,
     TimeSeriesPoint,
@@ -21,6 +24,8 @@ from app.schemas.organization import InviteCreateRequest, InviteResponse, Organi
 __all__ = [
     "AlertResponse",
     "AlertsClearResponse",
+    "AnalysisByDateRequest",
+    "AnalysisBySceneRequest",
     "AnalysisCreateRequest",
     "AnalysisJobResponse",
     "ExportCreateRequest",
@@ -33,6 +38,7 @@ __all__ = [
     "FieldResponse",
     "FieldScheduleUpdateRequest",
     "FieldUpdateRequest",
+    "FieldWithoutGeometryResponse",
     "ImagerySearchResponse",
     "InviteCreateRequest",
     "InviteResponse",
@@ -1,13 +1,18 @@
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from app.models import AlertSeverityEnum
 
 
 class AlertResponse(BaseModel):
-    id: str
-    organization_id: str
-    field_id: str | None
-    severity: str
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    id: UUID
+    organization_id: UUID
+    field_id: UUID | None
+    severity: AlertSeverityEnum
     category: str
     message: str
     acknowledged_at: datetime | None
@@ -15,4 +20,6 @@ class AlertResponse(BaseModel):
 
 
 class AlertsClearResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     deleted_alerts: int
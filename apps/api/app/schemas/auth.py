@@ -1,28 +1,52 @@
-from pydantic import BaseModel, EmailStr, Field
+from typing import Any
 
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic.dataclasses import dataclass
 
-class RegisterRequest(BaseModel):
+
+def _lowercase_email(value: Any) -> Any:
+    # Emails are stored lowercased (ck_users_email_lowercase); normalize at parse time.
+    return value.lower() if isinstance(value, str) else value
+
+
+# Request bodies of the auth hot path are slotted dataclasses: validated like
+# models, but instances carry no __dict__ or pydantic bookkeeping.
+_REQUEST_CONFIG = ConfigDict(extra="ignore")
+
+
+@dataclass(frozen=True, slots=True, config=_REQUEST_CONFIG)
+class RegisterRequest:
     email: EmailStr
     password: str = Field(min_length=8)
     full_name: str | None = None
 
+    _normalize_email = field_validator("email", mode="before")(_lowercase_email)
 
-class LoginRequest(BaseModel):
+
+@dataclass(frozen=True, slots=True, config=_REQUEST_CONFIG)
+class LoginRequest:
     email: EmailStr
     password: str
 
+    _normalize_email = field_validator("email", mode="before")(_lowercase_email)
+
 
-class TokenRefreshRequest(BaseModel):
+@dataclass(frozen=True, slots=True, config=_REQUEST_CONFIG)
+class TokenRefreshRequest:
     refresh_token: str
 
 
 class TokenResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
 
 
 class UserResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     email: EmailStr
     full_name: str | None
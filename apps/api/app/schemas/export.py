@@ -1,10 +1,12 @@
-from pydantic import BaseModel
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
 
 from app.models import ExportFormatEnum
 
 
 class ExportCreateRequest(BaseModel):
-    field_id: str
+    field_id: UUID
     format: ExportFormatEnum
     layer_id: str | None = None
     index_name: str | None = None
@@ -13,6 +15,8 @@ class ExportCreateRequest(BaseModel):
 
 
 class ExportJobResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     status: str
     format: str
@@ -1,15 +1,18 @@
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FarmCreateRequest(BaseModel):
-    organization_id: str
+    organization_id: UUID
     name: str = Field(min_length=2, max_length=255)
     description: str | None = None
 
 
 class FarmResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     organization_id: str
     name: str
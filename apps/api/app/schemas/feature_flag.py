@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class FeatureFlagResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     key: str
     enabled: bool
 
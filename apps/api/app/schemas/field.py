@@ -1,13 +1,14 @@
 from datetime import date, datetime
 from typing import Annotated, Any
+from uuid import UUID
 
-from pydantic import BaseModel, Field, StringConstraints
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, StringConstraints, Tag
 
 FieldName = Annotated[str, StringConstraints(strip_whitespace=False, min_length=0, max_length=255)]
 
 
 class FieldCreateRequest(BaseModel):
-    farm_id: str
+    farm_id: UUID
     name: FieldName
     geometry: dict[str, Any]
 
@@ -18,6 +19,8 @@ class FieldUpdateRequest(BaseModel):
 
 
 class FieldResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     farm_id: str
     name: str
@@ -26,7 +29,21 @@ class FieldResponse(BaseModel):
     schedule: dict[str, Any] | None = None
 
 
+class FieldWithoutGeometryResponse(BaseModel):
+    """Field PATCH response when the caller opts out with ``include_geometry=false``."""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    id: str
+    farm_id: str
+    name: str
+    area_ha: float
+    schedule: dict[str, Any] | None = None
+
+
 class ImagerySearchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     scene_id: str
     acquisition_date: datetime
     cloud_cover: float | None = None
@@ -45,16 +62,41 @@ class FieldScheduleUpdateRequest(BaseModel):
     frequency: str = Field(default="daily", pattern="^(daily|weekly)$")
 
 
-class AnalysisCreateRequest(BaseModel):
-    scene_id: str | None = None
+class _AnalysisRequestBase(BaseModel):
+    # The date window also bounds the scene search when a scene is requested.
     date_from: date | None = None
     date_to: date | None = None
     max_cloud: float | None = Field(default=20.0, ge=0, le=100)
     include_sr: bool = False
+    # With SR analytics disabled for the organization, False skips SR inference.
+    include_sr_visualization: bool = True
     include_radar_overlay: bool = True
 
 
+class AnalysisBySceneRequest(_AnalysisRequestBase):
+    scene_id: str
+
+
+class AnalysisByDateRequest(_AnalysisRequestBase):
+    scene_id: None = None
+
+
+def _analysis_mode(value: Any) -> str:
+    scene_id = value.get("scene_id") if isinstance(value, dict) else getattr(value, "scene_id", None)
+    return "date" if scene_id is None else "scene"
+
+
+# Clients keep sending the same flat body; the tag is derived from scene_id so
+# validation runs exactly one variant.
+AnalysisCreateRequest = Annotated[
+    Annotated[AnalysisBySceneRequest, Tag("scene")] | Annotated[AnalysisByDateRequest, Tag("date")],
+    Discriminator(_analysis_mode),
+]
+
+
 class AnalysisJobResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     status: str
     queue: str
@@ -63,6 +105,8 @@ class AnalysisJobResponse(BaseModel):
 
 
 class TimeSeriesPoint(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     observed_on: date
     status: str
@@ -73,11 +117,15 @@ class TimeSeriesPoint(BaseModel):
 
 
 class TimeSeriesResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     field_id: str
     points: list[TimeSeriesPoint]
 
 
 class TimelineClearResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     field_id: str
     deleted_observations: int
     deleted_scene_candidates: int
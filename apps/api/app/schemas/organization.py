@@ -1,26 +1,45 @@
 from datetime import datetime
+from functools import lru_cache
+from typing import Annotated
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field
+from pydantic.networks import validate_email
 
 from app.models import RoleEnum
 
 
+# Same check as EmailStr, memoized so repeat addresses in bulk invites skip
+# email-validator. The whole address is lowercased to match how users' emails
+# are stored (ck_users_email_lowercase).
+@lru_cache(maxsize=4096)
+def _normalize_invite_email(value: str) -> str:
+    _, email = validate_email(value)
+    return email.lower()
+
+
+InviteEmail = Annotated[str, AfterValidator(_normalize_invite_email)]
+
+
 class OrganizationCreateRequest(BaseModel):
     name: str = Field(min_length=2, max_length=255)
 
 
 class OrganizationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     name: str
     created_at: datetime
 
 
 class InviteCreateRequest(BaseModel):
-    email: EmailStr
+    email: InviteEmail
     role: RoleEnum
 
 
 class InviteResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     email: EmailStr
     role: RoleEnum
@@ -1,10 +1,44 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
+from collections.abc import Sequence
 
+import numpy as np
+from sqlalchemy import Select, bindparam, func, select
 from sqlalchemy.orm import Session
 
-from app.models import AlertEvent, AlertSeverityEnum, Field, Observation
+from app.models import AlertEvent, AlertSeverityEnum, Observation
+
+NDVI_DROP_THRESHOLD = 0.20
+NDVI_BASELINE_WINDOW = 5
+
+
+def _build_recent_ndvi_means_statement() -> Select:
+    # NDVI means of each field's latest observations, extracted by Postgres,
+    # newest first per field. Served by ix_observations_field_observed_on.
+    ranked = (
+        select(
+            Observation.field_id,
+            Observation.indices_native[("NDVI", "stats", "mean")].as_float().label("ndvi_mean"),
+            func.row_number()
+            .over(partition_by=Observation.field_id, order_by=Observation.observed_on.desc())
+            .label("position"),
+        )
+        .where(
+            Observation.field_id.in_(bindparam("field_ids", expanding=True)),
+            Observation.id.not_in(bindparam("exclude_ids", expanding=True)),
+        )
+        .subquery()
+    )
+    return (
+        select(ranked.c.field_id, ranked.c.ndvi_mean)
+        .where(ranked.c.position <= bindparam("window"))
+        .order_by(ranked.c.field_id, ranked.c.position)
+    )
+
+
+_RECENT_NDVI_MEANS = _build_recent_ndvi_means_statement()
 
 
 def create_alert(
@@ -34,37 +68,56 @@ def create_alert(
 def maybe_create_ndvi_drop_alert(
     db: Session,
     organization_id: str,
-    field: Field,
     current_observation: Observation,
 ) -> None:
-    current_stats = current_observation.indices_native.get("NDVI", {}).get("stats") or {}
-    current_mean = current_stats.get("mean")
-    if current_mean is None:
+    maybe_create_ndvi_drop_alerts(db=db, organization_id=organization_id, observations=[current_observation])
+
+
+def _ndvi_mean(observation: Observation) -> float | None:
+    value = (observation.indices_native.get("NDVI", {}).get("stats") or {}).get("mean")
+    return None if value is None else float(value)
+
+
+def maybe_create_ndvi_drop_alerts(
+    db: Session,
+    organization_id: str,
+    observations: Sequence[Observation],
+) -> None:
+    """Alert on fields whose new NDVI mean is ``NDVI_DROP_THRESHOLD`` below their recent baseline.
+
+    The baseline is the mean of the latest three NDVI means among each field's
+    previous ``NDVI_BASELINE_WINDOW`` observations; all fields share one query.
+    """
+    current = [(obs, mean) for obs in observations if (mean := _ndvi_mean(obs)) is not None]
+    if not current:
         return
 
-    previous = (
-        db.query(Observation)
-        .filter(Observation.field_id == field.id, Observation.id != current_observation.id)
-        .order_by(Observation.observed_on.desc())
-        .limit(5)
-        .all()
+    history: dict[uuid.UUID, list[float]] = defaultdict(list)
+    rows = db.execute(
+        _RECENT_NDVI_MEANS,
+        {
+            "field_ids": [obs.field_id for obs, _ in current],
+            "exclude_ids": [obs.id for obs in observations],
+            "window": NDVI_BASELINE_WINDOW,
+        },
     )
-    prev_values: list[float] = []
-    for obs in previous:
-        value = (obs.indices_native.get("NDVI", {}).get("stats") or {}).get("mean")
-        if value is not None:
-            prev_values.append(float(value))
+    for field_id, ndvi_mean in rows:
+        if ndvi_mean is not None:
+            history[field_id].append(ndvi_mean)
 
-    if len(prev_values) < 3:
+    candidates = [(obs, mean) for obs, mean in current if len(history[obs.field_id]) >= 3]
+    if not candidates:
         return
+    baselines = np.array([history[obs.field_id][:3] for obs, _ in candidates]).mean(axis=1)
+    deltas = baselines - np.array([mean for _, mean in candidates])
 
-    baseline = sum(prev_values[:3]) / 3
-    delta = baseline - float(current_mean)
-    if delta >= 0.20:
+    for index in np.flatnonzero(deltas >= NDVI_DROP_THRESHOLD):
+        obs, current_mean = candidates[index]
+        baseline, delta = float(baselines[index]), float(deltas[index])
         create_alert(
             db=db,
             organization_id=organization_id,
-            field_id=str(field.id),
+            field_id=str(obs.field_id),
             severity=AlertSeverityEnum.WARN,
             category="NDVI_DROP",
             message=f"NDVI dropped by {delta:.2f} against recent baseline.",
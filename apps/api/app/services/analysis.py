@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import threading
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
+import shapely
 from affine import Affine
 from rasterio.io import MemoryFile
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
@@ -26,8 +33,13 @@ from app.models import (
 from app.services.alerts import create_alert, maybe_create_ndvi_drop_alert
 from app.services.feature_flags import is_enabled
 from app.services.geometry_db import to_shape_from_wkb
-from app.services.indices import available_indices_for_bands, compute_index_rasters, compute_indices, compute_valid_pixel_ratio
-from app.services.planetary_computer import PlanetaryComputerProvider, SceneResult, scene_field_coverage_ratio
+from app.services.indices import available_indices_for_bands, compute_valid_pixel_ratio, index_summary, iter_index_rasters
+from app.services.planetary_computer import (
+    SENTINEL1_SEARCH_LIMIT,
+    PlanetaryComputerProvider,
+    SceneResult,
+    scene_field_coverage_ratio,
+)
 from app.services.raster_processing import RasterProcessingError, read_scene_patch
 from app.services.storage import build_object_key, upload_bytes
 from app.services.sr_engine import SRInferenceError, SRRequest, build_sr_engine
@@ -38,6 +50,19 @@ def _default_dates() -> tuple[date, date]:
     return today - timedelta(days=30), today
 
 
+# Opening the STAC client fetches the catalog root; do it once per thread.
+# Providers (their HTTP session and SAS token cache) are not thread-safe, and
+# Celery threads and the search/upload pools all call into them.
+_pc_providers = threading.local()
+
+
+def _pc_provider() -> PlanetaryComputerProvider:
+    provider = getattr(_pc_providers, "provider", None)
+    if provider is None:
+        provider = _pc_providers.provider = PlanetaryComputerProvider()
+    return provider
+
+
 def search_field_imagery(
     db: Session,
     field: Field,
@@ -46,7 +71,7 @@ def search_field_imagery(
     max_cloud: float,
     collection: str = "sentinel-2-l2a",
 ) -> list[SceneResult]:
-    provider = PlanetaryComputerProvider()
+    provider = _pc_provider()
     geometry = to_shape_from_wkb(field.geometry)
     default_start, default_end = _default_dates()
     start = date_from or default_start
@@ -56,6 +81,58 @@ def search_field_imagery(
     return provider.search_sentinel2(geometry=geometry, date_from=start, date_to=end, max_cloud=max_cloud)
 
 
+# True-colour layers are rendered when red, green and blue are all present.
+_RGB_BANDS = frozenset({"B04", "B03", "B02"})
+
+# Radar overlays use Sentinel-1 scenes within this many days of the optical scene.
+_RADAR_WINDOW = timedelta(days=3)
+# Threads are started lazily, so prefork workers each get their own.
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="stac-search")
+
+
+@dataclass(frozen=True, slots=True)
+class _RadarSearch:
+    scenes: list[SceneResult]
+    date_from: date
+    date_to: date
+
+
+def _search_radar(geometry: BaseGeometry, date_from: date, date_to: date) -> _RadarSearch:
+    scenes = _pc_provider().search_sentinel1_rtc(geometry=geometry, date_from=date_from, date_to=date_to)
+    return _RadarSearch(scenes=scenes, date_from=date_from, date_to=date_to)
+
+
+def _radar_scenes_near(
+    db: Session,
+    field: Field,
+    center_date: date,
+    prefetched: Future[_RadarSearch] | None,
+) -> list[SceneResult]:
+    """Sentinel-1 scenes around ``center_date``, newest first.
+
+    Served from the search prefetched over the whole requested window when it
+    covers ``center_date``; otherwise (or if the prefetch failed) searched now.
+    """
+    start, end = center_date - _RADAR_WINDOW, center_date + _RADAR_WINDOW
+    if prefetched is not None and prefetched.exception() is None:
+        search = prefetched.result()
+        covered_from = search.date_from
+        if len(search.scenes) >= SENTINEL1_SEARCH_LIMIT:
+            # A full page may have cut off older scenes.
+            covered_from = search.scenes[-1].acquisition_date.date() + timedelta(days=1)
+        if covered_from <= start and end <= search.date_to:
+            return [scene for scene in search.scenes if start <= scene.acquisition_date.date() <= end]
+
+    return search_field_imagery(
+        db=db,
+        field=field,
+        date_from=start,
+        date_to=end,
+        max_cloud=100.0,
+        collection="sentinel-1-rtc",
+    )
+
+
 def _ensure_sr_model(
     db: Session,
     model_name: str,
@@ -91,12 +168,25 @@ def _build_scaled_mask(base_mask: np.ndarray, target_shape: tuple[int, int]) ->
 
     scale_y = max(int(np.ceil(height / base_mask.shape[0])), 1)
     scale_x = max(int(np.ceil(width / base_mask.shape[1])), 1)
-    expanded = base_mask.repeat(scale_y, axis=0).repeat(scale_x, axis=1)
-    return expanded[:height, :width]
+    # Gather each target pixel's source pixel directly: one allocation of the
+    # target shape instead of two full-size repeats and a slice.
+    rows = np.arange(height) // scale_y
+    cols = np.arange(width) // scale_x
+    return base_mask[np.ix_(rows, cols)]
+
+
+# Layers are float32; predictor 3 is the floating-point predictor. ZSTD level 1
+# encodes faster than deflate and still compresses smaller.
+_GEOTIFF_COMPRESSION_OPTIONS: dict[str, dict[str, Any]] = {
+    "zstd": {"compress": "zstd", "zstd_level": 1, "predictor": 3},
+    "deflate": {"compress": "deflate", "predictor": 3},
+}
 
 
 def _encode_geotiff(values: np.ndarray, transform: Any, crs: str) -> bytes:
-    encoded = np.nan_to_num(values.astype(np.float32), nan=-9999.0)
+    """Encode a (bands, rows, cols) or (rows, cols) raster as a GeoTIFF."""
+    # NaN is the nodata value, so float32 rasters are written as they are.
+    encoded = np.asarray(values, dtype=np.float32)
     if encoded.ndim == 2:
         encoded = encoded[np.newaxis, ...]
     if encoded.ndim != 3:
@@ -112,16 +202,16 @@ def _encode_geotiff(values: np.ndarray, transform: Any, crs: str) -> bytes:
             dtype=encoded.dtype,
             crs=crs,
             transform=transform,
-            nodata=-9999.0,
+            nodata=np.nan,
             tiled=True,
-            compress="deflate",
-            predictor=2,
+            **_GEOTIFF_COMPRESSION_OPTIONS[get_settings().geotiff_compression],
         ) as dataset:
-            for band_index in range(count):
-                dataset.write(encoded[band_index], band_index + 1)
+            dataset.write(encoded)
         return memfile.read()
 
 
+# Affine is a namedtuple, so identical (transform, shape) inputs share a result.
+@lru_cache(maxsize=64)
 def _derive_resampled_transform(
     transform: Any,
     source_shape: tuple[int, int],
@@ -140,8 +230,40 @@ def _derive_resampled_transform(
     return transform * Affine.scale(scale_x, scale_y)
 
 
-def _create_layer_asset(
-    db: Session,
+# Layers upload in the background while later ones are computed and encoded.
+# Threads are started lazily, so prefork workers each get their own.
+_LAYER_UPLOAD_WORKERS = 8
+_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=_LAYER_UPLOAD_WORKERS, thread_name_prefix="layer-upload")
+# Every row carries the same columns, so psycopg batches the executemany
+# into one multi-row INSERT.
+_INSERT_LAYER_ASSETS = insert(LayerAsset)
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingLayer:
+    """A layer row whose raster still has to be encoded and uploaded."""
+
+    # LayerAsset column values, all but source_uri.
+    row: dict[str, Any]
+    key: str
+    values: np.ndarray
+    transform: Any
+
+
+def _layer_tile_url(layer_id: uuid.UUID) -> str:
+    return f"/api/v1/tiles/{layer_id}"  # tile route expands z/x/y
+
+
+def _layer_object_key(field_id: uuid.UUID, observation_id: uuid.UUID, is_model_derived: bool, name: str) -> str:
+    source_family = "sr" if is_model_derived else "native"
+    return build_object_key(
+        prefix=f"layers/{field_id}/{observation_id}/{source_family}",
+        object_id=f"{name}-{uuid.uuid4()}",
+        extension="tif",
+    )
+
+
+def _index_layer(
     *,
     field_id: uuid.UUID,
     observation_id: uuid.UUID,
@@ -149,26 +271,18 @@ def _create_layer_asset(
     index_name: str,
     values: np.ndarray,
     transform: Any,
-    crs: str,
     scene_id: str,
     is_model_derived: bool,
     label: str,
-) -> LayerAsset:
-    payload = _encode_geotiff(values=values, transform=transform, crs=crs)
-    source_family = "sr" if is_model_derived else "native"
-    key = build_object_key(
-        prefix=f"layers/{field_id}/{observation_id}/{source_family}",
-        object_id=f"{index_name.lower()}-{uuid.uuid4()}",
-        extension="tif",
-    )
-    source_uri = upload_bytes(key=key, payload=payload, content_type="image/tiff")
-    layer = LayerAsset(
+) -> _PendingLayer:
+    layer_id = uuid.uuid4()
+    row = dict(
+        id=layer_id,
         field_id=field_id,
         observation_id=observation_id,
         layer_type=layer_type,
         index_name=index_name,
-        source_uri=source_uri,
-        tilejson_url=None,
+        tilejson_url=_layer_tile_url(layer_id),
         is_model_derived=is_model_derived,
         metadata_json={
             "scene_id": scene_id,
@@ -180,15 +294,11 @@ def _create_layer_asset(
             "quality_status": "OK",
         },
     )
-    db.add(layer)
-    db.flush()
-    layer.tilejson_url = f"/api/v1/tiles/{layer.id}"  # tile route expands z/x/y
-    db.flush()
-    return layer
+    key = _layer_object_key(field_id, observation_id, is_model_derived, index_name.lower())
+    return _PendingLayer(row=row, key=key, values=values, transform=transform)
 
 
-def _create_rgb_layer_asset(
-    db: Session,
+def _rgb_layer(
     *,
     field_id: uuid.UUID,
     observation_id: uuid.UUID,
@@ -196,27 +306,19 @@ def _create_rgb_layer_asset(
     green: np.ndarray,
     blue: np.ndarray,
     transform: Any,
-    crs: str,
     scene_id: str,
     is_model_derived: bool,
     resolution_m: float,
     label: str,
-) -> LayerAsset:
-    payload = _encode_geotiff(values=np.stack([red, green, blue]), transform=transform, crs=crs)
-    source_family = "sr" if is_model_derived else "native"
-    key = build_object_key(
-        prefix=f"layers/{field_id}/{observation_id}/{source_family}",
-        object_id=f"rgb-{uuid.uuid4()}",
-        extension="tif",
-    )
-    source_uri = upload_bytes(key=key, payload=payload, content_type="image/tiff")
-    layer = LayerAsset(
+) -> _PendingLayer:
+    layer_id = uuid.uuid4()
+    row = dict(
+        id=layer_id,
         field_id=field_id,
         observation_id=observation_id,
         layer_type=LayerTypeEnum.RGB,
         index_name=None,
-        source_uri=source_uri,
-        tilejson_url=None,
+        tilejson_url=_layer_tile_url(layer_id),
         is_model_derived=is_model_derived,
         metadata_json={
             "scene_id": scene_id,
@@ -228,11 +330,33 @@ def _create_rgb_layer_asset(
             "quality_status": "OK",
         },
     )
-    db.add(layer)
-    db.flush()
-    layer.tilejson_url = f"/api/v1/tiles/{layer.id}"
-    db.flush()
-    return layer
+    key = _layer_object_key(field_id, observation_id, is_model_derived, "rgb")
+    # Stack straight into the float32 layout the encoder writes.
+    rgb = np.empty((3, *red.shape), dtype=np.float32)
+    for band_index, band in enumerate((red, green, blue)):
+        np.copyto(rgb[band_index], band, casting="unsafe")
+    return _PendingLayer(row=row, key=key, values=rgb, transform=transform)
+
+
+class _LayerUploads:
+    """Encodes layers as they are produced and uploads them in the background.
+
+    Only the compressed GeoTIFF outlives ``add``, so callers can drop each
+    raster before computing the next.
+    """
+
+    def __init__(self, crs: str) -> None:
+        self._crs = crs
+        self._uploads: list[tuple[dict[str, Any], Future[str]]] = []
+
+    def add(self, item: _PendingLayer) -> None:
+        payload = _encode_geotiff(values=item.values, transform=item.transform, crs=self._crs)
+        upload = _UPLOAD_EXECUTOR.submit(upload_bytes, key=item.key, payload=payload, content_type="image/tiff")
+        self._uploads.append((item.row, upload))
+
+    def rows(self) -> list[dict[str, Any]]:
+        """Wait for every upload; return the completed layer rows in input order."""
+        return [{**row, "source_uri": upload.result()} for row, upload in self._uploads]
 
 
 def run_analysis_job(db: Session, job: AnalysisJob) -> dict[str, Any]:
@@ -249,381 +373,413 @@ def run_analysis_job(db: Session, job: AnalysisJob) -> dict[str, Any]:
         raise RuntimeError("Farm not found for analysis job")
     field_geometry = to_shape_from_wkb(field.geometry)
 
+    # Thresholds are read per candidate scene; bind them once.
+    min_coverage = settings.min_scene_coverage_ratio
+    cloud_cap = settings.cloud_cap_percent
+    min_valid_ratio = settings.min_valid_pixel_ratio
+
     params = job.params_json or {}
-    max_cloud = float(params.get("max_cloud") or settings.cloud_cap_percent)
+    max_cloud = float(params.get("max_cloud") or cloud_cap)
     include_sr = bool(params.get("include_sr", False))
+    include_sr_visualization = bool(params.get("include_sr_visualization", True))
     include_radar_overlay = bool(params.get("include_radar_overlay", True))
     requested_scene_id = str(params.get("scene_id") or "").strip()
 
     date_from = date.fromisoformat(params["date_from"]) if params.get("date_from") else None
     date_to = date.fromisoformat(params["date_to"]) if params.get("date_to") else None
 
-    scenes = search_field_imagery(
-        db=db,
-        field=field,
-        date_from=date_from,
-        date_to=date_to,
-        max_cloud=max_cloud,
-        collection="sentinel-2-l2a",
-    )
-    selected_scene: SceneResult | None = None
-    selected_scene_coverage = 0.0
-    if requested_scene_id:
-        selected_scene = next((scene for scene in scenes if scene.scene_id == requested_scene_id), None)
+    radar_prefetch: Future[_RadarSearch] | None = None
+    if include_radar_overlay:
+        # Runs while the Sentinel-2 search and scene processing happen below.
+        default_start, default_end = _default_dates()
+        radar_prefetch = _SEARCH_EXECUTOR.submit(
+            _search_radar,
+            geometry=field_geometry,
+            date_from=(date_from or default_start) - _RADAR_WINDOW,
+            date_to=(date_to or default_end) + _RADAR_WINDOW,
+        )
+
+    try:
+        scenes = search_field_imagery(
+            db=db,
+            field=field,
+            date_from=date_from,
+            date_to=date_to,
+            max_cloud=max_cloud,
+            collection="sentinel-2-l2a",
+        )
+        selected_scene: SceneResult | None = None
+        selected_scene_coverage = 0.0
+        if requested_scene_id:
+            selected_scene = next((scene for scene in scenes if scene.scene_id == requested_scene_id), None)
+            if selected_scene is None:
+                selected_scene = _pc_provider().get_scene_by_id(
+                    scene_id=requested_scene_id, collection="sentinel-2-l2a"
+                )
+                if selected_scene is None:
+                    job.status = JobStatusEnum.FAILED
+                    job.error_message = f"Requested scene '{requested_scene_id}' was not found."
+                    job.result_json = {
+                        "status": "FAILED",
+                        "reason": "REQUESTED_SCENE_NOT_FOUND",
+                        "scene_id": requested_scene_id,
+                    }
+                    db.flush()
+                    return job.result_json
+            selected_scene_coverage = scene_field_coverage_ratio(scene=selected_scene, field_geometry=field_geometry)
+
+        if selected_scene is None and not scenes:
+            job.status = JobStatusEnum.SKIPPED
+            job.result_json = {"reason": "No scene available"}
+            db.flush()
+            return job.result_json
+
         if selected_scene is None:
-            provider = PlanetaryComputerProvider()
-            selected_scene = provider.get_scene_by_id(scene_id=requested_scene_id, collection="sentinel-2-l2a")
+            shapely.prepare(field_geometry)
+            field_area = field_geometry.area
+            for candidate in scenes:
+                coverage = scene_field_coverage_ratio(
+                    scene=candidate, field_geometry=field_geometry, field_area=field_area
+                )
+                if coverage >= min_coverage:
+                    selected_scene = candidate
+                    selected_scene_coverage = coverage
+                    break
+
             if selected_scene is None:
-                job.status = JobStatusEnum.FAILED
-                job.error_message = f"Requested scene '{requested_scene_id}' was not found."
+                job.status = JobStatusEnum.SKIPPED
                 job.result_json = {
-                    "status": "FAILED",
-                    "reason": "REQUESTED_SCENE_NOT_FOUND",
-                    "scene_id": requested_scene_id,
+                    "status": "SKIPPED",
+                    "reason": "NO_SCENE_MEETS_COVERAGE",
+                    "scene_count": len(scenes),
+                    "min_scene_coverage_ratio": min_coverage,
                 }
                 db.flush()
                 return job.result_json
-        selected_scene_coverage = scene_field_coverage_ratio(scene=selected_scene, field_geometry=field_geometry)
 
-    if selected_scene is None and not scenes:
-        job.status = JobStatusEnum.SKIPPED
-        job.result_json = {"reason": "No scene available"}
+        scene_candidate = SceneCandidate(
+            field_id=field.id,
+            provider="planetary_computer",
+            collection=selected_scene.collection,
+            scene_id=selected_scene.scene_id,
+            acquisition_date=selected_scene.acquisition_date,
+            cloud_cover=selected_scene.cloud_cover,
+            assets_json=selected_scene.assets,
+        )
+        db.add(scene_candidate)
         db.flush()
-        return job.result_json
-
-    if selected_scene is None:
-        for candidate in scenes:
-            coverage = scene_field_coverage_ratio(scene=candidate, field_geometry=field_geometry)
-            if coverage >= settings.min_scene_coverage_ratio:
-                selected_scene = candidate
-                selected_scene_coverage = coverage
-                break
 
-        if selected_scene is None:
+        if selected_scene_coverage < min_coverage:
+            observation = Observation(
+                field_id=field.id,
+                scene_candidate_id=scene_candidate.id,
+                observed_on=selected_scene.acquisition_date.date(),
+                status=ObservationStatusEnum.LOW_QUALITY_SKIPPED,
+                cloud_cover=selected_scene.cloud_cover,
+                valid_pixel_ratio=selected_scene_coverage,
+                indices_native={},
+                indices_sr={},
+            )
+            db.add(observation)
+            create_alert(
+                db=db,
+                organization_id=str(farm.organization_id),
+                field_id=str(field.id),
+                severity=AlertSeverityEnum.WARN,
+                category="LOW_SCENE_COVERAGE",
+                message=(
+                    "Scene skipped: "
+                    f"field_coverage={selected_scene_coverage:.3f} "
+                    f"(min={min_coverage:.3f})."
+                ),
+                metadata_json={
+                    "scene_id": selected_scene.scene_id,
+                    "field_coverage_ratio": selected_scene_coverage,
+                    "min_scene_coverage_ratio": min_coverage,
+                },
+            )
             job.status = JobStatusEnum.SKIPPED
             job.result_json = {
                 "status": "SKIPPED",
-                "reason": "NO_SCENE_MEETS_COVERAGE",
-                "scene_count": len(scenes),
-                "min_scene_coverage_ratio": settings.min_scene_coverage_ratio,
+                "reason": "LOW_SCENE_COVERAGE",
+                "scene_id": selected_scene.scene_id,
+                "field_coverage_ratio": selected_scene_coverage,
+                "min_scene_coverage_ratio": min_coverage,
             }
             db.flush()
             return job.result_json
 
-    scene_candidate = SceneCandidate(
-        field_id=field.id,
-        provider="planetary_computer",
-        collection=selected_scene.collection,
-        scene_id=selected_scene.scene_id,
-        acquisition_date=selected_scene.acquisition_date,
-        cloud_cover=selected_scene.cloud_cover,
-        assets_json=selected_scene.assets,
-    )
-    db.add(scene_candidate)
-    db.flush()
-
-    if selected_scene_coverage < settings.min_scene_coverage_ratio:
-        observation = Observation(
-            field_id=field.id,
-            scene_candidate_id=scene_candidate.id,
-            observed_on=selected_scene.acquisition_date.date(),
-            status=ObservationStatusEnum.LOW_QUALITY_SKIPPED,
-            cloud_cover=selected_scene.cloud_cover,
-            valid_pixel_ratio=selected_scene_coverage,
-            indices_native={},
-            indices_sr={},
-        )
-        db.add(observation)
-        create_alert(
-            db=db,
-            organization_id=str(farm.organization_id),
-            field_id=str(field.id),
-            severity=AlertSeverityEnum.WARN,
-            category="LOW_SCENE_COVERAGE",
-            message=(
-                "Scene skipped: "
-                f"field_coverage={selected_scene_coverage:.3f} "
-                f"(min={settings.min_scene_coverage_ratio:.3f})."
-            ),
-            metadata_json={
+        try:
+            bands, valid_mask, native_transform, native_crs = read_scene_patch(
+                assets=selected_scene.assets,
+                aoi_geometry=field_geometry,
+                bands=["B02", "B03", "B04", "B05", "B08", "B11"],
+            )
+        except RasterProcessingError as exc:
+            observation = Observation(
+                field_id=field.id,
+                scene_candidate_id=scene_candidate.id,
+                observed_on=selected_scene.acquisition_date.date(),
+                status=ObservationStatusEnum.FAILED,
+                cloud_cover=selected_scene.cloud_cover,
+                valid_pixel_ratio=0.0,
+                indices_native={},
+                indices_sr={},
+            )
+            db.add(observation)
+            job.status = JobStatusEnum.FAILED
+            job.error_message = str(exc)
+            db.flush()
+            raise
+
+        valid_pixel_ratio = compute_valid_pixel_ratio(valid_mask)
+        scene_candidate.valid_pixel_ratio = valid_pixel_ratio
+
+        cloud_cover = selected_scene.cloud_cover if selected_scene.cloud_cover is not None else 0.0
+        below_quality = cloud_cover > cloud_cap or valid_pixel_ratio < min_valid_ratio
+
+        if below_quality:
+            observation = Observation(
+                field_id=field.id,
+                scene_candidate_id=scene_candidate.id,
+                observed_on=selected_scene.acquisition_date.date(),
+                status=ObservationStatusEnum.LOW_QUALITY_SKIPPED,
+                cloud_cover=selected_scene.cloud_cover,
+                valid_pixel_ratio=valid_pixel_ratio,
+                indices_native={},
+                indices_sr={},
+            )
+            db.add(observation)
+            create_alert(
+                db=db,
+                organization_id=str(farm.organization_id),
+                field_id=str(field.id),
+                severity=AlertSeverityEnum.WARN,
+                category="LOW_QUALITY_SKIPPED",
+                message=(
+                    "Scene skipped: "
+                    f"cloud={cloud_cover:.2f}% (max={cloud_cap:.2f}%), "
+                    f"valid_pixels={valid_pixel_ratio:.3f} (min={min_valid_ratio:.3f})."
+                ),
+                metadata_json={
+                    "cloud_cover": cloud_cover,
+                    "cloud_cap_percent": cloud_cap,
+                    "valid_pixel_ratio": valid_pixel_ratio,
+                    "min_valid_pixel_ratio": min_valid_ratio,
+                },
+            )
+            job.status = JobStatusEnum.SKIPPED
+            job.result_json = {
+                "status": "LOW_QUALITY_SKIPPED",
+                "cloud_cover": cloud_cover,
+                "valid_pixel_ratio": valid_pixel_ratio,
                 "scene_id": selected_scene.scene_id,
-                "field_coverage_ratio": selected_scene_coverage,
-                "min_scene_coverage_ratio": settings.min_scene_coverage_ratio,
-            },
-        )
-        job.status = JobStatusEnum.SKIPPED
-        job.result_json = {
-            "status": "SKIPPED",
-            "reason": "LOW_SCENE_COVERAGE",
-            "scene_id": selected_scene.scene_id,
-            "field_coverage_ratio": selected_scene_coverage,
-            "min_scene_coverage_ratio": settings.min_scene_coverage_ratio,
-        }
-        db.flush()
-        return job.result_json
+            }
+            db.flush()
+            return job.result_json
 
-    try:
-        bands, valid_mask, native_transform, native_crs = read_scene_patch(
-            assets=selected_scene.assets,
-            aoi_geometry=field_geometry,
-            bands=["B02", "B03", "B04", "B05", "B08", "B11"],
-        )
-    except RasterProcessingError as exc:
-        observation = Observation(
-            field_id=field.id,
-            scene_candidate_id=scene_candidate.id,
-            observed_on=selected_scene.acquisition_date.date(),
-            status=ObservationStatusEnum.FAILED,
-            cloud_cover=selected_scene.cloud_cover,
-            valid_pixel_ratio=0.0,
-            indices_native={},
-            indices_sr={},
-        )
-        db.add(observation)
-        job.status = JobStatusEnum.FAILED
-        job.error_message = str(exc)
-        db.flush()
-        raise
+        # Layer keys embed the observation id, and layers are uploaded as they are
+        # computed, before the observation row (which holds their stats) exists.
+        observation_id = uuid.uuid4()
+        layer_context = {"field_id": field.id, "observation_id": observation_id, "scene_id": selected_scene.scene_id}
+        layer_uploads = _LayerUploads(crs=native_crs)
+
+        native_indices: dict[str, Any] = {}
+        for index_name, values in iter_index_rasters(bands=bands, valid_mask=valid_mask):
+            native_indices[index_name] = index_summary(values)
+            layer_uploads.add(
+                _index_layer(
+                    **layer_context,
+                    layer_type=LayerTypeEnum.NATIVE_INDEX,
+                    index_name=index_name,
+                    values=values,
+                    transform=native_transform,
+                    is_model_derived=False,
+                    label="NATIVE",
+                )
+            )
+            del values
+        if _RGB_BANDS.issubset(bands.keys()):
+            layer_uploads.add(
+                _rgb_layer(
+                    **layer_context,
+                    red=bands["B04"],
+                    green=bands["B03"],
+                    blue=bands["B02"],
+                    transform=native_transform,
+                    is_model_derived=False,
+                    resolution_m=10.0,
+                    label="NATIVE",
+                )
+            )
 
-    valid_pixel_ratio = compute_valid_pixel_ratio(valid_mask)
-    scene_candidate.valid_pixel_ratio = valid_pixel_ratio
+        sr_indices: dict[str, Any] = {}
+        sr_bands: dict[str, np.ndarray] = {}
+        sr_model_profile_id = None
+        sr_provider = settings.sr_provider
+        sr_requested = include_sr
+        sr_analytics_enabled = include_sr and is_enabled(db, str(farm.organization_id), "sr_analytics_enabled")
+        sr_visualization_desired = include_sr and include_sr_visualization
+        sr_transform = native_transform
+        sr_resolution_m = 2.5
+        sr_error: str | None = None
+
+        # Inference is the expensive part of SR; skip it when nothing consumes its bands.
+        if sr_analytics_enabled or sr_visualization_desired:
+            try:
+                sr_engine = build_sr_engine()
+                sr_capabilities = sr_engine.get_capabilities()
+                if sr_capabilities.scale_factor > 0:
+                    sr_resolution_m = 10.0 / float(sr_capabilities.scale_factor)
+                sr_model = _ensure_sr_model(
+                    db=db,
+                    model_name=sr_capabilities.model_name,
+                    model_version=sr_capabilities.model_version,
+                    supported_bands=sorted(sr_capabilities.supported_bands),
+                    scale_factor=float(sr_capabilities.scale_factor),
+                    runtime_class=sr_capabilities.runtime_class,
+                )
+                sr_model_profile_id = sr_model.id
+
+                sr_bands = sr_engine.generate(
+                    SRRequest(
+                        acquisition_date=selected_scene.acquisition_date.date(),
+                        aoi_geometry=field_geometry,
+                        native_bands=bands,
+                        source_assets=selected_scene.assets,
+                    )
+                )
+                if sr_bands and sr_analytics_enabled:
+                    first_band_shape = next(iter(sr_bands.values())).shape
+                    sr_transform = _derive_resampled_transform(
+                        transform=native_transform,
+                        source_shape=valid_mask.shape,
+                        target_shape=first_band_shape,
+                    )
+                    sr_mask = _build_scaled_mask(base_mask=valid_mask, target_shape=first_band_shape)
+                    available_indices = available_indices_for_bands(set(sr_bands.keys()))
+                    for index_name, values in iter_index_rasters(bands=sr_bands, valid_mask=sr_mask):
+                        if index_name not in available_indices:
+                            continue
+                        sr_indices[index_name] = index_summary(values)
+                        layer_uploads.add(
+                            _index_layer(
+                                **layer_context,
+                                layer_type=LayerTypeEnum.SR_INDEX,
+                                index_name=index_name,
+                                values=values,
+                                transform=sr_transform,
+                                is_model_derived=True,
+                                label="MODEL_DERIVED",
+                            )
+                        )
+                        del values
+                elif sr_bands:
+                    first_band_shape = next(iter(sr_bands.values())).shape
+                    sr_transform = _derive_resampled_transform(
+                        transform=native_transform,
+                        source_shape=valid_mask.shape,
+                        target_shape=first_band_shape,
+                    )
+            except SRInferenceError as exc:
+                sr_error = str(exc)
+                create_alert(
+                    db=db,
+                    organization_id=str(farm.organization_id),
+                    field_id=str(field.id),
+                    severity=AlertSeverityEnum.WARN,
+                    category="SR_INFERENCE_FAILED",
+                    message="SR inference failed; native analytics were kept.",
+                    metadata_json={"provider": sr_provider, "error": str(exc)},
+                )
 
-    cloud_cover = selected_scene.cloud_cover if selected_scene.cloud_cover is not None else 0.0
-    below_quality = cloud_cover > settings.cloud_cap_percent or valid_pixel_ratio < settings.min_valid_pixel_ratio
+        # The native bands are encoded and fed to SR by now; don't pin tens of MB
+        # through the radar overlay and alert steps.
+        del bands
 
-    if below_quality:
         observation = Observation(
+            id=observation_id,
             field_id=field.id,
             scene_candidate_id=scene_candidate.id,
             observed_on=selected_scene.acquisition_date.date(),
-            status=ObservationStatusEnum.LOW_QUALITY_SKIPPED,
+            status=ObservationStatusEnum.SUCCEEDED,
             cloud_cover=selected_scene.cloud_cover,
             valid_pixel_ratio=valid_pixel_ratio,
-            indices_native={},
-            indices_sr={},
+            indices_native=native_indices,
+            indices_sr=sr_indices,
+            sr_model_profile_id=sr_model_profile_id,
         )
         db.add(observation)
-        create_alert(
-            db=db,
-            organization_id=str(farm.organization_id),
-            field_id=str(field.id),
-            severity=AlertSeverityEnum.WARN,
-            category="LOW_QUALITY_SKIPPED",
-            message=(
-                "Scene skipped: "
-                f"cloud={cloud_cover:.2f}% (max={settings.cloud_cap_percent:.2f}%), "
-                f"valid_pixels={valid_pixel_ratio:.3f} (min={settings.min_valid_pixel_ratio:.3f})."
-            ),
-            metadata_json={
-                "cloud_cover": cloud_cover,
-                "cloud_cap_percent": settings.cloud_cap_percent,
-                "valid_pixel_ratio": valid_pixel_ratio,
-                "min_valid_pixel_ratio": settings.min_valid_pixel_ratio,
-            },
-        )
-        job.status = JobStatusEnum.SKIPPED
-        job.result_json = {
-            "status": "LOW_QUALITY_SKIPPED",
-            "cloud_cover": cloud_cover,
-            "valid_pixel_ratio": valid_pixel_ratio,
-            "scene_id": selected_scene.scene_id,
-        }
         db.flush()
-        return job.result_json
 
-    native_indices = compute_indices(bands=bands, valid_mask=valid_mask)
-    native_index_rasters = compute_index_rasters(bands=bands, valid_mask=valid_mask)
-
-    sr_indices: dict[str, Any] = {}
-    sr_index_rasters: dict[str, np.ndarray] = {}
-    sr_bands: dict[str, np.ndarray] = {}
-    sr_model_profile_id = None
-    sr_provider = settings.sr_provider
-    sr_requested = include_sr
-    sr_analytics_enabled = include_sr and is_enabled(db, str(farm.organization_id), "sr_analytics_enabled")
-    sr_transform = native_transform
-    sr_resolution_m = 2.5
-    sr_error: str | None = None
-
-    if sr_requested:
-        try:
-            sr_engine = build_sr_engine()
-            sr_capabilities = sr_engine.get_capabilities()
-            if sr_capabilities.scale_factor > 0:
-                sr_resolution_m = 10.0 / float(sr_capabilities.scale_factor)
-            sr_model = _ensure_sr_model(
-                db=db,
-                model_name=sr_capabilities.model_name,
-                model_version=sr_capabilities.model_version,
-                supported_bands=sorted(sr_capabilities.supported_bands),
-                scale_factor=float(sr_capabilities.scale_factor),
-                runtime_class=sr_capabilities.runtime_class,
-            )
-            sr_model_profile_id = sr_model.id
-
-            sr_bands = sr_engine.generate(
-                SRRequest(
-                    acquisition_date=selected_scene.acquisition_date.date(),
-                    aoi_geometry=to_shape_from_wkb(field.geometry),
-                    native_bands=bands,
-                    source_assets=selected_scene.assets,
+        if sr_visualization_desired and _RGB_BANDS.issubset(sr_bands.keys()):
+            layer_uploads.add(
+                _rgb_layer(
+                    **layer_context,
+                    red=sr_bands["B04"],
+                    green=sr_bands["B03"],
+                    blue=sr_bands["B02"],
+                    transform=sr_transform,
+                    is_model_derived=True,
+                    resolution_m=sr_resolution_m,
+                    label="MODEL_DERIVED",
                 )
             )
-            if sr_bands and sr_analytics_enabled:
-                first_band_shape = next(iter(sr_bands.values())).shape
-                sr_transform = _derive_resampled_transform(
-                    transform=native_transform,
-                    source_shape=valid_mask.shape,
-                    target_shape=first_band_shape,
-                )
-                sr_mask = _build_scaled_mask(base_mask=valid_mask, target_shape=first_band_shape)
-                available_indices = available_indices_for_bands(set(sr_bands.keys()))
-                computed_sr = compute_indices(bands=sr_bands, valid_mask=sr_mask)
-                computed_sr_rasters = compute_index_rasters(bands=sr_bands, valid_mask=sr_mask)
-                sr_indices = {k: v for k, v in computed_sr.items() if k in available_indices}
-                sr_index_rasters = {k: v for k, v in computed_sr_rasters.items() if k in available_indices}
-            elif sr_bands:
-                first_band_shape = next(iter(sr_bands.values())).shape
-                sr_transform = _derive_resampled_transform(
-                    transform=native_transform,
-                    source_shape=valid_mask.shape,
-                    target_shape=first_band_shape,
-                )
-        except SRInferenceError as exc:
-            sr_error = str(exc)
-            create_alert(
-                db=db,
-                organization_id=str(farm.organization_id),
-                field_id=str(field.id),
-                severity=AlertSeverityEnum.WARN,
-                category="SR_INFERENCE_FAILED",
-                message="SR inference failed; native analytics were kept.",
-                metadata_json={"provider": sr_provider, "error": str(exc)},
-            )
-
-    observation = Observation(
-        field_id=field.id,
-        scene_candidate_id=scene_candidate.id,
-        observed_on=selected_scene.acquisition_date.date(),
-        status=ObservationStatusEnum.SUCCEEDED,
-        cloud_cover=selected_scene.cloud_cover,
-        valid_pixel_ratio=valid_pixel_ratio,
-        indices_native=native_indices,
-        indices_sr=sr_indices,
-        sr_model_profile_id=sr_model_profile_id,
-    )
-    db.add(observation)
-    db.flush()
-
-    for index_name, values in native_index_rasters.items():
-        _create_layer_asset(
-            db=db,
-            field_id=field.id,
-            observation_id=observation.id,
-            layer_type=LayerTypeEnum.NATIVE_INDEX,
-            index_name=index_name,
-            values=values,
-            transform=native_transform,
-            crs=native_crs,
-            scene_id=selected_scene.scene_id,
-            is_model_derived=False,
-            label="NATIVE",
-        )
-
-    if {"B04", "B03", "B02"}.issubset(bands.keys()):
-        _create_rgb_layer_asset(
-            db=db,
-            field_id=field.id,
-            observation_id=observation.id,
-            red=bands["B04"],
-            green=bands["B03"],
-            blue=bands["B02"],
-            transform=native_transform,
-            crs=native_crs,
-            scene_id=selected_scene.scene_id,
-            is_model_derived=False,
-            resolution_m=10.0,
-            label="NATIVE",
-        )
+        sr_visualization_generated = sr_visualization_desired and bool(sr_bands)
+        del sr_bands
+        layer_rows = layer_uploads.rows()
 
-    for index_name, values in sr_index_rasters.items():
-        _create_layer_asset(
-            db=db,
-            field_id=field.id,
-            observation_id=observation.id,
-            layer_type=LayerTypeEnum.SR_INDEX,
-            index_name=index_name,
-            values=values,
-            transform=sr_transform,
-            crs=native_crs,
-            scene_id=selected_scene.scene_id,
-            is_model_derived=True,
-            label="MODEL_DERIVED",
-        )
-
-    if {"B04", "B03", "B02"}.issubset(sr_bands.keys()):
-        _create_rgb_layer_asset(
-            db=db,
-            field_id=field.id,
-            observation_id=observation.id,
-            red=sr_bands["B04"],
-            green=sr_bands["B03"],
-            blue=sr_bands["B02"],
-            transform=sr_transform,
-            crs=native_crs,
-            scene_id=selected_scene.scene_id,
-            is_model_derived=True,
-            resolution_m=sr_resolution_m,
-            label="MODEL_DERIVED",
-        )
-
-    if include_radar_overlay:
-        center_date = selected_scene.acquisition_date.date()
-        radar_scenes = search_field_imagery(
-            db=db,
-            field=field,
-            date_from=center_date - timedelta(days=3),
-            date_to=center_date + timedelta(days=3),
-            max_cloud=100.0,
-            collection="sentinel-1-rtc",
-        )
-        if radar_scenes:
-            radar_scene = radar_scenes[0]
-            radar_source = radar_scene.assets.get("visual") or radar_scene.assets.get("vv") or next(
-                iter(radar_scene.assets.values()),
-                "",
+        if include_radar_overlay:
+            radar_scenes = _radar_scenes_near(
+                db=db,
+                field=field,
+                center_date=selected_scene.acquisition_date.date(),
+                prefetched=radar_prefetch,
             )
-            db.add(
-                LayerAsset(
-                    field_id=field.id,
-                    observation_id=observation.id,
-                    layer_type=LayerTypeEnum.RADAR,
-                    index_name=None,
-                    source_uri=radar_source,
-                    tilejson_url=None,
-                    is_model_derived=False,
-                    metadata_json={
-                        "scene_id": radar_scene.scene_id,
-                        "collection": radar_scene.collection,
-                        "overlay_type": "SENTINEL1_RTC",
-                    },
+            if radar_scenes:
+                radar_scene = radar_scenes[0]
+                radar_source = radar_scene.assets.get("visual") or radar_scene.assets.get("vv") or next(
+                    iter(radar_scene.assets.values()),
+                    "",
                 )
-            )
+                layer_rows.append(
+                    dict(
+                        id=uuid.uuid4(),
+                        field_id=field.id,
+                        observation_id=observation.id,
+                        layer_type=LayerTypeEnum.RADAR,
+                        index_name=None,
+                        source_uri=radar_source,
+                        tilejson_url=None,
+                        is_model_derived=False,
+                        metadata_json={
+                            "scene_id": radar_scene.scene_id,
+                            "collection": radar_scene.collection,
+                            "overlay_type": "SENTINEL1_RTC",
+                        },
+                    )
+                )
+        if layer_rows:
+            db.execute(_INSERT_LAYER_ASSETS, layer_rows)
 
-    maybe_create_ndvi_drop_alert(db=db, organization_id=str(farm.organization_id), field=field, current_observation=observation)
-
-    job.status = JobStatusEnum.SUCCEEDED
-    job.result_json = {
-        "scene_id": selected_scene.scene_id,
-        "cloud_cover": selected_scene.cloud_cover,
-        "valid_pixel_ratio": valid_pixel_ratio,
-        "native_indices": list(native_indices.keys()),
-        "sr_indices": list(sr_indices.keys()),
-        "sr_provider": sr_provider if sr_requested else None,
-        "sr_requested": sr_requested,
-        "sr_analytics_enabled": sr_analytics_enabled,
-        "sr_visualization_generated": bool(sr_bands),
-        "sr_error": sr_error,
-    }
-    db.flush()
-    return job.result_json
+        maybe_create_ndvi_drop_alert(db=db, organization_id=str(farm.organization_id), current_observation=observation)
+
+        job.status = JobStatusEnum.SUCCEEDED
+        job.result_json = {
+            "scene_id": selected_scene.scene_id,
+            "cloud_cover": selected_scene.cloud_cover,
+            "valid_pixel_ratio": valid_pixel_ratio,
+            "native_indices": list(native_indices.keys()),
+            "sr_indices": list(sr_indices.keys()),
+            "sr_provider": sr_provider if sr_requested else None,
+            "sr_requested": sr_requested,
+            "sr_analytics_enabled": sr_analytics_enabled,
+            "sr_visualization_generated": sr_visualization_generated,
+            "sr_error": sr_error,
+        }
+        db.flush()
+        return job.result_json
+    finally:
+        # Early returns and errors leave the prefetch unused; drop it if it has not started.
+        if radar_prefetch is not None:
+            radar_prefetch.cancel()
@@ -9,29 +9,52 @@ import httpx
 import numpy as np
 import rasterio
 from PIL import Image, ImageDraw
+from rasterio.enums import Resampling
+from rasterio.errors import RasterioIOError
 from rasterio.io import MemoryFile
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.models import AnalysisJob, ExportFormatEnum, ExportJob, Field, JobStatusEnum, LayerAsset, LayerTypeEnum, Observation
-from app.services.storage import build_object_key, download_bytes as download_object_storage_bytes, upload_bytes
+from app.services.storage import (
+    build_object_key,
+    copy_to_object,
+    create_presigned_get_url,
+    download_bytes as download_object_storage_bytes,
+    upload_bytes,
+)
+
+
+# Index means are extracted by Postgres, so rows arrive as plain columns and the
+# indices_native documents are never decoded here.
+_CSV_EXPORT_ROWS = (
+    select(
+        Observation.observed_on,
+        Observation.status,
+        Observation.cloud_cover,
+        Observation.valid_pixel_ratio,
+        *(Observation.indices_native[(index_name, "stats", "mean")].as_float() for index_name in ("NDVI", "NDMI", "NDWI")),
+    )
+    .where(Observation.field_id == bindparam("field_id"))
+    .order_by(Observation.observed_on.asc())
+)
+_CSV_EXPORT_BATCH_SIZE = 1000
 
 
 def _build_csv_export(db: Session, field_id: UUID) -> bytes:
-    observations = (
-        db.query(Observation)
-        .filter(Observation.field_id == field_id)
-        .order_by(Observation.observed_on.asc())
-        .all()
-    )
     buffer = io.StringIO()
     writer = csv.writer(buffer)
     writer.writerow(["observed_on", "status", "cloud_cover", "valid_pixel_ratio", "ndvi_mean", "ndmi_mean", "ndwi_mean"])
-    for obs in observations:
-        ndvi = (obs.indices_native.get("NDVI", {}).get("stats") or {}).get("mean")
-        ndmi = (obs.indices_native.get("NDMI", {}).get("stats") or {}).get("mean")
-        ndwi = (obs.indices_native.get("NDWI", {}).get("stats") or {}).get("mean")
-        writer.writerow([obs.observed_on.isoformat(), obs.status.value, obs.cloud_cover, obs.valid_pixel_ratio, ndvi, ndmi, ndwi])
+    rows = db.execute(
+        _CSV_EXPORT_ROWS,
+        {"field_id": field_id},
+        execution_options={"yield_per": _CSV_EXPORT_BATCH_SIZE},
+    )
+    writer.writerows(
+        (observed_on.isoformat(), status.value, cloud_cover, valid_pixel_ratio, ndvi, ndmi, ndwi)
+        for observed_on, status, cloud_cover, valid_pixel_ratio, ndvi, ndmi, ndwi in rows
+    )
     return buffer.getvalue().encode("utf-8")
 
 
@@ -121,63 +144,139 @@ def _latest_layer_for_export(
     return None
 
 
-def _build_geotiff_export_from_layer(layer: LayerAsset | None) -> bytes:
+def _copy_geotiff_export_from_layer(layer: LayerAsset | None, key: str) -> str:
     if layer is None or not layer.source_uri:
         raise RuntimeError("No layer asset available for GeoTIFF export")
-    return _download_bytes(layer.source_uri)
+    # The layer is exported as is, so it never has to pass through this process.
+    return copy_to_object(layer.source_uri, key=key, content_type="image/tiff")
+
+
+# Percentiles of unsigned integer channels (e.g. uint16 reflectance) come from a
+# histogram: one bincount pass, no partition and no float copy.
+_HISTOGRAM_DTYPES = (np.dtype(np.uint8), np.dtype(np.uint16))
+
+
+def _percentiles_hist(values: np.ndarray, qs: tuple[float, ...]) -> np.ndarray:
+    """Inverted-CDF percentiles (``qs`` in 0-1) of a 1-D uint8/uint16 array."""
+    cumulative = np.cumsum(np.bincount(values))
+    return np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1]).astype(np.float64)
 
 
-def _stretch_channel(channel: np.ndarray) -> np.ndarray:
-    finite = channel[np.isfinite(channel)]
-    if finite.size == 0:
+def _valid_pixels(values: np.ndarray, nodata: float | None) -> np.ndarray:
+    valid = np.isfinite(values) if values.dtype.kind == "f" else np.ones(values.shape, dtype=bool)
+    if nodata is not None and np.isfinite(nodata):
+        # Layers written before NaN became the nodata value use -9999.
+        valid &= values != nodata
+    return valid
+
+
+def _stretch_channel(channel: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """2-98 percentile stretch of a channel to uint8.
+
+    ``valid`` is computed once by the caller, which also needs it to paint
+    nodata pixels.
+    """
+    if not valid.any():
         return np.zeros(channel.shape, dtype=np.uint8)
 
-    p2 = float(np.nanpercentile(finite, 2))
-    p98 = float(np.nanpercentile(finite, 98))
+    values = channel.ravel() if valid.all() else channel[valid]
+    if channel.dtype in _HISTOGRAM_DTYPES:
+        p2, p98 = _percentiles_hist(values, (0.02, 0.98))
+    else:
+        # Both percentiles from one partition of the valid values.
+        p2, p98 = np.percentile(values, (2, 98))
+    p2, p98 = float(p2), float(p98)
     denom = (p98 - p2) if p98 > p2 else 1.0
-    normalized = np.clip((channel - p2) / denom, 0.0, 1.0)
-    return (normalized * 255).astype(np.uint8)
+    scaled = np.subtract(channel, p2, dtype=np.float32)
+    scaled *= 255.0 / denom
+    np.clip(scaled, 0.0, 255.0, out=scaled)
+    scaled[~valid] = 0.0
+    return scaled.astype(np.uint8)
+
+
+_PNG_MAX_DIM = 1600
+# Remote layers are opened in place; GDAL fetches only the tiles (or overviews)
+# the preview needs, in merged range requests.
+_VSI_CURL_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "VSI_CACHE": "TRUE",
+    "CPL_VSIL_CURL_ALLOWED_EXTENSIONS": ".tif,.tiff",
+}
+
+
+def _single_band_colors() -> np.ndarray:
+    # Brown (low) to green (high) ramp over the stretched uint8 value.
+    normalized = np.arange(256, dtype=np.float32) / 255.0
+    colors = np.empty((256, 3), dtype=np.uint8)
+    colors[:, 0] = 90 + normalized * 60
+    colors[:, 1] = 70 + normalized * 170
+    colors[:, 2] = 40 + normalized * 70
+    return colors
+
+
+# Single-band layers are coloured with one uint8 gather through this table.
+_SINGLE_BAND_COLORS = _single_band_colors()
+_SINGLE_BAND_NODATA_COLOR = np.array([20, 20, 20], dtype=np.uint8)
+
+
+def _preview_shape(dataset) -> tuple[int, int]:
+    scale = min(1.0, _PNG_MAX_DIM / max(dataset.width, dataset.height))
+    return max(1, round(dataset.height * scale)), max(1, round(dataset.width * scale))
+
+
+def _render_layer_image(dataset) -> Image.Image | None:
+    """Stretch a layer to RGB at preview size, or None if it has no valid pixels."""
+    height, width = _preview_shape(dataset)
+    # Bands stay in their stored dtype; the stretch produces the floats.
+    if dataset.count >= 3:
+        stacked = dataset.read([1, 2, 3], out_shape=(3, height, width), resampling=Resampling.average)
+        valid = _valid_pixels(stacked, dataset.nodata)
+        rgb = np.empty((height, width, 3), dtype=np.uint8)
+        for band_index in range(3):
+            rgb[..., band_index] = _stretch_channel(stacked[band_index], valid[band_index])
+        rgb[~valid.all(axis=0)] = 0
+        return Image.fromarray(rgb, mode="RGB")
+
+    raster = dataset.read(1, out_shape=(height, width), resampling=Resampling.average)
+    valid = _valid_pixels(raster, dataset.nodata)
+    if not valid.any():
+        return None
+
+    rgb = _SINGLE_BAND_COLORS[_stretch_channel(raster, valid)]
+    rgb[~valid] = _SINGLE_BAND_NODATA_COLOR
+    return Image.fromarray(rgb, mode="RGB")
+
+
+def _render_remote_layer_image(source_uri: str) -> Image.Image | None:
+    if not source_uri.startswith(("http://", "https://")):
+        raise RasterioIOError(f"Cannot range-read {source_uri}")
+    url = create_presigned_get_url(source_uri)
+    with rasterio.Env(**_VSI_CURL_OPTIONS), rasterio.open(f"/vsicurl/{url}") as dataset:
+        return _render_layer_image(dataset)
 
 
 def _build_png_export_from_layer(field_name: str, layer: LayerAsset | None, metrics: dict[str, float | None]) -> bytes:
     if layer is None or not layer.source_uri:
         return _build_png_export(field_name=field_name, metrics=metrics)
 
-    payload = _download_bytes(layer.source_uri)
-    with MemoryFile(payload) as memfile:
-        with memfile.open() as dataset:
-            if dataset.count >= 3:
-                stacked = dataset.read([1, 2, 3]).astype(np.float32)
-                red = _stretch_channel(stacked[0])
-                green = _stretch_channel(stacked[1])
-                blue = _stretch_channel(stacked[2])
-                rgb = np.stack([red, green, blue], axis=-1)
-                rgb[~np.isfinite(stacked).all(axis=0)] = np.array([0, 0, 0], dtype=np.uint8)
-                image = Image.fromarray(rgb, mode="RGB")
-            else:
-                raster = dataset.read(1).astype(np.float32)
-                finite = raster[np.isfinite(raster)]
-                if finite.size == 0:
-                    return _build_png_export(field_name=field_name, metrics=metrics)
-
-                normalized = _stretch_channel(raster).astype(np.float32) / 255.0
-                rgb = np.zeros((normalized.shape[0], normalized.shape[1], 3), dtype=np.uint8)
-                rgb[..., 0] = (90 + normalized * 60).astype(np.uint8)
-                rgb[..., 1] = (70 + normalized * 170).astype(np.uint8)
-                rgb[..., 2] = (40 + normalized * 70).astype(np.uint8)
-                rgb[~np.isfinite(raster)] = np.array([20, 20, 20], dtype=np.uint8)
-                image = Image.fromarray(rgb, mode="RGB")
-
-    max_dim = 1600
-    if max(image.size) > max_dim:
-        image.thumbnail((max_dim, max_dim), Image.Resampling.BICUBIC)
-    elif max(image.size) < 800:
+    try:
+        image = _render_remote_layer_image(layer.source_uri)
+    except RasterioIOError:
+        # Sources GDAL cannot range-read are downloaded whole.
+        with MemoryFile(_download_bytes(layer.source_uri)) as memfile, memfile.open() as dataset:
+            image = _render_layer_image(dataset)
+    if image is None:
+        return _build_png_export(field_name=field_name, metrics=metrics)
+
+    # Large layers are already read at _PNG_MAX_DIM; only small ones are scaled here.
+    if max(image.size) < 800:
         scale = 800 / float(max(image.size))
         resized = (
             max(1, int(round(image.size[0] * scale))),
             max(1, int(round(image.size[1] * scale))),
         )
-        image = image.resize(resized, Image.Resampling.BICUBIC)
+        image = image.resize(resized, Image.Resampling[get_settings().export_preview_resample.upper()])
 
     output = io.BytesIO()
     image.save(output, format="PNG", optimize=True)
@@ -193,7 +292,7 @@ def run_export_job(db: Session, export_job: ExportJob) -> dict:
     if field is None:
         raise RuntimeError("Export field not found")
 
-    payload: bytes
+    payload: bytes | None = None
     content_type: str
     extension: str
     export_params = export_job.params_json or {}
@@ -265,12 +364,14 @@ def run_export_job(db: Session, export_job: ExportJob) -> dict:
         content_type = "image/png"
         extension = "png"
     else:
-        payload = _build_geotiff_export_from_layer(selected_layer)
         content_type = "image/tiff"
         extension = "tif"
 
     key = build_object_key(prefix="exports", object_id=str(export_job.id), extension=extension)
-    output_uri = upload_bytes(key=key, payload=payload, content_type=content_type)
+    if payload is None:
+        output_uri = _copy_geotiff_export_from_layer(selected_layer, key=key)
+    else:
+        output_uri = upload_bytes(key=key, payload=payload, content_type=content_type)
 
     export_job.output_uri = output_uri
     export_job.status = JobStatusEnum.SUCCEEDED
@@ -1,20 +1,33 @@
 import uuid
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.models import FeatureFlag
 
+# Session.info key for the per-session organization_id -> {key: enabled} memo.
+# An organization's flags are loaded together on the first lookup, so later
+# checks in the same request or job skip the SELECT.
+_FLAG_MEMO_KEY = "feature_flags"
+
+_ORGANIZATION_FLAGS = select(FeatureFlag.key, FeatureFlag.enabled).where(
+    FeatureFlag.organization_id == bindparam("organization_id")
+)
+
+
+def _organization_flags(db: Session, org_uuid: uuid.UUID) -> dict[str, bool]:
+    memo: dict[uuid.UUID, dict[str, bool]] = db.info.setdefault(_FLAG_MEMO_KEY, {})
+    if org_uuid not in memo:
+        memo[org_uuid] = dict(db.execute(_ORGANIZATION_FLAGS, {"organization_id": org_uuid}).all())
+    return memo[org_uuid]
+
 
 def is_enabled(db: Session, organization_id: str, key: str) -> bool:
     org_uuid = organization_id if isinstance(organization_id, uuid.UUID) else uuid.UUID(str(organization_id))
-    flag = (
-        db.query(FeatureFlag)
-        .filter(FeatureFlag.organization_id == org_uuid, FeatureFlag.key == key)
-        .one_or_none()
-    )
-    if flag is not None:
-        return flag.enabled
+    flags = _organization_flags(db, org_uuid)
+    if key in flags:
+        return flags[key]
 
     settings = get_settings()
     defaults = {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -22,80 +23,120 @@ class IndexOutput:
     stats: dict[str, float | None]
 
 
-def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    # Pass ``out=denominator`` when the denominator is a throwaway temporary.
     with np.errstate(divide="ignore", invalid="ignore"):
-        out = np.divide(numerator, denominator)
+        out = np.divide(numerator, denominator, out=out)
     out[~np.isfinite(out)] = np.nan
     return out
 
 
+def _normalized_difference(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    total = a + b
+    return _safe_divide(a - b, total, out=total)
+
+
 def _stats(arr: np.ndarray) -> dict[str, float | None]:
     finite = arr[np.isfinite(arr)]
     if finite.size == 0:
         return {"min": None, "max": None, "mean": None, "p10": None, "p90": None}
+    # finite holds no NaNs, so the plain reductions apply, and one partition
+    # serves both percentiles.
+    p10, p90 = np.percentile(finite, (10, 90))
     return {
-        "min": float(np.nanmin(finite)),
-        "max": float(np.nanmax(finite)),
-        "mean": float(np.nanmean(finite)),
-        "p10": float(np.nanpercentile(finite, 10)),
-        "p90": float(np.nanpercentile(finite, 90)),
+        "min": float(finite.min()),
+        "max": float(finite.max()),
+        "mean": float(finite.mean()),
+        "p10": float(p10),
+        "p90": float(p90),
     }
 
 
-def _normalize_reflectance(arr: np.ndarray) -> np.ndarray:
-    arr = arr.astype(np.float32)
-    if np.nanmax(arr) > 2.0:
-        arr = arr / 10000.0
-    return arr
+def _write_reflectance(band: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Write ``band`` as float32 reflectance into ``out``, casting and scaling in one pass."""
+    # Only bands that exceed the reflectance range hold digital numbers, whatever
+    # their dtype; integer bands cannot hold NaN, so a plain max suffices.
+    peak = band.max() if band.dtype.kind in "ui" else np.nanmax(band)
+    if peak > 2.0:
+        np.divide(band, np.float32(10000.0), out=out, dtype=np.float32)
+    else:
+        np.copyto(out, band, casting="unsafe")
+    return out
 
 
-def compute_index_rasters(bands: dict[str, np.ndarray], valid_mask: np.ndarray | None = None) -> dict[str, np.ndarray]:
-    normalized = {name: _normalize_reflectance(value) for name, value in bands.items()}
-    if not normalized:
-        return {}
+def _stack_bands(bands: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    # All bands go into one contiguous (band, row, col) float32 block; the
+    # returned per-band arrays are views into it.
+    names = list(bands)
+    if len({value.shape for value in bands.values()}) > 1:
+        return {name: _write_reflectance(value, np.empty(value.shape, dtype=np.float32)) for name, value in bands.items()}
+    stack = np.empty((len(names), *bands[names[0]].shape), dtype=np.float32)
+    for band_index, name in enumerate(names):
+        _write_reflectance(bands[name], stack[band_index])
+    return dict(zip(names, stack))
+
+
+def iter_index_rasters(
+    bands: dict[str, np.ndarray], valid_mask: np.ndarray | None = None
+) -> Iterator[tuple[str, np.ndarray]]:
+    """Yield ``(index_name, raster)`` one index at a time.
+
+    Rasters are float32 and freshly allocated, so callers may modify them.
+    Consumers that encode and drop each raster before asking for the next keep
+    a single index raster resident instead of all of them.
+    """
+    if not bands:
+        return
+    normalized = _stack_bands(bands)
     shape = next(iter(normalized.values())).shape
-    mask = np.ones(shape, dtype=bool) if valid_mask is None else valid_mask.copy()
+    invalid = np.zeros(shape, dtype=bool) if valid_mask is None else ~valid_mask
 
-    out: dict[str, np.ndarray] = {}
+    def masked(values: np.ndarray) -> np.ndarray:
+        values[invalid] = np.nan
+        return values
 
     if {"B08", "B04"}.issubset(normalized):
-        ndvi = _safe_divide(normalized["B08"] - normalized["B04"], normalized["B08"] + normalized["B04"])
-        ndvi[~mask] = np.nan
-        out["NDVI"] = ndvi
-
-        savi = _safe_divide(1.5 * (normalized["B08"] - normalized["B04"]), normalized["B08"] + normalized["B04"] + 0.5)
-        savi[~mask] = np.nan
-        out["SAVI"] = savi
+        # NDVI and SAVI share the NIR/red difference and sum.
+        nir_minus_red = normalized["B08"] - normalized["B04"]
+        nir_plus_red = normalized["B08"] + normalized["B04"]
+        yield "NDVI", masked(_safe_divide(nir_minus_red, nir_plus_red))
+        nir_minus_red *= 1.5
+        nir_plus_red += 0.5
+        yield "SAVI", masked(_safe_divide(nir_minus_red, nir_plus_red, out=nir_plus_red))
+        del nir_minus_red, nir_plus_red
 
     if {"B08", "B11"}.issubset(normalized):
-        ndmi = _safe_divide(normalized["B08"] - normalized["B11"], normalized["B08"] + normalized["B11"])
-        ndmi[~mask] = np.nan
-        out["NDMI"] = ndmi
+        yield "NDMI", masked(_normalized_difference(normalized["B08"], normalized["B11"]))
 
     if {"B03", "B08"}.issubset(normalized):
-        ndwi = _safe_divide(normalized["B03"] - normalized["B08"], normalized["B03"] + normalized["B08"])
-        ndwi[~mask] = np.nan
-        out["NDWI"] = ndwi
+        yield "NDWI", masked(_normalized_difference(normalized["B03"], normalized["B08"]))
 
     if {"B08", "B04", "B02"}.issubset(normalized):
-        evi = _safe_divide(
-            2.5 * (normalized["B08"] - normalized["B04"]),
-            normalized["B08"] + 6 * normalized["B04"] - 7.5 * normalized["B02"] + 1,
+        evi_denominator = normalized["B08"] + 6 * normalized["B04"] - 7.5 * normalized["B02"] + 1
+        yield "EVI", masked(
+            _safe_divide(2.5 * (normalized["B08"] - normalized["B04"]), evi_denominator, out=evi_denominator)
         )
-        evi[~mask] = np.nan
-        out["EVI"] = evi
 
     if {"B08", "B05"}.issubset(normalized):
-        ndre = _safe_divide(normalized["B08"] - normalized["B05"], normalized["B08"] + normalized["B05"])
-        ndre[~mask] = np.nan
-        out["NDRE"] = ndre
+        yield "NDRE", masked(_normalized_difference(normalized["B08"], normalized["B05"]))
 
-    return out
+
+def compute_index_rasters(bands: dict[str, np.ndarray], valid_mask: np.ndarray | None = None) -> dict[str, np.ndarray]:
+    return dict(iter_index_rasters(bands=bands, valid_mask=valid_mask))
+
+
+def index_summary(values: np.ndarray) -> dict[str, Any]:
+    """Summary stored per index on an observation."""
+    return {"stats": _stats(values)}
+
+
+def index_stats(rasters: dict[str, np.ndarray]) -> dict[str, dict[str, Any]]:
+    """Per-index summary stats of rasters from ``compute_index_rasters``."""
+    return {name: index_summary(values) for name, values in rasters.items()}
 
 
 def compute_indices(bands: dict[str, np.ndarray], valid_mask: np.ndarray | None = None) -> dict[str, dict[str, Any]]:
-    rasters = compute_index_rasters(bands=bands, valid_mask=valid_mask)
-    return {name: {"stats": _stats(values)} for name, values in rasters.items()}
+    return index_stats(compute_index_rasters(bands=bands, valid_mask=valid_mask))
 
 
 def compute_valid_pixel_ratio(valid_mask: np.ndarray) -> float:
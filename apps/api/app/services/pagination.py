@@ -0,0 +1,64 @@
+import base64
+import binascii
+import uuid
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+# Keyset cursors are opaque to clients: urlsafe base64 of "<iso timestamp>|<uuid>".
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode("ascii").split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def parse_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """``decode_cursor`` for request handlers: a bad cursor is a 400."""
+    try:
+        return decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+def encode_key_cursor(key: str) -> str:
+    """Cursor for lists ordered by a unique text key, e.g. feature flag names."""
+    return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def parse_key_cursor(cursor: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def next_cursor_headers(rows: Sequence[Any], limit: int) -> dict[str, str]:
+    """``X-Next-Cursor`` for a full page of rows with ``created_at``/``id`` attributes."""
+    if len(rows) < limit:
+        return {}
+    last = rows[-1]
+    return {NEXT_CURSOR_HEADER: encode_cursor(last.created_at, last.id)}
+
+
+def keyset_before(
+    created_at_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: tuple[datetime, uuid.UUID],
+) -> ColumnElement[bool]:
+    """Rows strictly after the cursor in (created_at DESC, id DESC) order."""
+    return tuple_(created_at_column, id_column) < tuple_(*cursor)
@@ -7,6 +7,7 @@ from urllib.parse import urlparse, urlunparse
 from urllib.error import URLError, HTTPError
 from urllib.request import Request, urlopen
 import json
+import time
 
 try:
     import httpx
@@ -25,6 +26,9 @@ from shapely.geometry.base import BaseGeometry
 
 from app.core.config import get_settings
 
+# Newest-first page size of Sentinel-1 RTC searches.
+SENTINEL1_SEARCH_LIMIT = 20
+
 
 @dataclass
 class SceneResult:
@@ -60,8 +64,20 @@ def scene_to_geometry(scene: SceneResult) -> BaseGeometry | None:
     return bbox_to_geometry(scene.bbox)
 
 
-def scene_field_coverage_ratio(scene: SceneResult, field_geometry: BaseGeometry) -> float:
-    if field_geometry.is_empty or field_geometry.area <= 0:
+def scene_field_coverage_ratio(
+    scene: SceneResult,
+    field_geometry: BaseGeometry,
+    field_area: float | None = None,
+) -> float:
+    """Share of ``field_geometry`` covered by the scene footprint, in [0, 1].
+
+    Callers scoring many scenes against one field should ``shapely.prepare`` the
+    field and pass its ``field_area``; the intersects/within probes then use the
+    prepared index and most scenes never reach the full intersection.
+    """
+    if field_area is None:
+        field_area = field_geometry.area
+    if field_geometry.is_empty or field_area <= 0:
         return 0.0
 
     scene_geometry = scene_to_geometry(scene)
@@ -69,6 +85,10 @@ def scene_field_coverage_ratio(scene: SceneResult, field_geometry: BaseGeometry)
         return 0.0
 
     try:
+        if not field_geometry.intersects(scene_geometry):
+            return 0.0
+        if field_geometry.within(scene_geometry):
+            return 1.0
         covered = scene_geometry.intersection(field_geometry)
     except Exception:
         return 0.0
@@ -76,13 +96,18 @@ def scene_field_coverage_ratio(scene: SceneResult, field_geometry: BaseGeometry)
     if covered.is_empty:
         return 0.0
 
-    return max(0.0, min(1.0, covered.area / field_geometry.area))
+    return max(0.0, min(1.0, covered.area / field_area))
+
+
+# Planetary Computer SAS tokens are valid for about an hour; refresh well before.
+_SAS_TOKEN_TTL_SECONDS = 45 * 60
 
 
 class PlanetaryComputerProvider:
     def __init__(self) -> None:
         self.settings = get_settings()
-        self._token_cache: dict[str, str] = {}
+        # collection id -> (token, monotonic expiry)
+        self._token_cache: dict[str, tuple[str, float]] = {}
         self.client = None
         if pystac_client is None:
             return
@@ -106,8 +131,8 @@ class PlanetaryComputerProvider:
 
     def _get_sas_token(self, collection_id: str) -> str | None:
         cached = self._token_cache.get(collection_id)
-        if cached:
-            return cached
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
 
         headers: dict[str, str] = {}
         if self.settings.pc_subscription_key:
@@ -135,7 +160,7 @@ class PlanetaryComputerProvider:
             return None
 
         normalized = token.lstrip("?")
-        self._token_cache[collection_id] = normalized
+        self._token_cache[collection_id] = (normalized, time.monotonic() + _SAS_TOKEN_TTL_SECONDS)
         return normalized
 
     def _maybe_sign_assets(self, assets: dict[str, str], collection_id: str) -> dict[str, str]:
@@ -306,7 +331,7 @@ class PlanetaryComputerProvider:
                 intersects=mapping(geometry),
                 datetime=date_range,
                 sortby=[{"field": "properties.datetime", "direction": "desc"}],
-                max_items=20,
+                max_items=SENTINEL1_SEARCH_LIMIT,
             )
             for item in search.items():
                 parsed = self._to_scene_result(item=item, fallback_collection="sentinel-1-rtc")
@@ -321,7 +346,7 @@ class PlanetaryComputerProvider:
                 "intersects": mapping(geometry),
                 "datetime": date_range,
                 "sortby": [{"field": "properties.datetime", "direction": "desc"}],
-                "limit": 20,
+                "limit": SENTINEL1_SEARCH_LIMIT,
             }
         )
         for feature in features:
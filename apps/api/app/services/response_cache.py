@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+
+import orjson
+import redis
+from fastapi import Response
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import get_settings
+
+logger = logging.getLogger("app.response_cache")
+
+CACHE_HEADER = "X-Cache"
+# Stale copies outlive fresh entries so they can be served while the DB is down.
+STALE_TTL_MULTIPLIER = 10
+
+# Keys embed a per-namespace generation counter; writers invalidate a whole
+# namespace with one INCR instead of scanning for matching keys.
+_GENERATION_KEY = "cache:gen:{namespace}"
+_ENTRY_KEY = "cache:{namespace}:{generation}:{parts}"
+# Stale copies carry the generation too, so an invalidated body is never served.
+_STALE_KEY = "cache:stale:{namespace}:{generation}:{parts}"
+# Response headers (e.g. a next-page cursor) ride in a sibling key, written
+# only when non-empty and read in the same MGET as the body.
+_HEADERS_SUFFIX = ":headers"
+
+CachedBody = bytes | tuple[bytes, Mapping[str, str]]
+
+FIELD_LIST_CACHE_NAMESPACE = "fields:list"
+FARM_LIST_CACHE_NAMESPACE = "farms:list"
+
+
+def timeseries_cache_namespace(field_id: object) -> str:
+    return f"fields:{field_id}:timeseries"
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> redis.Redis:
+    # Tight timeouts: a slow cache must never be slower than the query it saves.
+    return redis.Redis.from_url(get_settings().redis_url, socket_timeout=0.25, socket_connect_timeout=0.25)
+
+
+def scope_digest(values: Iterable[object]) -> str:
+    """Order-independent short digest, e.g. for a caller's organization ids."""
+    joined = ",".join(sorted(str(value) for value in values))
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:16]
+
+
+def invalidate(*namespaces: str) -> None:
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for namespace in namespaces:
+            pipe.incr(_GENERATION_KEY.format(namespace=namespace))
+        pipe.execute()
+    except redis.RedisError as exc:
+        logger.warning("Response cache invalidation failed namespaces=%s error=%s", namespaces, exc)
+
+
+def _json_response(body: bytes, cache_status: str, headers: Mapping[str, str] | None = None) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**(headers or {}), CACHE_HEADER: cache_status},
+    )
+
+
+def _split(produced: CachedBody) -> tuple[bytes, Mapping[str, str]]:
+    if isinstance(produced, bytes):
+        return produced, {}
+    return produced
+
+
+def _read(client: redis.Redis, key: str) -> tuple[bytes | None, Mapping[str, str] | None]:
+    body, headers = client.mget(key, key + _HEADERS_SUFFIX)
+    return body, orjson.loads(headers) if headers is not None else None
+
+
+def cached_json_response(
+    namespace: str,
+    key_parts: Iterable[object],
+    ttl_seconds: int,
+    produce: Callable[[], CachedBody],
+) -> Response:
+    """Serve ``produce()``'s JSON body from Redis for ``ttl_seconds``.
+
+    ``produce`` may return ``(body, headers)`` to cache response headers too.
+    Redis errors fall through to ``produce``. If the database is unreachable the
+    last stale copy is served with ``X-Cache: stale``.
+    """
+    parts = ":".join(str(part) for part in key_parts)
+    client = get_redis()
+
+    entry_key: str | None = None
+    stale_key: str | None = None
+    try:
+        generation = int(client.get(_GENERATION_KEY.format(namespace=namespace)) or 0)
+        entry_key = _ENTRY_KEY.format(namespace=namespace, generation=generation, parts=parts)
+        stale_key = _STALE_KEY.format(namespace=namespace, generation=generation, parts=parts)
+        cached, cached_headers = _read(client, entry_key)
+    except redis.RedisError as exc:
+        logger.warning("Response cache read failed namespace=%s error=%s", namespace, exc)
+        cached, cached_headers = None, None
+    if cached is not None:
+        return _json_response(cached, "hit", cached_headers)
+
+    try:
+        body, headers = _split(produce())
+    except OperationalError:
+        stale, stale_headers = None, None
+        if stale_key is not None:
+            try:
+                stale, stale_headers = _read(client, stale_key)
+            except redis.RedisError:
+                pass
+        if stale is None:
+            raise
+        logger.warning("Serving stale response namespace=%s parts=%s", namespace, parts)
+        return _json_response(stale, "stale", stale_headers)
+
+    if entry_key is not None and stale_key is not None:
+        try:
+            pipe = client.pipeline(transaction=False)
+            stale_ttl = ttl_seconds * STALE_TTL_MULTIPLIER
+            pipe.setex(entry_key, ttl_seconds, body)
+            pipe.setex(stale_key, stale_ttl, body)
+            if headers:
+                encoded_headers = orjson.dumps(dict(headers))
+                pipe.setex(entry_key + _HEADERS_SUFFIX, ttl_seconds, encoded_headers)
+                pipe.setex(stale_key + _HEADERS_SUFFIX, stale_ttl, encoded_headers)
+            else:
+                pipe.delete(stale_key + _HEADERS_SUFFIX)
+            pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning("Response cache write failed namespace=%s error=%s", namespace, exc)
+    return _json_response(body, "miss", headers)
@@ -0,0 +1,85 @@
+"""Redis cache of (user, organization) -> membership role.
+
+Memberships change rarely but are checked on nearly every organization-scoped
+request. Entries expire after ``ROLE_CACHE_TTL_SECONDS`` and are dropped as soon
+as a transaction touching the membership commits, so role changes apply on the
+next request.
+Only existing memberships are cached: memberships inserted through Core
+statements never reach the flush hook, so a cached "not a member" would keep
+refusing a user who was just added.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from itertools import chain
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Membership, RoleEnum
+from app.services.response_cache import get_redis
+
+logger = logging.getLogger("app.role_cache")
+
+ROLE_CACHE_TTL_SECONDS = 60
+_ROLE_KEY = "memrole:{user_id}:{org_id}"
+
+
+def _key(org_id: uuid.UUID, user_id: uuid.UUID) -> str:
+    return _ROLE_KEY.format(user_id=user_id, org_id=org_id)
+
+
+def get_cached_role(org_id: uuid.UUID, user_id: uuid.UUID) -> tuple[bool, RoleEnum | None]:
+    """``(hit, role)``; Redis errors count as a miss."""
+    try:
+        value = get_redis().get(_key(org_id, user_id))
+    except redis.RedisError as exc:
+        logger.warning("Role cache read failed error=%s", exc)
+        return False, None
+    if value is None:
+        return False, None
+    return True, RoleEnum(value.decode("ascii"))
+
+
+def cache_role(org_id: uuid.UUID, user_id: uuid.UUID, role: RoleEnum | None) -> None:
+    if role is None:
+        return
+    try:
+        get_redis().setex(_key(org_id, user_id), ROLE_CACHE_TTL_SECONDS, role.value)
+    except redis.RedisError as exc:
+        logger.warning("Role cache write failed error=%s", exc)
+
+
+def invalidate_roles(keys: list[tuple[uuid.UUID, uuid.UUID]]) -> None:
+    if not keys:
+        return
+    try:
+        get_redis().delete(*(_key(org_id, user_id) for org_id, user_id in keys))
+    except redis.RedisError as exc:
+        logger.warning("Role cache invalidation failed error=%s", exc)
+
+
+# Session.info key for (org_id, user_id) pairs whose memberships were flushed
+# in the current transaction. They are deleted only once it commits: deleting
+# on flush would let a concurrent request re-cache the still-committed old role.
+_STALE_ROLES_KEY = "stale_cached_roles"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_memberships(session: Session, _flush_context: object) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Membership):
+            session.info.setdefault(_STALE_ROLES_KEY, set()).add((obj.organization_id, obj.user_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_memberships(session: Session) -> None:
+    invalidate_roles(list(session.info.pop(_STALE_ROLES_KEY, ())))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_memberships(session: Session) -> None:
+    session.info.pop(_STALE_ROLES_KEY, None)
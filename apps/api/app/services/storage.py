@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import io
+import threading
+import time
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 
 import boto3
+import httpx
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
+from cachetools import TLRUCache
 
 from app.core.config import get_settings
 
 
+# boto3 clients are thread-safe once built, but building one from the default
+# session is not; share a single client across threads.
+@lru_cache(maxsize=1)
 def get_s3_client():
     settings = get_settings()
     return boto3.client(
@@ -21,6 +30,7 @@ def get_s3_client():
     )
 
 
+@lru_cache(maxsize=8)
 def get_s3_client_for_endpoint(endpoint_url: str):
     settings = get_settings()
     return boto3.client(
@@ -55,12 +65,72 @@ def _default_public_endpoint_url() -> str:
     return settings.s3_endpoint_url
 
 
+def _object_uri(key: str) -> str:
+    settings = get_settings()
+    endpoint = settings.s3_endpoint_url.rstrip("/") + "/"
+    return urljoin(endpoint, f"{settings.s3_bucket}/{key}")
+
+
 def upload_bytes(key: str, payload: bytes, content_type: str) -> str:
     settings = get_settings()
     s3 = get_s3_client()
     s3.put_object(Bucket=settings.s3_bucket, Key=key, Body=io.BytesIO(payload), ContentType=content_type)
-    endpoint = settings.s3_endpoint_url.rstrip("/") + "/"
-    return urljoin(endpoint, f"{settings.s3_bucket}/{key}")
+    return _object_uri(key)
+
+
+# Multipart parts for copies; only about one part per worker thread is in memory.
+_COPY_TRANSFER_CONFIG = TransferConfig(multipart_chunksize=8 * 1024 * 1024, max_concurrency=4)
+
+
+class _ResponseStream(io.RawIOBase):
+    """Read-only file object over a streamed httpx response body."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.iter_bytes(chunk_size=_COPY_TRANSFER_CONFIG.multipart_chunksize)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, b"")
+            if not self._pending:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def copy_to_object(source_uri: str, key: str, content_type: str) -> str:
+    """Copy ``source_uri`` to ``key`` without holding the whole object in memory.
+
+    Objects already in the bucket are copied server-side; anything else is
+    streamed over HTTP into a multipart upload.
+    """
+    settings = get_settings()
+    s3 = get_s3_client()
+    source_key = try_extract_bucket_key(source_uri)
+    if source_key is not None:
+        s3.copy(
+            CopySource={"Bucket": settings.s3_bucket, "Key": source_key},
+            Bucket=settings.s3_bucket,
+            Key=key,
+            ExtraArgs={"ContentType": content_type, "MetadataDirective": "REPLACE"},
+            Config=_COPY_TRANSFER_CONFIG,
+        )
+    else:
+        with httpx.stream("GET", source_uri, timeout=60.0, follow_redirects=True) as response:
+            response.raise_for_status()
+            s3.upload_fileobj(
+                io.BufferedReader(_ResponseStream(response)),
+                settings.s3_bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
+                Config=_COPY_TRANSFER_CONFIG,
+            )
+    return _object_uri(key)
 
 
 def build_object_key(prefix: str, object_id: str, extension: str) -> str:
@@ -93,16 +163,35 @@ def download_bytes(uri: str) -> bytes:
     return response["Body"].read()
 
 
+def _presigned_url_ttu(key: tuple[str, int, bool], _url: str, now: float) -> float:
+    # Reuse a signed URL for half its lifetime, so callers always receive one
+    # with at least expires_seconds / 2 of validity left.
+    return now + key[1] / 2
+
+
+_presigned_url_cache: TLRUCache = TLRUCache(maxsize=4096, ttu=_presigned_url_ttu, timer=time.monotonic)
+_presigned_url_lock = threading.Lock()
+
+
 def create_presigned_get_url(uri: str, expires_seconds: int = 900, external: bool = False) -> str:
     key = try_extract_bucket_key(uri)
     if key is None:
         return uri
 
+    cache_key = (uri, expires_seconds, external)
+    with _presigned_url_lock:
+        cached = _presigned_url_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     settings = get_settings()
     endpoint = _default_public_endpoint_url() if external else settings.s3_endpoint_url
     s3 = get_s3_client_for_endpoint(endpoint)
-    return s3.generate_presigned_url(
+    url = s3.generate_presigned_url(
         "get_object",
         Params={"Bucket": settings.s3_bucket, "Key": key},
         ExpiresIn=expires_seconds,
     )
+    with _presigned_url_lock:
+        _presigned_url_cache[cache_key] = url
+    return url
@@ -0,0 +1,51 @@
+import pytest
+import redis
+
+from app.services import response_cache, role_cache
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the caches use; TTLs are ignored."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    def mget(self, *keys: str) -> list[bytes | None]:
+        return [self.values.get(key) for key in keys]
+
+    def setex(self, key: str, _ttl: int, value: bytes | str) -> None:
+        self.values[key] = value.encode("ascii") if isinstance(value, str) else value
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def incr(self, key: str) -> None:
+        self.values[key] = str(int(self.values.get(key, 0)) + 1).encode()
+
+    def pipeline(self, transaction: bool = True) -> "FakeRedis":
+        return self
+
+    def execute(self) -> None:
+        pass
+
+
+def _use_redis(monkeypatch: pytest.MonkeyPatch, client: object) -> None:
+    # role_cache imports get_redis by name, so patch both modules.
+    monkeypatch.setattr(response_cache, "get_redis", lambda: client)
+    monkeypatch.setattr(role_cache, "get_redis", lambda: client)
+
+
+@pytest.fixture
+def unreachable_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    _use_redis(monkeypatch, redis.Redis(host="127.0.0.1", port=1, socket_timeout=0.1, socket_connect_timeout=0.1))
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    client = FakeRedis()
+    _use_redis(monkeypatch, client)
+    return client
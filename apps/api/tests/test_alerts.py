@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+from app.deps import CurrentUser
+from app.models import AlertEvent, Observation, RoleEnum
+from app.routers.alerts import clear_alerts
+from app.services.alerts import maybe_create_ndvi_drop_alerts
+
+
+class _RecordingSession:
+    def __init__(self, rows: list[tuple[uuid.UUID, float | None]]) -> None:
+        self.rows = rows
+        self.executions = 0
+        self.added: list[AlertEvent] = []
+
+    def execute(self, _stmt, _params):
+        self.executions += 1
+        return self.rows
+
+    def add(self, obj: AlertEvent) -> None:
+        self.added.append(obj)
+
+    def flush(self) -> None:
+        pass
+
+
+def _observation(field_id: uuid.UUID, ndvi_mean: float | None) -> Observation:
+    indices = {} if ndvi_mean is None else {"NDVI": {"stats": {"mean": ndvi_mean}}}
+    return Observation(id=uuid.uuid4(), field_id=field_id, indices_native=indices)
+
+
+def test_ndvi_drop_alerts_for_many_fields_use_one_query() -> None:
+    dropped, steady, short_history = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db = _RecordingSession(
+        [
+            (dropped, 0.8),
+            (dropped, None),
+            (dropped, 0.7),
+            (dropped, 0.75),
+            (steady, 0.5),
+            (steady, 0.55),
+            (steady, 0.6),
+            (short_history, 0.9),
+            (short_history, 0.9),
+        ]
+    )
+
+    maybe_create_ndvi_drop_alerts(
+        db=db,
+        organization_id=str(uuid.uuid4()),
+        observations=[_observation(dropped, 0.5), _observation(steady, 0.5), _observation(short_history, 0.1)],
+    )
+
+    assert db.executions == 1
+    assert [alert.field_id for alert in db.added] == [dropped]
+    assert round(db.added[0].metadata_json["delta"], 2) == 0.25
+
+
+class _DeleteSession:
+    def __init__(self) -> None:
+        self.statements: list[tuple[object, dict]] = []
+
+    async def execute(self, stmt, params, execution_options=None):
+        self.statements.append((stmt, params))
+        return SimpleNamespace(rowcount=0)
+
+    async def commit(self) -> None:
+        pass
+
+
+def test_clear_alerts_is_scoped_by_current_memberships_not_the_cached_snapshot() -> None:
+    user_id, snapshot_org = uuid.uuid4(), uuid.uuid4()
+    user = CurrentUser(
+        id=user_id,
+        is_active=True,
+        organization_ids=frozenset({snapshot_org}),
+        org_roles={snapshot_org: RoleEnum.ADMIN},
+        org_roles_fresh=False,
+    )
+    db = _DeleteSession()
+
+    asyncio.run(clear_alerts(field_id=uuid.uuid4(), db=db, current_user=user))
+
+    [(stmt, params)] = db.statements
+    sql = str(stmt)
+    assert params == {"user_id": user_id}
+    assert sql.count("memberships.user_id = :user_id") == 2
+    assert snapshot_org not in stmt.compile().params.values()
@@ -0,0 +1,34 @@
+import numpy as np
+
+from app.services.exports import _SINGLE_BAND_COLORS, _percentiles_hist, _stretch_channel, _valid_pixels
+
+
+def test_histogram_percentiles_match_inverted_cdf() -> None:
+    values = np.random.default_rng(7).integers(0, 12000, size=50_000).astype(np.uint16)
+
+    expected = np.percentile(values, (2, 98), method="inverted_cdf")
+
+    np.testing.assert_array_equal(_percentiles_hist(values, (0.02, 0.98)), expected)
+
+
+def test_uint16_and_float_channels_stretch_alike() -> None:
+    channel = np.random.default_rng(3).integers(200, 4000, size=(64, 64)).astype(np.uint16)
+    valid = _valid_pixels(channel, nodata=None)
+
+    from_uint16 = _stretch_channel(channel, valid)
+    from_float = _stretch_channel(channel.astype(np.float32), valid)
+
+    assert np.abs(from_uint16.astype(int) - from_float.astype(int)).max() <= 1
+
+
+def test_legacy_sentinel_nodata_is_masked() -> None:
+    raster = np.array([[-9999.0, 0.2], [np.nan, 0.4]], dtype=np.float32)
+
+    assert _valid_pixels(raster, nodata=-9999.0).tolist() == [[False, True], [False, True]]
+    assert _valid_pixels(raster, nodata=float("nan")).tolist() == [[True, True], [False, True]]
+
+
+def test_single_band_color_table_matches_ramp_endpoints() -> None:
+    assert _SINGLE_BAND_COLORS.shape == (256, 3)
+    assert _SINGLE_BAND_COLORS[0].tolist() == [90, 70, 40]
+    assert _SINGLE_BAND_COLORS[255].tolist() == [150, 240, 110]
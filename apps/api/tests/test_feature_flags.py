@@ -0,0 +1,27 @@
+import uuid
+
+from app.services.feature_flags import is_enabled
+
+
+class _FlagSession:
+    def __init__(self, rows: list[tuple[str, bool]]) -> None:
+        self.info: dict = {}
+        self.rows = rows
+        self.executions = 0
+
+    def execute(self, _stmt, _params):
+        self.executions += 1
+        return self
+
+    def all(self) -> list[tuple[str, bool]]:
+        return self.rows
+
+
+def test_organization_flags_are_loaded_once_per_session() -> None:
+    org_id = uuid.uuid4()
+    db = _FlagSession([("sr_analytics_enabled", True), ("beta_exports", False)])
+
+    assert is_enabled(db, str(org_id), "sr_analytics_enabled") is True
+    assert is_enabled(db, org_id, "beta_exports") is False
+    assert is_enabled(db, str(org_id), "unknown_flag") is False
+    assert db.executions == 1
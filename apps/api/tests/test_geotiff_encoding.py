@@ -0,0 +1,18 @@
+import numpy as np
+from rasterio.io import MemoryFile
+from rasterio.transform import from_origin
+
+from app.services.analysis import _encode_geotiff
+
+
+def test_encode_geotiff_keeps_nan_as_nodata_without_touching_input() -> None:
+    values = np.array([[np.nan, 0.5], [0.25, np.nan]], dtype=np.float32)
+    original = values.copy()
+
+    payload = _encode_geotiff(values=values, transform=from_origin(500000, 4000000, 10, 10), crs="EPSG:32631")
+
+    with MemoryFile(payload) as memfile, memfile.open() as dataset:
+        assert np.isnan(dataset.nodata)
+        np.testing.assert_array_equal(dataset.read(1), original)
+        assert dataset.read_masks(1).tolist() == [[0, 255], [255, 0]]
+    np.testing.assert_array_equal(values, original)
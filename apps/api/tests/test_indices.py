@@ -1,6 +1,12 @@
 import numpy as np
 
-from app.services.indices import available_indices_for_bands, compute_indices
+from app.services.indices import (
+    _write_reflectance,
+    available_indices_for_bands,
+    compute_index_rasters,
+    compute_indices,
+    iter_index_rasters,
+)
 
 
 def test_compute_indices_core_outputs() -> None:
@@ -25,9 +31,42 @@ def test_compute_indices_core_outputs() -> None:
     assert result["NDVI"]["stats"]["mean"] is not None
 
 
+def test_index_rasters_stay_float32() -> None:
+    bands = {name: np.full((2, 2), 1000 * (i + 1), dtype=np.uint16) for i, name in enumerate(("B02", "B03", "B04", "B05", "B08", "B11"))}
+
+    rasters = compute_index_rasters(bands=bands, valid_mask=np.ones((2, 2), dtype=bool))
+
+    assert set(rasters) == {"NDVI", "NDMI", "NDWI", "EVI", "NDRE", "SAVI"}
+    assert {values.dtype for values in rasters.values()} == {np.dtype(np.float32)}
+
+
 def test_available_indices_for_partial_band_set() -> None:
     bands = {"B02", "B03", "B04", "B08"}
     available = available_indices_for_bands(bands)
     assert "NDVI" in available
     assert "NDWI" in available
     assert "NDMI" not in available
+
+
+def test_iter_index_rasters_masks_each_raster_as_it_is_yielded() -> None:
+    bands = {
+        "B04": np.array([[4000, 4000], [4000, 0]], dtype=np.uint16),
+        "B08": np.array([[6000, 6000], [6000, 0]], dtype=np.uint16),
+    }
+    valid_mask = np.array([[True, False], [True, True]])
+
+    rasters = iter_index_rasters(bands=bands, valid_mask=valid_mask)
+    name, ndvi = next(rasters)
+
+    assert name == "NDVI"
+    np.testing.assert_allclose(ndvi[0, 0], 0.2, rtol=1e-6)
+    assert np.isnan(ndvi[0, 1]) and np.isnan(ndvi[1, 1])
+    assert [name for name, _ in rasters] == ["SAVI"]
+
+
+def test_only_bands_beyond_reflectance_range_are_scaled() -> None:
+    out = np.empty((1, 2), dtype=np.float32)
+
+    np.testing.assert_array_equal(_write_reflectance(np.array([[0, 2]], dtype=np.uint8), out), [[0.0, 2.0]])
+    np.testing.assert_allclose(_write_reflectance(np.array([[0, 5000]], dtype=np.uint16), out), [[0.0, 0.5]])
+    np.testing.assert_allclose(_write_reflectance(np.array([[np.nan, 0.4]], dtype=np.float32), out), [[np.nan, 0.4]])
@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from fastapi import HTTPException
+
+from app.services.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    encode_key_cursor,
+    next_cursor_headers,
+    parse_key_cursor,
+)
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(datetime(2026, 1, 1), uuid.uuid4())[:-4]])
+def test_decode_cursor_rejects_garbage(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_headers_only_for_full_pages() -> None:
+    rows = [SimpleNamespace(created_at=datetime(2026, 1, day, tzinfo=timezone.utc), id=uuid.uuid4()) for day in (3, 2)]
+
+    assert next_cursor_headers(rows, limit=3) == {}
+    headers = next_cursor_headers(rows, limit=2)
+    assert decode_cursor(headers[NEXT_CURSOR_HEADER]) == (rows[-1].created_at, rows[-1].id)
+
+
+def test_key_cursor_round_trip_and_rejects_garbage() -> None:
+    assert parse_key_cursor(encode_key_cursor("beta/ndvi-alerts")) == "beta/ndvi-alerts"
+    with pytest.raises(HTTPException):
+        parse_key_cursor("_w")
@@ -0,0 +1,39 @@
+from concurrent.futures import Future
+from datetime import date, datetime, timezone
+
+from app.services import analysis
+from app.services.planetary_computer import SceneResult
+
+
+def _radar_scene(day: int) -> SceneResult:
+    return SceneResult(
+        scene_id=f"S1A_TEST_{day:02d}",
+        collection="sentinel-1-rtc",
+        acquisition_date=datetime(2026, 3, day, 6, 0, tzinfo=timezone.utc),
+        cloud_cover=None,
+        assets={},
+    )
+
+
+def _prefetched(scenes: list[SceneResult]) -> Future:
+    future: Future = Future()
+    future.set_result(analysis._RadarSearch(scenes=scenes, date_from=date(2026, 2, 26), date_to=date(2026, 4, 3)))
+    return future
+
+
+def test_radar_scenes_come_from_prefetch_when_it_covers_the_window(monkeypatch) -> None:
+    monkeypatch.setattr(analysis, "search_field_imagery", lambda **_kwargs: [_radar_scene(1)])
+    prefetched = _prefetched([_radar_scene(day) for day in (28, 20, 14, 9, 2)])
+
+    scenes = analysis._radar_scenes_near(db=None, field=None, center_date=date(2026, 3, 12), prefetched=prefetched)
+
+    assert [scene.scene_id for scene in scenes] == ["S1A_TEST_14", "S1A_TEST_09"]
+
+
+def test_radar_scenes_are_searched_again_when_prefetch_page_is_truncated(monkeypatch) -> None:
+    monkeypatch.setattr(analysis, "search_field_imagery", lambda **_kwargs: [_radar_scene(1)])
+    full_page = [_radar_scene(28)] * analysis.SENTINEL1_SEARCH_LIMIT
+
+    scenes = analysis._radar_scenes_near(db=None, field=None, center_date=date(2026, 3, 3), prefetched=_prefetched(full_page))
+
+    assert [scene.scene_id for scene in scenes] == ["S1A_TEST_01"]
@@ -1,5 +1,19 @@
-from app.models import RoleEnum
+import asyncio
+import uuid
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app import deps
+from app.deps import CurrentUser, _load_user, invalidate_cached_user, require_org_role
+from app.models import Membership, RoleEnum, User
+from app.services import role_cache
 from app.services.rbac import has_minimum_role
+from tests.conftest import FakeRedis
+
+pytestmark = pytest.mark.usefixtures("unreachable_redis")
 
 
 def test_rbac_role_hierarchy() -> None:
@@ -7,3 +21,173 @@ def test_rbac_role_hierarchy() -> None:
     assert has_minimum_role(RoleEnum.ADMIN, RoleEnum.ANALYST)
     assert has_minimum_role(RoleEnum.ANALYST, RoleEnum.VIEWER)
     assert not has_minimum_role(RoleEnum.VIEWER, RoleEnum.ADMIN)
+
+
+class _CountingSession:
+    def __init__(self, role: RoleEnum | None) -> None:
+        self.info: dict = {}
+        self.role = role
+        self.executions = 0
+
+    def execute(self, _stmt, _params):
+        self.executions += 1
+        return self
+
+    def scalar_one_or_none(self) -> RoleEnum | None:
+        return self.role
+
+
+def _caller(org_roles: dict | None = None) -> CurrentUser:
+    org_roles = org_roles or {}
+    return CurrentUser(id=uuid.uuid4(), is_active=True, organization_ids=frozenset(org_roles), org_roles=org_roles)
+
+
+def test_require_org_role_memoizes_role_per_session() -> None:
+    org_id = uuid.uuid4()
+    user = _caller()
+    db = _CountingSession(RoleEnum.ANALYST)
+
+    assert require_org_role(org_id=org_id, current_user=user, db=db) is RoleEnum.ANALYST
+    assert require_org_role(org_id=org_id, current_user=user, db=db, minimum=RoleEnum.ANALYST) is RoleEnum.ANALYST
+    with pytest.raises(HTTPException):
+        require_org_role(org_id=org_id, current_user=user, db=db, minimum=RoleEnum.ADMIN)
+    assert db.executions == 1
+
+
+def test_role_lookup_falls_back_to_database_when_redis_is_down() -> None:
+    db = _CountingSession(None)
+
+    with pytest.raises(HTTPException):
+        require_org_role(org_id=uuid.uuid4(), current_user=_caller(), db=db)
+    assert db.executions == 1
+
+
+def test_require_org_role_uses_roles_loaded_with_caller() -> None:
+    org_id = uuid.uuid4()
+    db = _CountingSession(None)
+
+    assert require_org_role(org_id=org_id, current_user=_caller({org_id: RoleEnum.ADMIN}), db=db) is RoleEnum.ADMIN
+    assert db.executions == 0
+
+
+class _UserRowsSession:
+    def __init__(self, org_id: uuid.UUID, role: RoleEnum) -> None:
+        self.org_id = org_id
+        self.role = role
+
+    async def execute(self, _stmt, _params):
+        return self
+
+    def all(self) -> list[SimpleNamespace]:
+        return [SimpleNamespace(is_active=True, organization_id=self.org_id, role=self.role)]
+
+
+def test_downgraded_role_is_denied_on_next_request_despite_cached_user() -> None:
+    org_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    auth_db = _UserRowsSession(org_id, RoleEnum.ADMIN)
+    try:
+        first = asyncio.run(_load_user(auth_db, user_id))
+        assert require_org_role(org_id, first, _CountingSession(None), minimum=RoleEnum.ADMIN) is RoleEnum.ADMIN
+
+        # Downgraded to viewer; the next request is served the cached snapshot.
+        auth_db.role = RoleEnum.VIEWER
+        second = asyncio.run(_load_user(auth_db, user_id))
+        assert second.org_roles[org_id] is RoleEnum.ADMIN
+        with pytest.raises(HTTPException):
+            require_org_role(org_id, second, _CountingSession(RoleEnum.VIEWER), minimum=RoleEnum.ADMIN)
+    finally:
+        invalidate_cached_user(user_id)
+
+
+def test_new_organization_is_readable_right_after_creation(fake_redis: FakeRedis) -> None:
+    org_id = uuid.uuid4()
+    user = _caller()
+
+    # A check before the owner membership exists must not be remembered...
+    with pytest.raises(HTTPException):
+        require_org_role(org_id=org_id, current_user=user, db=_CountingSession(None))
+    assert fake_redis.values == {}
+
+    # ...so once the organization is created, the next request sees the owner role.
+    db = _CountingSession(RoleEnum.OWNER)
+    assert require_org_role(org_id=org_id, current_user=user, db=db) is RoleEnum.OWNER
+    assert db.executions == 1
+    assert list(fake_redis.values.values()) == [b"OWNER"]
+
+
+class _FlushedSession:
+    def __init__(self, dirty: list, deleted: list) -> None:
+        self.info: dict = {}
+        self.new: list = []
+        self.dirty = dirty
+        self.deleted = deleted
+
+
+def test_committed_user_and_membership_changes_drop_cached_users() -> None:
+    org_id = uuid.uuid4()
+    deactivated, removed = uuid.uuid4(), uuid.uuid4()
+    for user_id in (deactivated, removed):
+        asyncio.run(_load_user(_UserRowsSession(org_id, RoleEnum.ADMIN), user_id))
+    session = _FlushedSession(
+        dirty=[User(id=deactivated, is_active=False)],
+        deleted=[Membership(organization_id=org_id, user_id=removed, role=RoleEnum.ADMIN)],
+    )
+
+    deps._collect_flushed_users(session, None)
+    assert deactivated in deps._user_cache and removed in deps._user_cache
+    deps._invalidate_committed_users(session)
+
+    assert deactivated not in deps._user_cache
+    assert removed not in deps._user_cache
+
+
+def test_membership_role_is_uncached_on_commit_not_on_flush(fake_redis: FakeRedis) -> None:
+    org_id, user_id = uuid.uuid4(), uuid.uuid4()
+    role_cache.cache_role(org_id, user_id, RoleEnum.ADMIN)
+    downgraded = Membership(organization_id=org_id, user_id=user_id, role=RoleEnum.VIEWER)
+    session = _FlushedSession(dirty=[downgraded], deleted=[])
+
+    role_cache._collect_flushed_memberships(session, None)
+    assert role_cache.get_cached_role(org_id, user_id) == (True, RoleEnum.ADMIN)
+
+    role_cache._invalidate_committed_memberships(session)
+    assert role_cache.get_cached_role(org_id, user_id) == (False, None)
+
+
+def test_rolled_back_membership_change_keeps_cached_role(fake_redis: FakeRedis) -> None:
+    org_id, user_id = uuid.uuid4(), uuid.uuid4()
+    role_cache.cache_role(org_id, user_id, RoleEnum.ADMIN)
+    removed = Membership(organization_id=org_id, user_id=user_id, role=RoleEnum.ADMIN)
+    session = _FlushedSession(dirty=[], deleted=[removed])
+
+    role_cache._collect_flushed_memberships(session, None)
+    role_cache._forget_rolled_back_memberships(session)
+    role_cache._invalidate_committed_memberships(session)
+
+    assert role_cache.get_cached_role(org_id, user_id) == (True, RoleEnum.ADMIN)
+
+
+class _OrgIdsSession:
+    def __init__(self, org_ids: list[uuid.UUID]) -> None:
+        self.org_ids = org_ids
+        self.executions = 0
+
+    async def scalars(self, _stmt, _params):
+        self.executions += 1
+        return self
+
+    def all(self) -> list[uuid.UUID]:
+        return self.org_ids
+
+
+def test_org_scope_is_reread_for_cached_user_snapshots() -> None:
+    kept, removed = uuid.uuid4(), uuid.uuid4()
+    fresh = _caller({kept: RoleEnum.VIEWER, removed: RoleEnum.VIEWER})
+    cached = replace(fresh, org_roles_fresh=False)
+    db = _OrgIdsSession([kept])
+
+    assert asyncio.run(deps.get_user_org_ids(fresh, db)) == {kept, removed}
+    assert db.executions == 0
+    assert asyncio.run(deps.get_user_org_ids(cached, db)) == {kept}
+    assert db.executions == 1
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services import response_cache
+from tests.conftest import FakeRedis
+
+
+def test_scope_digest_ignores_order() -> None:
+    assert response_cache.scope_digest(["b", "a"]) == response_cache.scope_digest(["a", "b"])
+    assert response_cache.scope_digest(["a"]) != response_cache.scope_digest(["a", "b"])
+
+
+def test_cache_fails_open_when_redis_is_down(unreachable_redis: None) -> None:
+    response = response_cache.cached_json_response("test", ("k",), 10, lambda: b"[1]")
+
+    assert response.body == b"[1]"
+    assert response.headers[response_cache.CACHE_HEADER] == "miss"
+    response_cache.invalidate("test")
+
+
+def test_database_error_without_stale_copy_is_raised(unreachable_redis: None) -> None:
+    def failing_produce() -> bytes:
+        raise OperationalError("SELECT 1", {}, Exception("db down"))
+
+    with pytest.raises(OperationalError):
+        response_cache.cached_json_response("test", ("k",), 10, failing_produce)
+
+
+def test_produced_headers_are_returned_on_miss(unreachable_redis: None) -> None:
+    response = response_cache.cached_json_response("test", ("k",), 10, lambda: (b"[]", {"X-Next-Cursor": "abc"}))
+
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert response.headers[response_cache.CACHE_HEADER] == "miss"
+
+
+def test_stale_copy_is_not_served_after_invalidation(fake_redis: FakeRedis) -> None:
+
+    def failing_produce() -> bytes:
+        raise OperationalError("SELECT 1", {}, Exception("db down"))
+
+    response_cache.cached_json_response("test", ("k",), 10, lambda: b"[1]")
+    # Fresh entry expired: the pre-write copy is still good enough while the DB is down.
+    fake_redis.values = {key: value for key, value in fake_redis.values.items() if key.startswith("cache:stale:")}
+    stale = response_cache.cached_json_response("test", ("k",), 10, failing_produce)
+    assert stale.body == b"[1]"
+    assert stale.headers[response_cache.CACHE_HEADER] == "stale"
+
+    response_cache.invalidate("test")
+    with pytest.raises(OperationalError):
+        response_cache.cached_json_response("test", ("k",), 10, failing_produce)
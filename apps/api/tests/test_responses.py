@@ -0,0 +1,57 @@
+import uuid
+from datetime import datetime, timezone
+
+import orjson
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from app.core.responses import APIJSONResponse, ModelJSONResponse
+from app.models import AlertSeverityEnum
+from app.routers.farms import _FARM_LIST_ADAPTER
+from app.schemas import AlertResponse, FarmResponse
+
+
+def test_model_json_response_renders_constructed_models() -> None:
+    alert_id = uuid.uuid4()
+    alert = AlertResponse.model_construct(
+        id=alert_id,
+        organization_id=alert_id,
+        field_id=None,
+        severity=AlertSeverityEnum.WARN,
+        category="ndvi_drop",
+        message="NDVI dropped",
+        acknowledged_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        metadata_json={},
+    )
+
+    response = ModelJSONResponse([alert], headers={"X-Next-Cursor": "abc"})
+
+    assert response.media_type == "application/json"
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert response.body.startswith(f'[{{"id":"{alert_id}"'.encode())
+    assert b'"severity":"WARN"' in response.body
+    assert b'"acknowledged_at":"2026-03-01T00:00:00Z"' in response.body
+
+
+def test_all_endpoints_write_utc_datetimes_with_z_suffix() -> None:
+    farm = FarmResponse.model_construct(
+        id="f",
+        organization_id="o",
+        name="North",
+        description=None,
+        created_at=datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc),
+    )
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.get("/farm", response_model=FarmResponse)(lambda: farm.model_dump())
+
+    bodies = [
+        ModelJSONResponse(farm).body,
+        # Dict handlers such as create_organization and create_invite.
+        APIJSONResponse(farm.model_dump()).body,
+        _FARM_LIST_ADAPTER.dump_json([farm])[1:-1],
+        TestClient(app).get("/farm").content,
+    ]
+
+    for body in bodies:
+        assert orjson.loads(body)["created_at"] == "2026-03-01T12:30:00Z"
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 
+import shapely
 from shapely.geometry import Polygon
 
 from app.services.planetary_computer import SceneResult, scene_field_coverage_ratio, scene_to_geometry
@@ -47,3 +48,14 @@ def test_scene_field_coverage_ratio_partial() -> None:
     )
     ratio = scene_field_coverage_ratio(scene=scene, field_geometry=field)
     assert ratio == 0.5
+
+
+def test_scene_field_coverage_ratio_with_prepared_field() -> None:
+    field = Polygon([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]])
+    shapely.prepare(field)
+
+    disjoint = scene_field_coverage_ratio(scene=_scene(bbox=[5, 5, 6, 6]), field_geometry=field, field_area=field.area)
+    partial = scene_field_coverage_ratio(scene=_scene(bbox=[0.5, 0, 1.5, 1]), field_geometry=field, field_area=field.area)
+    covering = scene_field_coverage_ratio(scene=_scene(bbox=[-1, -1, 2, 2]), field_geometry=field, field_area=field.area)
+
+    assert (disjoint, partial, covering) == (0.0, 0.5, 1.0)
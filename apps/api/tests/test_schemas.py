@@ -0,0 +1,62 @@
+import uuid
+
+import orjson
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.responses import ModelJSONResponse
+from app.models import Field, RoleEnum
+from app.routers.fields import _field_response
+from app.schemas import (
+    AnalysisByDateRequest,
+    AnalysisBySceneRequest,
+    AnalysisCreateRequest,
+    FieldResponse,
+    InviteCreateRequest,
+    LoginRequest,
+)
+
+
+def test_invite_email_is_lowercased() -> None:
+    invite = InviteCreateRequest(email="Ana.Silva@Example.COM", role=RoleEnum.VIEWER)
+
+    assert invite.email == "ana.silva@example.com"
+
+
+@pytest.mark.parametrize(
+    "email",
+    ["", "no-at-sign.example.com", "two@@example.com", "space @example.com", "a@localhost", "a..b@example.com"],
+)
+def test_invite_email_rejects_implausible_addresses(email: str) -> None:
+    with pytest.raises(ValidationError):
+        InviteCreateRequest(email=email, role=RoleEnum.VIEWER)
+
+
+def test_analysis_request_variant_follows_scene_id() -> None:
+    adapter = TypeAdapter(AnalysisCreateRequest)
+
+    by_scene = adapter.validate_python({"scene_id": "S2B_MSIL2A_20260301", "date_from": "2026-02-01"})
+    by_date = adapter.validate_python({"date_from": "2026-02-01", "date_to": "2026-03-01"})
+
+    assert isinstance(by_scene, AnalysisBySceneRequest) and by_scene.scene_id == "S2B_MSIL2A_20260301"
+    assert isinstance(by_date, AnalysisByDateRequest) and by_date.scene_id is None
+
+
+def test_login_request_is_slotted_and_normalizes_email() -> None:
+    login = TypeAdapter(LoginRequest).validate_python({"email": "Ana@Example.com", "password": "x", "extra": 1})
+
+    assert login.email == "ana@example.com"
+    assert not hasattr(login, "__dict__")
+
+
+def test_field_response_omits_geometry_only_when_opted_out() -> None:
+    field = Field(id=uuid.uuid4(), farm_id=uuid.uuid4(), name="North", area_ha=1.5, metadata_json={})
+    geometry = {"type": "MultiPolygon", "coordinates": []}
+
+    with_geometry = orjson.loads(ModelJSONResponse(_field_response(field, geometry_dict=geometry)).body)
+    # The geometry column is never read on the opt-out path.
+    without_geometry = orjson.loads(ModelJSONResponse(_field_response(field, include_geometry=False)).body)
+
+    assert with_geometry["geometry"] == geometry
+    assert "geometry" not in without_geometry
+    assert "geometry" in FieldResponse.model_json_schema()["required"]
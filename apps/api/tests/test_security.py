@@ -0,0 +1,98 @@
+import asyncio
+import uuid
+
+import pytest
+
+from app.core import security
+from app.core.security import create_access_token, create_refresh_token, decode_access_token, decode_refresh_token
+from app.models import User
+from app.routers.auth import login
+from app.schemas import LoginRequest
+
+
+def test_decode_access_token_is_cached() -> None:
+    security.clear_token_caches()
+    token = create_access_token(subject="user-1")
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first["sub"] == "user-1"
+    assert second is first
+
+
+def test_decode_rejects_wrong_token_type_and_caches_nothing() -> None:
+    security.clear_token_caches()
+    refresh = create_refresh_token(subject="user-1")
+
+    with pytest.raises(ValueError):
+        decode_access_token(refresh)
+    assert len(security._access_token_cache) == 0
+    assert decode_refresh_token(refresh)["type"] == "refresh"
+
+
+def test_bcrypt_sha256_fast_path_matches_passlib() -> None:
+    fast_hash = security._bcrypt_sha256_hash("correct horse battery staple", rounds=4)
+    assert security.pwd_context.verify("correct horse battery staple", fast_hash)
+    assert security.verify_password("correct horse battery staple", fast_hash)
+    assert not security.verify_password("wrong password", fast_hash)
+
+    passlib_hash = security.pwd_context.handler("bcrypt_sha256").using(rounds=4).hash("s3cret-password")
+    assert security.verify_password("s3cret-password", passlib_hash)
+
+
+def test_verify_password_falls_back_to_passlib_for_legacy_bcrypt() -> None:
+    legacy_hash = security.pwd_context.handler("bcrypt").using(rounds=4).hash("legacy-password")
+    assert security.verify_password("legacy-password", legacy_hash)
+    assert not security.verify_password("other-password", legacy_hash)
+
+
+def test_password_needs_rehash_flags_legacy_and_low_round_hashes() -> None:
+    current_hash = security._bcrypt_sha256_hash("pw-1234567", rounds=security._BCRYPT_ROUNDS)
+    legacy_hash = security.pwd_context.handler("bcrypt").using(rounds=4).hash("pw-1234567")
+    weak_hash = security._bcrypt_sha256_hash("pw-1234567", rounds=4)
+
+    assert not security.password_needs_rehash(current_hash)
+    assert security.password_needs_rehash(legacy_hash)
+    assert security.password_needs_rehash(weak_hash)
+    assert not security.pwd_context.needs_update(legacy_hash)
+
+
+def test_token_pool_refills_and_yields_unique_url_safe_tokens() -> None:
+    pool = security._TokenPool(batch=4)
+
+    tokens = [pool.next_token() for _ in range(10)]
+
+    assert len(set(tokens)) == 10
+    assert all(len(token) == 43 and "=" not in token for token in tokens)
+
+
+class _LoginSession:
+    def __init__(self, user: User) -> None:
+        self.user = user
+        self.commits = 0
+
+    async def execute(self, _stmt, _params):
+        return self
+
+    def scalar_one_or_none(self) -> User:
+        return self.user
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+def test_login_upgrades_stale_password_hashes_only() -> None:
+    legacy_hash = security.pwd_context.handler("bcrypt").using(rounds=4).hash("legacy-password")
+    user = User(id=uuid.uuid4(), email="ana@example.com", hashed_password=legacy_hash, is_active=True)
+    db = _LoginSession(user)
+    payload = LoginRequest(email="ana@example.com", password="legacy-password")
+
+    asyncio.run(login(payload, db))
+    upgraded_hash = user.hashed_password
+    asyncio.run(login(payload, db))
+
+    assert upgraded_hash.startswith("$bcrypt-sha256$") and not security.password_needs_rehash(upgraded_hash)
+    assert security.verify_password("legacy-password", upgraded_hash)
+    assert user.hashed_password == upgraded_hash
+    assert db.commits == 1
@@ -0,0 +1,43 @@
+import io
+
+import httpx
+
+from app.core.config import get_settings
+from app.services import storage
+
+
+def _object_uri(key: str) -> str:
+    settings = get_settings()
+    return f"{settings.s3_endpoint_url.rstrip('/')}/{settings.s3_bucket}/{key}"
+
+
+def test_presigned_url_is_reused_per_uri_and_lifetime() -> None:
+    storage._presigned_url_cache.clear()
+    uri = _object_uri("layers/tile-source.tif")
+
+    first = storage.create_presigned_get_url(uri, expires_seconds=900)
+    second = storage.create_presigned_get_url(uri, expires_seconds=900)
+    longer = storage.create_presigned_get_url(uri, expires_seconds=3600)
+
+    assert second is first
+    assert longer != first
+    assert len(storage._presigned_url_cache) == 2
+
+
+def test_presigned_url_passthrough_for_foreign_uri_is_not_cached() -> None:
+    storage._presigned_url_cache.clear()
+    uri = "https://example.com/elsewhere/tile.tif"
+
+    assert storage.create_presigned_get_url(uri) == uri
+    assert len(storage._presigned_url_cache) == 0
+
+
+def test_response_stream_reads_body_across_chunk_boundaries() -> None:
+    body = bytes(range(256)) * 1000
+    response = httpx.Response(200, content=body)
+
+    stream = io.BufferedReader(storage._ResponseStream(response), buffer_size=1000)
+
+    assert stream.read(10) == body[:10]
+    assert stream.read() == body[10:]
+    assert stream.read() == b""
@@ -0,0 +1,23 @@
+import pytest
+from fastapi import HTTPException
+
+from app.routers import layers
+
+
+def test_parse_tile_coords() -> None:
+    assert layers._parse_tile_coords("12/2048/1361, 12/2049/1361") == [(12, 2048, 1361), (12, 2049, 1361)]
+
+    with pytest.raises(HTTPException):
+        layers._parse_tile_coords("12/2048")
+    with pytest.raises(HTTPException):
+        layers._parse_tile_coords(",".join(["1/0/0"] * (layers._MAX_BATCH_TILES + 1)))
+
+
+def test_multipart_body_frames_each_tile() -> None:
+    body = layers._multipart_body("b0", [("1/0/0", 200, "image/png", b"PNG"), ("1/1/0", 502, "text/plain", b"err")])
+
+    parts = body.split(b"--b0")
+    assert parts[0] == b""
+    assert parts[-1] == b"--\r\n"
+    assert b"Content-Location: 1/0/0\r\n" in parts[1] and parts[1].endswith(b"\r\n\r\nPNG\r\n")
+    assert b"X-Tile-Status: 502\r\n" in parts[2]
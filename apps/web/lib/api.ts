@@ -43,7 +43,9 @@ function buildErrorMessage(status: number, body: string): string {
   }
 }
 
-async function request<T>(path: string, options: RequestInit = {}, token?: string): Promise<T> {
+const NEXT_CURSOR_HEADER = "X-Next-Cursor";
+
+async function send(path: string, options: RequestInit = {}, token?: string): Promise<Response> {
   const headers = new Headers(options.headers);
   headers.set("Content-Type", headers.get("Content-Type") ?? "application/json");
   if (token) {
@@ -55,7 +57,26 @@ async function request<T>(path: string, options: RequestInit = {}, token?: strin
     const text = await response.text();
     throw new Error(buildErrorMessage(response.status, text));
   }
-  return (await response.json()) as T;
+  return response;
+}
+
+async function request<T>(path: string, options: RequestInit = {}, token?: string): Promise<T> {
+  return (await (await send(path, options, token)).json()) as T;
+}
+
+// List endpoints return one page per call and the next page's cursor in the
+// X-Next-Cursor header; follow it until the last page.
+async function requestAllPages<T>(path: string, token?: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const separator = path.includes("?") ? "&" : "?";
+    const pagePath = cursor ? `${path}${separator}cursor=${encodeURIComponent(cursor)}` : path;
+    const response = await send(pagePath, {}, token);
+    items.push(...((await response.json()) as T[]));
+    cursor = response.headers.get(NEXT_CURSOR_HEADER);
+  } while (cursor);
+  return items;
 }
 
 export async function registerAuth(payload: {
@@ -88,7 +109,7 @@ export async function createOrganization(payload: { name: string }, token: strin
 }
 
 export async function listFarms(token: string): Promise<FarmItem[]> {
-  return request<FarmItem[]>("/api/v1/farms", {}, token);
+  return requestAllPages<FarmItem>("/api/v1/farms", token);
 }
 
 export async function createFarm(
@@ -111,6 +132,7 @@ export interface StartAnalysisPayload {
   date_to?: string;
   max_cloud?: number;
   include_sr?: boolean;
+  include_sr_visualization?: boolean;
   include_radar_overlay?: boolean;
 }
 
@@ -172,7 +194,7 @@ export async function listFields(
   const query = new URLSearchParams();
   if (params.farm_id) query.set("farm_id", params.farm_id);
   const suffix = query.toString() ? `?${query.toString()}` : "";
-  return request<FieldSummary[]>(`/api/v1/fields${suffix}`, {}, token);
+  return requestAllPages<FieldSummary>(`/api/v1/fields${suffix}`, token);
 }
 
 export async function updateFieldSchedule(
@@ -254,7 +276,7 @@ export async function clearFieldTimeline(fieldId: string, token: string): Promis
 }
 
 export async function listAlerts(token: string): Promise<AlertItem[]> {
-  return request<AlertItem[]>("/api/v1/alerts", {}, token);
+  return requestAllPages<AlertItem>("/api/v1/alerts", token);
 }
 
 export async function clearAlerts(
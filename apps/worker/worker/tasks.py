@@ -78,6 +78,7 @@ def _should_enqueue(field: Any, now_utc: datetime) -> bool:
 def run_analysis_task(job_id: str) -> dict:
     from app.models import AnalysisJob, JobStatusEnum
     from app.services.analysis import run_analysis_job
+    from app.services.response_cache import invalidate, timeseries_cache_namespace
 
     db = _session()
     try:
@@ -86,6 +87,7 @@ def run_analysis_task(job_id: str) -> dict:
             raise RuntimeError(f"Analysis job {job_id} not found")
         result = run_analysis_job(db, job)
         db.commit()
+        invalidate(timeseries_cache_namespace(job.field_id))
         return result
     except Exception as exc:
         logger.exception("Analysis task failed", exc_info=exc)
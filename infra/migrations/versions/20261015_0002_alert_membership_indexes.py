@@ -0,0 +1,34 @@
+"""alert and membership lookup indexes
+
+Revision ID: 20261015_0002
+Revises: 20260219_0001
+Create Date: 2026-10-15 00:00:02
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261015_0002"
+down_revision = "20260219_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_memberships_user_org",
+        "memberships",
+        ["user_id", "organization_id"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_alert_events_org_created",
+        "alert_events",
+        ["organization_id", sa.text("created_at DESC")],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alert_events_org_created", table_name="alert_events", if_exists=True)
+    op.drop_index("ix_memberships_user_org", table_name="memberships", if_exists=True)
@@ -0,0 +1,24 @@
+"""enforce lowercase user emails
+
+Revision ID: 20261015_0003
+Revises: 20261015_0002
+Create Date: 2026-10-15 00:00:03
+"""
+
+from alembic import op
+
+revision = "20261015_0003"
+down_revision = "20261015_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fails on the unique index if two accounts differ only by case; those must
+    # be merged by hand before upgrading.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    op.create_check_constraint("ck_users_email_lowercase", "users", "email = lower(email)")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_users_email_lowercase", "users", type_="check")
@@ -0,0 +1,34 @@
+"""alert events keyset pagination index
+
+Revision ID: 20261015_0004
+Revises: 20261015_0003
+Create Date: 2026-10-15 00:00:04
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261015_0004"
+down_revision = "20261015_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_alert_events_org_created_id",
+        "alert_events",
+        ["organization_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_alert_events_org_created", table_name="alert_events", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_alert_events_org_created",
+        "alert_events",
+        ["organization_id", sa.text("created_at DESC")],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_alert_events_org_created_id", table_name="alert_events", if_exists=True)
@@ -0,0 +1,26 @@
+"""observations field timeline index
+
+Revision ID: 20261015_0005
+Revises: 20261015_0004
+Create Date: 2026-10-15 00:00:05
+"""
+
+from alembic import op
+
+revision = "20261015_0005"
+down_revision = "20261015_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_observations_field_observed_on",
+        "observations",
+        ["field_id", "observed_on"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_observations_field_observed_on", table_name="observations", if_exists=True)